@@ -0,0 +1,120 @@
+"""
+게스트 사용자 식별과 생성
+
+방문만 하는 게스트는 서명된 쿠키로만 식별하고(LazyGuest), 보드/포스트/댓글 작성처럼
+처음으로 데이터를 저장할 때 실제 게스트 User를 만든다.
+"""
+import secrets
+
+from django.conf import settings
+from django.contrib.auth import login, logout
+from django.contrib.auth.models import AnonymousUser, User
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from .models import GuestCounter
+
+
+GUEST_PREFIX = 'Guest_'
+
+GUEST_COOKIE_NAME = 'guest_identity'
+GUEST_COOKIE_SALT = 'accounts.guest'
+
+GUEST_COUNTER_ID = 1
+
+# 아이디가 이미 사용 중일 때 다음 번호로 다시 시도하는 최대 횟수
+GUEST_CREATE_ATTEMPTS = 10
+
+
+class LazyGuest(AnonymousUser):
+    """아직 DB에 저장되지 않은 게스트 - 화면에는 게스트로 표시되고 첫 쓰기 요청에서 User로 바뀜"""
+    is_lazy_guest = True
+    username = GUEST_PREFIX
+
+    def __init__(self, token):
+        self.token = token
+
+    def __str__(self):
+        return self.username
+
+    @property
+    def is_anonymous(self):
+        return False
+
+    @property
+    def is_authenticated(self):
+        return True
+
+
+def get_guest_token(request):
+    """요청 쿠키의 게스트 식별자 (없거나 서명이 맞지 않으면 None)"""
+    return request.get_signed_cookie(GUEST_COOKIE_NAME, default=None, salt=GUEST_COOKIE_SALT)
+
+
+def new_guest_token():
+    return secrets.token_urlsafe(12)
+
+
+def set_guest_cookie(response, token):
+    response.set_signed_cookie(
+        GUEST_COOKIE_NAME,
+        token,
+        salt=GUEST_COOKIE_SALT,
+        max_age=settings.SESSION_COOKIE_AGE,
+        secure=settings.SESSION_COOKIE_SECURE,
+        httponly=True,
+        samesite='Lax',
+    )
+
+
+def login_guest(request, user):
+    """
+    새 게스트 계정으로 로그인 - CSRF 토큰은 그대로 유지
+
+    login() 은 CSRF 토큰을 새로 발급하지만 게스트 계정은 페이지를 보던 중 첫 쓰기 요청에서 만들어지므로,
+    페이지(board_detail.js 등)가 가진 토큰으로 다음 요청도 보낼 수 있어야 한다.
+    비밀번호 없이 방금 만든 계정이라 토큰을 유지해도 탈취할 기존 권한이 없다.
+    """
+    csrf_secret = request.META.get('CSRF_COOKIE')
+    login(request, user)
+    if csrf_secret:
+        request.META['CSRF_COOKIE'] = csrf_secret
+
+
+def end_guest_login(request):
+    """
+    게스트 계정으로 로그인된 상태면 로그아웃 (로그인/회원가입 페이지 진입 시)
+
+    게스트 상태는 서명된 쿠키로만 관리하므로 세션에 별도 플래그를 쓰지 않는다.
+    """
+    if request.user.is_authenticated and request.user.username.startswith(GUEST_PREFIX):
+        logout(request)
+
+
+def next_guest_number():
+    """카운터를 1 증가시키고 새 번호 반환 - 같은 트랜잭션 안에서 읽으므로 동시 요청과 겹치지 않음"""
+    with transaction.atomic():
+        counter = GuestCounter.objects.filter(pk=GUEST_COUNTER_ID)
+        if not counter.update(value=F('value') + 1):
+            GuestCounter.objects.get_or_create(pk=GUEST_COUNTER_ID)
+            counter.update(value=F('value') + 1)
+        return counter.values_list('value', flat=True).get()
+
+
+def create_guest_user():
+    """
+    게스트 User 생성
+
+    아이디는 카운터로 발급하고(Guest_1, Guest_2 ...), 이전 방식의 무작위 아이디와 겹치면
+    다음 번호로 다시 시도한다. 로그인에 쓰지 않는 계정이므로 비밀번호 해시는 만들지 않는다.
+    """
+    for _ in range(GUEST_CREATE_ATTEMPTS):
+        user = User(username=f'{GUEST_PREFIX}{next_guest_number()}')
+        user.set_unusable_password()
+        try:
+            with transaction.atomic():
+                user.save()
+        except IntegrityError:
+            continue
+        return user
+    raise IntegrityError('게스트 아이디를 발급하지 못했습니다.')
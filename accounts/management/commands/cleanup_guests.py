@@ -1,38 +1,115 @@
-from django.core.management.base import BaseCommand
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+
 from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
 from django.utils import timezone
-from datetime import timedelta
-from collaboration.models import Board, Post
+
+from accounts.sessions import purge_expired_sessions
+from collaboration.models import Board, Comment, Post, PostReaction, PostTombstone
+from collaboration.storage import media_storage
+from forum.models import Comment as ForumComment, Post as ForumPost
+
+
+# 모델별 파일 필드 (삭제되는 행이 참조하던 파일의 참조를 해제하기 위해 사용)
+MEDIA_FIELDS = (
+    (Post, ('image', 'attached_file')),
+    (ForumPost, ('image', 'file')),
+)
+
+
+def referenced_files(queryset, field_names):
+    """쿼리셋의 행들이 참조하는 파일 이름 목록 (이미지 파생본 포함)"""
+    names = []
+    for row in queryset.values_list(*field_names, 'image_variants').iterator():
+        names.extend(name for name in row[:-1] if name)
+        variants = row[-1] or {}
+        names.extend(info['name'] for info in variants.values() if isinstance(info, dict))
+    return names
+
+
+def expired_guests(cutoff_time):
+    """cutoff_time 이전에 만들어진 게스트 계정 ('Guest_'로 시작, 가입 시각 인덱스 사용)"""
+    return User.objects.filter(
+        username__startswith='Guest_',
+        date_joined__lt=cutoff_time
+    )
 
 
 class Command(BaseCommand):
-    help = '24시간 이상 지난 게스트 계정과 관련 데이터를 삭제합니다.'
+    help = '24시간 이상 지난 게스트 계정과 관련 데이터, 만료된 세션을 정리합니다.'
 
-    def handle(self, *args, **options):
-        # 24시간 전 시간 계산
-        cutoff_time = timezone.now() - timedelta(hours=24)
-        
-        # 'Guest_'로 시작하는 게스트 계정 찾기
-        guest_users = User.objects.filter(
-            username__startswith='Guest_',
-            date_joined__lt=cutoff_time
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='삭제하지 않고 정리 대상 수만 출력합니다.'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='한 번에(한 트랜잭션에서) 삭제할 게스트 계정 수'
         )
-        
+        parser.add_argument(
+            '--hours',
+            type=int,
+            default=24,
+            help='가입 후 이 시간이 지난 게스트 계정을 삭제합니다.'
+        )
+
+    def handle(self, *args, **options):
+        self.dry_run = options['dry_run']
+        batch_size = max(options['batch_size'], 1)
+        cutoff_time = timezone.now() - timedelta(hours=options['hours'])
+
+        guest_users = expired_guests(cutoff_time)
+
+        if self.dry_run:
+            guest_ids = guest_users.values('id')
+            self.stdout.write(
+                f'[dry-run] 게스트 계정 {guest_users.count()}개, '
+                f'보드 {Board.objects.filter(creator_id__in=guest_ids).count()}개, '
+                f'포스트 {Post.objects.filter(Q(user_id__in=guest_ids) | Q(board__creator_id__in=guest_ids)).count()}개, '
+                f'게시글 {ForumPost.objects.filter(author_id__in=guest_ids).count()}개 삭제 예정'
+            )
+        else:
+            self.delete_guests(guest_users, batch_size)
+
+        self.clear_expired_sessions()
+
+    def delete_guests(self, guest_users, batch_size):
+        """게스트 계정을 batch_size개씩 집합 단위 쿼리로 삭제"""
+        started = time.monotonic()
         deleted_count = 0
-        for user in guest_users:
-            # 관련 데이터 삭제
-            # Post 삭제 (CASCADE로 자동 삭제되지만 명시적으로)
-            Post.objects.filter(user=user).delete()
-            # Board 삭제
-            Board.objects.filter(creator=user).delete()
-            # User 삭제
-            user.delete()
-            deleted_count += 1
-        
+        last_id = 0
+        while True:
+            user_ids = list(
+                guest_users.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+
+            batch_started = time.monotonic()
+            with transaction.atomic():
+                self.delete_guest_batch(user_ids)
+            deleted_count += len(user_ids)
+            elapsed = time.monotonic() - batch_started
+            self.stdout.write(
+                f'{len(user_ids)}개 삭제 ({elapsed:.2f}s, {len(user_ids) / max(elapsed, 1e-6):.0f}개/s)'
+            )
+
         if deleted_count > 0:
+            elapsed = time.monotonic() - started
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'성공적으로 {deleted_count}개의 게스트 계정을 삭제했습니다.'
+                    f'성공적으로 {deleted_count}개의 게스트 계정을 삭제했습니다. '
+                    f'({elapsed:.2f}s, {deleted_count / max(elapsed, 1e-6):.0f}개/s)'
                 )
             )
         else:
@@ -40,7 +117,63 @@ class Command(BaseCommand):
                 self.style.SUCCESS('삭제할 게스트 계정이 없습니다.')
             )
 
+    def delete_guest_batch(self, user_ids):
+        """
+        게스트 한 묶음의 데이터 삭제
+
+        게스트 보드의 포스트처럼 아무도 보고 있지 않은 데이터는 시그널 없이 DELETE 한 번으로 지우고,
+        다른 사용자 보드에 남긴 포스트만 일반 delete()로 지워 삭제 기록/실시간 알림을 남긴다.
+        """
+        board_ids = list(Board.objects.filter(creator_id__in=user_ids).values_list('id', flat=True))
+
+        # 다른 사용자의 보드에 남긴 포스트 (시그널로 파일 해제/삭제 기록 처리)
+        Post.objects.filter(user_id__in=user_ids).exclude(board_id__in=board_ids).delete()
+
+        board_posts = Post.objects.filter(board_id__in=board_ids)
+        forum_posts = ForumPost.objects.filter(author_id__in=user_ids)
+        file_names = referenced_files(board_posts, MEDIA_FIELDS[0][1]) + referenced_files(forum_posts, MEDIA_FIELDS[1][1])
 
+        # 게스트가 다른 사용자의 포스트에 누른 좋아요 - 해당 포스트의 좋아요 수에서 뺌
+        liked_counts = Counter(
+            PostReaction.objects.filter(user_id__in=user_ids, kind=PostReaction.KIND_LIKE)
+            .exclude(post__board_id__in=board_ids)
+            .values_list('post_id', flat=True)
+        )
+        post_ids_by_count = defaultdict(list)
+        for post_id, count in liked_counts.items():
+            post_ids_by_count[count].append(post_id)
+        for count, post_ids in post_ids_by_count.items():
+            Post.objects.filter(pk__in=post_ids).update(likes=Greatest(F('likes') - count, 0))
+
+        Comment.objects.filter(Q(post__board_id__in=board_ids) | Q(author_id__in=user_ids)).delete()
+        PostReaction.objects.filter(Q(post__board_id__in=board_ids) | Q(user_id__in=user_ids)).delete()
+        board_posts._raw_delete(board_posts.db)
+        PostTombstone.objects.filter(board_id__in=board_ids).delete()
+        boards = Board.objects.filter(id__in=board_ids)
+        boards._raw_delete(boards.db)
+
+        # 게스트가 다른 사용자의 글에 남긴 댓글/좋아요 - 삭제 후 해당 글의 카운터를 다시 계산
+        ForumLike = ForumPost.likes.through
+        affected_post_ids = set(
+            ForumComment.objects.filter(author_id__in=user_ids).exclude(post__author_id__in=user_ids)
+            .values_list('post_id', flat=True)
+        ) | set(
+            ForumLike.objects.filter(user_id__in=user_ids).exclude(post__author_id__in=user_ids)
+            .values_list('post_id', flat=True)
+        )
 
+        ForumComment.objects.filter(Q(post__author_id__in=user_ids) | Q(author_id__in=user_ids)).delete()
+        ForumLike.objects.filter(Q(post__author_id__in=user_ids) | Q(user_id__in=user_ids)).delete()
+        forum_posts._raw_delete(forum_posts.db)
+        ForumPost.objects.filter(pk__in=affected_post_ids).recount()
 
+        # 관련 데이터가 모두 지워졌으므로 남은 연결(그룹/권한 등)만 정리됨
+        User.objects.filter(id__in=user_ids).delete()
+        media_storage.release_many(file_names)
 
+    def clear_expired_sessions(self):
+        """만료된 세션 행을 묶음 단위로 삭제"""
+        if self.dry_run:
+            self.stdout.write(f'[dry-run] 만료된 세션 {purge_expired_sessions(dry_run=True)}개 정리 예정')
+            return
+        self.stdout.write(f'만료된 세션 {purge_expired_sessions()}개를 정리했습니다.')
@@ -0,0 +1,70 @@
+import os
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from accounts.management.commands.cleanup_guests import MEDIA_FIELDS, referenced_files
+from collaboration.models import MediaBlob
+from collaboration.storage import media_storage
+
+
+# 업로드 파일이 저장되는 미디어 하위 디렉터리
+MEDIA_DIRECTORIES = ('blobs', 'variants', 'posts', 'files', 'forum')
+
+# 업로드 중인 파일을 지우지 않도록 이 시간보다 오래된 파일만 고아 파일로 판단
+ORPHAN_GRACE_PERIOD = timedelta(hours=1)
+
+
+def orphaned_media_files(grace_period=ORPHAN_GRACE_PERIOD):
+    """어떤 행도 참조하지 않고 grace_period 보다 오래된 미디어 파일 경로 목록"""
+    referenced = set(MediaBlob.objects.values_list('name', flat=True))
+    for model, field_names in MEDIA_FIELDS:
+        referenced.update(referenced_files(model.objects.all(), field_names))
+
+    grace_cutoff = time.time() - grace_period.total_seconds()
+    orphans = []
+    for directory in MEDIA_DIRECTORIES:
+        root = os.path.join(media_storage.location, directory)
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                name = os.path.relpath(path, media_storage.location).replace(os.sep, '/')
+                if name not in referenced and os.path.getmtime(path) < grace_cutoff:
+                    orphans.append(path)
+    return orphans
+
+
+class Command(BaseCommand):
+    help = '어떤 행도 참조하지 않는 미디어 파일을 찾습니다. --delete 를 주어야 실제로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='찾은 파일을 삭제합니다 (없으면 목록과 크기만 출력).'
+        )
+        parser.add_argument(
+            '--grace-hours',
+            type=int,
+            default=1,
+            help='수정된 지 이 시간이 지나지 않은 파일은 업로드 중일 수 있으므로 제외합니다.'
+        )
+
+    def handle(self, *args, **options):
+        orphans = orphaned_media_files(timedelta(hours=max(options['grace_hours'], 0)))
+        total_size = sum(os.path.getsize(path) for path in orphans)
+
+        if not options['delete']:
+            for path in orphans:
+                self.stdout.write(os.path.relpath(path, media_storage.location))
+            self.stdout.write(
+                f'[dry-run] 고아 미디어 파일 {len(orphans)}개 ({total_size / 1024 / 1024:.1f}MB) 삭제 예정'
+            )
+            return
+
+        for path in orphans:
+            os.remove(path)
+        self.stdout.write(self.style.SUCCESS(
+            f'고아 미디어 파일 {len(orphans)}개 ({total_size / 1024 / 1024:.1f}MB)를 삭제했습니다.'
+        ))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from accounts.sessions import purge_expired_sessions
+
+
+class Command(BaseCommand):
+    help = '만료된 세션 행을 묶음 단위로 삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에(한 트랜잭션에서) 삭제할 세션 수'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='삭제하지 않고 만료된 세션 수만 출력합니다.'
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = purge_expired_sessions(dry_run=True)
+            self.stdout.write(f'[dry-run] 만료된 세션 {count}개 삭제 예정')
+            return
+        deleted = purge_expired_sessions(batch_size=max(options['batch_size'], 1))
+        self.stdout.write(self.style.SUCCESS(f'만료된 세션 {deleted}개를 삭제했습니다.'))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 05:03
+
+from django.db import migrations, models
+
+
+def create_counter(apps, schema_editor):
+    GuestCounter = apps.get_model('accounts', 'GuestCounter')
+    GuestCounter.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GuestCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.PositiveBigIntegerField(default=0, verbose_name='마지막 발급 번호')),
+            ],
+            options={
+                'verbose_name': '게스트 번호 카운터',
+                'verbose_name_plural': '게스트 번호 카운터',
+            },
+        ),
+        migrations.RunPython(create_counter, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    게스트 정리(cleanup_guests)의 가입 시각 조건용 auth_user 인덱스
+
+    auth.User 는 이 프로젝트의 모델이 아니므로 Meta.indexes 대신 SQL로 추가한다.
+    """
+
+    dependencies = [
+        ('accounts', '0001_guestcounter'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX accounts_user_joined_idx ON auth_user (date_joined)',
+            reverse_sql='DROP INDEX accounts_user_joined_idx',
+        ),
+    ]
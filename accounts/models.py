@@ -0,0 +1,13 @@
+from django.db import models
+
+
+class GuestCounter(models.Model):
+    """게스트 아이디 번호 발급용 카운터 (행 하나만 사용)"""
+    value = models.PositiveBigIntegerField(default=0, verbose_name='마지막 발급 번호')
+
+    class Meta:
+        verbose_name = '게스트 번호 카운터'
+        verbose_name_plural = '게스트 번호 카운터'
+
+    def __str__(self):
+        return f"Guest 카운터 ({self.value})"
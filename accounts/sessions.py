@@ -0,0 +1,114 @@
+"""
+세션 저장소
+
+DB 세션 앞에 캐시를 두는 write-through 세션 (django cached_db 기반).
+요청마다 세션을 읽을 때는 캐시에서 찾고, 세션이 바뀐 요청만 DB와 캐시에 함께 쓴다.
+로그아웃/세션 삭제가 모든 워커에 바로 반영되도록 여러 프로세스가 함께 쓰는 캐시(Redis 등)에서만 사용한다
+(settings 는 캐시가 프로세스별 LocMemCache 이면 DB 세션을 쓴다). 캐시 보관 시간은 SESSION_CACHE_TIMEOUT 초로 제한한다.
+"""
+import logging
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.contrib.sessions.models import Session
+from django.db import transaction
+from django.utils import timezone
+
+
+KEY_PREFIX = 'accounts.sessions'
+
+logger = logging.getLogger('django.contrib.sessions')
+
+
+def get_session_cache_timeout():
+    """세션을 캐시에 보관하는 최대 시간 (초)"""
+    return getattr(settings, 'SESSION_CACHE_TIMEOUT', 300)
+
+
+def purge_expired_sessions(batch_size=1000, dry_run=False):
+    """
+    만료된 세션 행을 batch_size개씩 나누어 삭제하고 삭제한 수 반환
+
+    한 번에 DELETE 하면 큰 테이블에서 쓰기 잠금을 오래 잡으므로 만료 시각 인덱스로
+    한 묶음씩 읽어 지운다. dry_run 이면 삭제하지 않고 대상 수만 반환한다.
+    """
+    expired = Session.objects.filter(expire_date__lt=timezone.now())
+    if dry_run:
+        return expired.count()
+
+    deleted = 0
+    while True:
+        keys = list(expired.order_by('expire_date').values_list('session_key', flat=True)[:batch_size])
+        if not keys:
+            return deleted
+        with transaction.atomic():
+            deleted += Session.objects.filter(session_key__in=keys).delete()[0]
+
+
+class SessionStore(CachedDBStore):
+    """캐시 보관 시간을 제한한 cached_db 세션"""
+
+    cache_key_prefix = KEY_PREFIX
+
+    def _cache_timeout(self, expiry_age):
+        return max(0, min(expiry_age, get_session_cache_timeout()))
+
+    def load(self):
+        try:
+            data = self._cache.get(self.cache_key)
+        except Exception:
+            # 잘못된 세션 키는 일부 캐시 백엔드에서 예외 - 새 세션으로 처리
+            data = None
+
+        if data is None:
+            s = self._get_session_from_db()
+            if s:
+                data = self.decode(s.session_data)
+                self._cache.set(
+                    self.cache_key, data, self._cache_timeout(self.get_expiry_age(expiry=s.expire_date))
+                )
+            else:
+                data = {}
+        return data
+
+    async def aload(self):
+        try:
+            data = await self._cache.aget(await self.acache_key())
+        except Exception:
+            data = None
+
+        if data is None:
+            s = await self._aget_session_from_db()
+            if s:
+                data = self.decode(s.session_data)
+                await self._cache.aset(
+                    await self.acache_key(), data,
+                    self._cache_timeout(await self.aget_expiry_age(expiry=s.expire_date))
+                )
+            else:
+                data = {}
+        return data
+
+    def save(self, must_create=False):
+        # DB에 먼저 쓰고 캐시 갱신 - 캐시 오류는 로그만 남김 (다음 읽기에서 DB로 다시 채움)
+        DBStore.save(self, must_create)
+        try:
+            self._cache.set(self.cache_key, self._session, self._cache_timeout(self.get_expiry_age()))
+        except Exception:
+            logger.exception('세션 캐시 저장 실패 (%s)', self._cache)
+
+    async def asave(self, must_create=False):
+        await DBStore.asave(self, must_create)
+        try:
+            await self._cache.aset(
+                await self.acache_key(), self._session,
+                self._cache_timeout(await self.aget_expiry_age())
+            )
+        except Exception:
+            logger.exception('세션 캐시 저장 실패 (%s)', self._cache)
+
+    @classmethod
+    def clear_expired(cls):
+        # clearsessions 명령도 묶음 단위로 삭제
+        purge_expired_sessions()
@@ -0,0 +1,270 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from collaboration.models import Board, Comment, MediaBlob, Post, PostReaction, PostTombstone
+from collaboration.storage import media_storage
+from forum.models import Post as ForumPost
+from .guests import GUEST_COOKIE_NAME, create_guest_user
+from .models import GuestCounter
+from .sessions import purge_expired_sessions
+
+
+class GuestCleanupTests(TestCase):
+    """게스트 계정 일괄 정리 명령 테스트"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.owner = User.objects.create_user(username='owner', password='pw-12345')
+        self.shared_board = Board.objects.create(title='공유 보드', creator=self.owner, is_public=True)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def _create_guest(self, index, hours_ago=48):
+        guest = User.objects.create_user(username=f'Guest_{index:06d}')
+        User.objects.filter(pk=guest.pk).update(date_joined=timezone.now() - timedelta(hours=hours_ago))
+        board = Board.objects.create(title=f'게스트 보드 {index}', creator=guest)
+        post = Post.objects.create(
+            board=board, user=guest,
+            attached_file=SimpleUploadedFile('a.txt', f'guest {index}'.encode()), attached_file_name='a.txt'
+        )
+        Comment.objects.create(post=post, author=self.owner, content='댓글')
+        forum_post = ForumPost.objects.create(title='글', content='내용', author=guest)
+        forum_post.likes.add(self.owner)
+        return guest
+
+    def test_deletes_expired_guests_in_batches(self):
+        guests = [self._create_guest(index) for index in range(3)]
+        recent = self._create_guest(99, hours_ago=1)
+        guest_post = Post.objects.create(board=self.shared_board, user=guests[0], content='게스트 메모')
+
+        guest_files = list(Post.objects.filter(user__in=guests).values_list('attached_file', flat=True))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('cleanup_guests', '--batch-size', '2', stdout=StringIO())
+
+        self.assertEqual(list(User.objects.filter(username__startswith='Guest_')), [recent])
+        self.assertEqual(Board.objects.filter(creator__username__startswith='Guest_').count(), 1)
+        self.assertEqual(ForumPost.objects.count(), 1)
+        self.assertEqual(MediaBlob.objects.count(), 1)
+        self.assertFalse(any(media_storage.exists(name) for name in guest_files if name))
+        # 다른 사용자 보드의 게스트 포스트는 삭제 기록을 남김
+        self.assertTrue(PostTombstone.objects.filter(post_id=guest_post.id).exists())
+
+    def test_guest_likes_are_removed_from_counters(self):
+        guest = self._create_guest(1)
+        post = Post.objects.create(board=self.shared_board, user=self.owner, content='메모', likes=3)
+        PostReaction.objects.create(post=post, user=guest)
+        guest_post = Post.objects.get(user=guest)
+        PostReaction.objects.create(post=guest_post, user=self.owner)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('cleanup_guests', stdout=StringIO())
+
+        post.refresh_from_db()
+        self.assertEqual(post.likes, 2)
+        self.assertFalse(PostReaction.objects.exists())
+
+    def test_dry_run_keeps_everything(self):
+        self._create_guest(1)
+        out = StringIO()
+        call_command('cleanup_guests', '--dry-run', stdout=out)
+        self.assertIn('게스트 계정 1개', out.getvalue())
+        self.assertEqual(User.objects.filter(username__startswith='Guest_').count(), 1)
+        self.assertEqual(MediaBlob.objects.count(), 1)
+
+    def test_orphaned_media_is_removed_only_on_request(self):
+        orphan = os.path.join(self.media_root, 'blobs', 'orphan.txt')
+        os.makedirs(os.path.dirname(orphan))
+        with open(orphan, 'wb') as file:
+            file.write(b'orphan')
+        old = time.time() - 7200
+        os.utime(orphan, (old, old))
+        kept = Post.objects.create(
+            board=self.shared_board, user=self.owner, attached_file=SimpleUploadedFile('b.txt', b'kept')
+        )
+
+        # 게스트 정리와 기본(dry-run) 실행은 파일을 지우지 않음
+        call_command('cleanup_guests', stdout=StringIO())
+        out = StringIO()
+        call_command('purge_orphaned_media', stdout=out)
+        self.assertIn('blobs/orphan.txt', out.getvalue())
+        self.assertTrue(os.path.exists(orphan))
+
+        call_command('purge_orphaned_media', '--delete', stdout=StringIO())
+        self.assertFalse(os.path.exists(orphan))
+        self.assertTrue(media_storage.exists(kept.attached_file.name))
+
+
+class LazyGuestTests(TestCase):
+    """게스트 지연 생성 테스트"""
+
+    def test_page_views_do_not_create_users(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('collaboration:board_list'))
+            self.client.get(reverse('collaboration:gallery'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(GUEST_COOKIE_NAME, response.cookies)
+        self.assertContains(response, '게스트 모드')
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(any(
+            query['sql'].startswith(('INSERT', 'UPDATE')) for query in queries.captured_queries
+        ))
+
+    def test_first_write_creates_guest_user(self):
+        self.client.get(reverse('collaboration:board_list'))
+        response = self.client.post(reverse('collaboration:board_create'), {'title': '게스트 보드', 'is_public': True})
+        self.assertEqual(response.status_code, 302)
+
+        guest = User.objects.get()
+        self.assertTrue(guest.username.startswith('Guest_'))
+        self.assertEqual(Board.objects.get().creator, guest)
+
+        # 이후 요청은 같은 게스트 계정으로 처리
+        self.client.post(reverse('collaboration:board_create'), {'title': '두 번째 보드'})
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_ajax_write_requires_guest_identity(self):
+        board = Board.objects.create(
+            title='보드', creator=User.objects.create_user(username='owner'), is_public=True
+        )
+        response = self.client.post(
+            reverse('collaboration:post_create'), {'board_id': board.id, 'content': '메모'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(User.objects.count(), 1)
+
+        # 게스트 식별자가 있으면 AJAX 작성 요청에서 게스트 계정 생성
+        self.client.get(reverse('collaboration:board_detail', args=[board.id]))
+        response = self.client.post(
+            reverse('collaboration:post_create'), {'board_id': board.id, 'content': '메모'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertTrue(response.json()['success'])
+        self.assertTrue(Post.objects.get().user.username.startswith('Guest_'))
+
+    def test_guest_keeps_page_csrf_token_across_writes(self):
+        board = Board.objects.create(
+            title='보드', creator=User.objects.create_user(username='owner'), is_public=True
+        )
+        client = Client(enforce_csrf_checks=True)
+        response = client.get(reverse('collaboration:board_detail', args=[board.id]))
+        token = json.loads(
+            response.content.decode().split('id="board-config" type="application/json">')[1].split('</script>')[0]
+        )['csrfToken']
+
+        # 게스트 계정이 만들어지는 첫 요청 뒤에도 페이지의 토큰으로 계속 작성
+        for content in ('첫 메모', '두 번째 메모'):
+            response = client.post(
+                reverse('collaboration:post_create'), {'board_id': board.id, 'content': content},
+                HTTP_X_REQUESTED_WITH='XMLHttpRequest', HTTP_X_CSRFTOKEN=token
+            )
+            self.assertEqual(response.status_code, 200, content)
+        self.assertEqual(Post.objects.filter(user__username__startswith='Guest_').count(), 2)
+
+    def test_guest_allocation_uses_counter_without_password_hash(self):
+        User.objects.create_user(username=f'Guest_{GuestCounter.objects.get().value + 2}')
+        first, second = create_guest_user(), create_guest_user()
+        self.assertNotEqual(first.username, second.username)
+        # 이미 있는 아이디는 건너뛰고 다음 번호 사용
+        self.assertEqual(int(second.username[len('Guest_'):]), int(first.username[len('Guest_'):]) + 2)
+        self.assertFalse(first.has_usable_password())
+        with CaptureQueriesContext(connection) as queries:
+            create_guest_user()
+        statements = [query['sql'] for query in queries.captured_queries if 'SAVEPOINT' not in query['sql']]
+        self.assertEqual(len(statements), 3)
+
+
+@override_settings(
+    SESSION_ENGINE='accounts.sessions', SESSION_CACHE_ALIAS='sessions',
+    CACHES={
+        **settings.CACHES,
+        'sessions': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'sessions'},
+    },
+)
+class SessionTests(TestCase):
+    """캐시 세션과 만료 세션 정리 테스트 (테스트는 한 프로세스이므로 메모리 캐시를 공유 캐시로 사용)"""
+
+    def setUp(self):
+        caches[settings.SESSION_CACHE_ALIAS].clear()
+
+    def _session_queries(self, queries):
+        return [query['sql'] for query in queries.captured_queries if 'django_session' in query['sql']]
+
+    def test_page_views_do_not_touch_session_table(self):
+        self.client.get(reverse('collaboration:board_list'))
+        self.client.post(reverse('collaboration:board_create'), {'title': '게스트 보드'})
+        self.assertEqual(Session.objects.count(), 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(reverse('collaboration:board_list'))
+            self.client.get(reverse('collaboration:gallery'))
+            self.client.get(reverse('forum:post_list'))
+        # 세션은 캐시에서 읽고, 바뀌지 않았으므로 저장하지 않음
+        self.assertEqual(self._session_queries(queries), [])
+
+    def test_login_page_logs_out_guest_without_session_flags(self):
+        self.client.get(reverse('collaboration:board_list'))
+        self.client.post(reverse('collaboration:board_create'), {'title': '게스트 보드'})
+
+        response = self.client.get(reverse('accounts:login'))
+        self.assertFalse(response.wsgi_request.user.is_authenticated)
+        self.assertFalse(Session.objects.exists())
+        self.assertEqual(dict(self.client.session), {})
+
+    def test_local_cache_falls_back_to_db_sessions(self):
+        # 기본 설정(프로세스별 메모리 캐시)은 다른 워커에 로그아웃이 남지 않도록 DB 세션 사용
+        if settings.CACHE_IS_LOCAL:
+            self.assertEqual(import_module('config.settings').SESSION_ENGINE, 'django.contrib.sessions.backends.db')
+        else:
+            self.assertIn('sessions', settings.CACHES)
+
+    def test_logout_clears_shared_session_cache(self):
+        user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(user)
+        session_key = self.client.session.session_key
+        self.assertIsNotNone(caches['sessions'].get(f'accounts.sessions{session_key}'))
+
+        self.client.get(reverse('accounts:logout'))
+        self.assertIsNone(caches['sessions'].get(f'accounts.sessions{session_key}'))
+        self.assertFalse(Session.objects.filter(session_key=session_key).exists())
+
+    def test_purge_deletes_only_expired_sessions_in_batches(self):
+        now = timezone.now()
+        Session.objects.bulk_create([
+            Session(session_key=f'expired{index:02d}', session_data='', expire_date=now - timedelta(days=1))
+            for index in range(5)
+        ] + [Session(session_key='active', session_data='', expire_date=now + timedelta(days=1))])
+
+        self.assertEqual(purge_expired_sessions(dry_run=True), 5)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(purge_expired_sessions(batch_size=2), 5)
+        deletes = [query for query in self._session_queries(queries) if query.startswith('DELETE')]
+        self.assertEqual(len(deletes), 3)
+        self.assertEqual(list(Session.objects.values_list('session_key', flat=True)), ['active'])
+
+        out = StringIO()
+        call_command('purge_sessions', stdout=out)
+        self.assertIn('0개', out.getvalue())
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Board, Post
+from .models import Board, Post, BackgroundTask, MediaBlob, PostReaction
 
 
 @admin.register(Board)
@@ -17,3 +17,25 @@ class PostAdmin(admin.ModelAdmin):
     search_fields = ('content', 'user__username', 'board__title')
     readonly_fields = ('created_at', 'updated_at')
 
+
+@admin.register(BackgroundTask)
+class BackgroundTaskAdmin(admin.ModelAdmin):
+    list_display = ('name', 'status', 'attempts', 'run_after', 'updated_at')
+    list_filter = ('status', 'name')
+    readonly_fields = ('created_at', 'updated_at', 'last_error')
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    list_display = ('name', 'size', 'ref_count', 'created_at')
+    search_fields = ('name',)
+    readonly_fields = ('name', 'size', 'ref_count', 'created_at')
+
+
+@admin.register(PostReaction)
+class PostReactionAdmin(admin.ModelAdmin):
+    list_display = ('post', 'user', 'kind', 'created_at')
+    list_filter = ('kind',)
+    search_fields = ('user__username',)
+    raw_id_fields = ('post', 'user')
+    readonly_fields = ('created_at',)
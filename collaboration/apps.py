@@ -1,7 +1,20 @@
-from django.apps import AppConfig
-
-
-class CollaborationConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'collaboration'
-
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_migrate
+
+
+class CollaborationConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'collaboration'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .database import configure_sqlite
+        from .search import ensure_fts_tables
+
+        # SQLite 연결마다 WAL 등 PRAGMA 적용
+        connection_created.connect(configure_sqlite, dispatch_uid='collaboration.configure_sqlite')
+
+        # 전문 검색 색인 테이블/트리거 생성 (SQLite FTS5)
+        post_migrate.connect(ensure_fts_tables, sender=self)
+
@@ -0,0 +1,224 @@
+"""
+보드/게시판 화면 벤치마크
+
+합성 데이터를 원하는 규모로 만들고(seed) 실제 URL을 Django 테스트 클라이언트로 호출해
+화면별 지연 시간(p50/p95/p99), 요청당 쿼리 수, 초당 요청 수를 잰다.
+결과는 JSON으로 저장해 커밋 간에 비교한다 (manage.py benchmark).
+"""
+import json
+import random
+import statistics
+import time
+import uuid
+
+from django.contrib.auth.models import User
+from django.test import Client
+from django.urls import reverse
+
+from forum.models import Comment as ForumComment, Post as ForumPost
+from .instrumentation import collect_metrics
+from .models import Board, Comment, Post
+
+
+# 검색 시나리오가 결과를 찾을 수 있도록 본문에 섞는 단어
+WORDS = ('보드', '협업', '아이디어', '회의', '메모', '일정', '디자인', '리뷰', '질문', '정리')
+
+DEFAULT_SCALE = {
+    'users': 20,
+    'boards': 20,
+    'posts_per_board': 20,
+    'comments_per_post': 2,
+    'forum_posts': 200,
+    'comments_per_forum_post': 5,
+}
+
+
+def _sentence(rng, length=8):
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+
+def seed(scale, rng=None):
+    """합성 데이터 생성 - 보드 포스트와 게시글은 작성자를 보드 작성자/순서대로 나눔"""
+    rng = rng or random.Random(0)
+    prefix = f'bench_{uuid.uuid4().hex[:6]}_'
+    users = User.objects.bulk_create([
+        User(username=f'{prefix}{i}', password='!') for i in range(scale['users'])
+    ])
+
+    boards = Board.objects.bulk_create([
+        Board(title=f'벤치마크 보드 {i}', creator=users[i % len(users)], is_public=i % 5 != 0)
+        for i in range(scale['boards'])
+    ])
+    posts = Post.objects.bulk_create([
+        Post(
+            board=board, user=board.creator, content=_sentence(rng),
+            color=rng.choice(Post.COLOR_CHOICES)[0],
+            position_x=rng.uniform(0, 1200), position_y=rng.uniform(0, 800)
+        )
+        for board in boards for _ in range(scale['posts_per_board'])
+    ])
+    Comment.objects.bulk_create([
+        Comment(post=post, author=rng.choice(users), content=_sentence(rng, 4))
+        for post in posts for _ in range(scale['comments_per_post'])
+    ])
+
+    forum_posts = ForumPost.objects.bulk_create([
+        ForumPost(
+            title=_sentence(rng, 3), content=_sentence(rng, 30), author=users[i % len(users)],
+            category=rng.choice(ForumPost.CATEGORY_CHOICES)[0], is_notice=i < 3
+        )
+        for i in range(scale['forum_posts'])
+    ])
+    ForumComment.objects.bulk_create([
+        ForumComment(post=post, author=rng.choice(users), content=_sentence(rng, 4))
+        for post in forum_posts for _ in range(scale['comments_per_forum_post'])
+    ])
+    ForumPost.objects.filter(pk__in=[post.pk for post in forum_posts]).recount()
+    return users
+
+
+def percentile(sorted_values, percent):
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class BenchmarkRunner:
+    """시나리오별로 요청을 반복 실행하고 결과를 모음"""
+
+    SCENARIOS = (
+        'board_list',
+        'gallery',
+        'board_detail',
+        'post_create',
+        'post_layout',
+        'post_feedback',
+        'forum_list',
+        'forum_search',
+        'forum_detail',
+        'guest_first_visit',
+        'guest_first_write',
+    )
+
+    def __init__(self, user, rng=None):
+        self.user = user
+        self.rng = rng or random.Random(1)
+        self.client = Client()
+        self.client.force_login(user)
+        self.boards = list(Board.objects.filter(creator=user).values_list('id', flat=True))
+        self.board_posts = {board_id: [] for board_id in self.boards}
+        for post_id, board_id in Post.objects.filter(board_id__in=self.boards).values_list('id', 'board_id'):
+            self.board_posts[board_id].append(post_id)
+        self.public_posts = list(Post.objects.filter(board__is_public=True).values_list('id', flat=True))
+        self.forum_posts = list(ForumPost.objects.values_list('id', flat=True))
+        self._liked = 0
+
+    def run(self, scenarios=None, requests=50, warmup=5):
+        results = {}
+        for name in scenarios or self.SCENARIOS:
+            scenario = getattr(self, f'scenario_{name}')
+            for index in range(warmup):
+                scenario(index)
+            results[name] = self.measure(scenario, requests)
+        return results
+
+    def measure(self, scenario, requests):
+        latencies = []
+        queries = []
+        errors = 0
+        started = time.perf_counter()
+        for index in range(requests):
+            request_started = time.perf_counter()
+            with collect_metrics() as metrics:
+                response = scenario(index)
+            latencies.append((time.perf_counter() - request_started) * 1000)
+            queries.append(metrics.queries)
+            if response.status_code >= 400:
+                errors += 1
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        return {
+            'requests': requests,
+            'errors': errors,
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+            'mean_ms': round(statistics.fmean(latencies), 2) if latencies else 0.0,
+            'rps': round(requests / elapsed, 1) if elapsed else 0.0,
+            'queries_mean': round(statistics.fmean(queries), 1) if queries else 0.0,
+            'queries_max': max(queries, default=0),
+        }
+
+    # 시나리오 - 각 메서드는 요청 하나를 보내고 응답을 반환
+
+    def scenario_board_list(self, index):
+        return self.client.get(reverse('collaboration:board_list'))
+
+    def scenario_gallery(self, index):
+        return self.client.get(reverse('collaboration:gallery'))
+
+    def scenario_board_detail(self, index):
+        board_id = self.boards[index % len(self.boards)]
+        return self.client.get(reverse('collaboration:board_detail', args=[board_id]))
+
+    def scenario_post_create(self, index):
+        return self.client.post(reverse('collaboration:post_create'), {
+            'board_id': self.boards[index % len(self.boards)],
+            'content': _sentence(self.rng),
+            'color': 'yellow',
+            'position_x': self.rng.uniform(0, 1200),
+            'position_y': self.rng.uniform(0, 800),
+        })
+
+    def scenario_post_layout(self, index):
+        board_id = self.boards[index % len(self.boards)]
+        changes = [
+            {'id': post_id, 'x': self.rng.uniform(0, 1200), 'y': self.rng.uniform(0, 800)}
+            for post_id in self.board_posts[board_id][:3]
+        ]
+        return self.client.post(
+            reverse('collaboration:board_layout', args=[board_id]),
+            json.dumps(changes), content_type='application/json'
+        )
+
+    def scenario_post_feedback(self, index):
+        # 같은 포스트에 다시 누르면 400이므로 매번 다른 포스트
+        post_id = self.public_posts[self._liked % len(self.public_posts)]
+        self._liked += 1
+        return self.client.post(reverse('collaboration:post_feedback', args=[post_id]), {'type': 'like'})
+
+    def scenario_forum_list(self, index):
+        return self.client.get(reverse('forum:post_list'), {'page': index % 5 + 1})
+
+    def scenario_forum_search(self, index):
+        return self.client.get(reverse('forum:post_list'), {'search': WORDS[index % len(WORDS)]})
+
+    def scenario_forum_detail(self, index):
+        post_id = self.forum_posts[index % len(self.forum_posts)]
+        return self.client.get(reverse('forum:post_detail', args=[post_id]))
+
+    def scenario_guest_first_visit(self, index):
+        # 처음 온 방문자 - 게스트 식별 쿠키 발급
+        return Client().get(reverse('collaboration:board_list'))
+
+    def scenario_guest_first_write(self, index):
+        # 게스트의 첫 쓰기 요청 - 게스트 계정 생성 후 처리 (쿠키를 받는 첫 방문 요청 시간 포함)
+        guest = Client()
+        guest.get(reverse('collaboration:board_list'))
+        post_id = self.public_posts[index % len(self.public_posts)]
+        return guest.post(reverse('collaboration:post_feedback', args=[post_id]), {'type': 'like'})
+
+
+def compare_results(previous, current):
+    """이전 결과와 비교한 시나리오별 (p95 변화율 %, 평균 쿼리 수 변화) 목록"""
+    rows = []
+    for name, result in current['results'].items():
+        before = previous.get('results', {}).get(name)
+        if not before:
+            continue
+        p95_change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100 if before['p95_ms'] else 0.0
+        rows.append((name, round(p95_change, 1), round(result['queries_mean'] - before['queries_mean'], 1)))
+    return rows
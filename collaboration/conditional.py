@@ -0,0 +1,85 @@
+"""
+조건부 GET (ETag/Last-Modified)
+
+페이지가 보여 주는 데이터의 마지막 수정 시각과 개수를 집계 쿼리 한 번으로 구해 검증값으로 쓰고,
+If-None-Match/If-Modified-Since 가 맞으면 뷰와 템플릿 렌더링 없이 304를 반환한다.
+페이지는 사용자마다 다르므로(로그인 상태, CSRF 토큰) ETag 에 사용자와 CSRF 쿠키를 함께 넣고,
+페이지가 해시 이름 정적 파일을 가리키므로 정적 파일 매니페스트 버전도 넣는다.
+브라우저가 매번 다시 확인하도록 Cache-Control: private, no-cache 를 붙인다.
+"""
+import hashlib
+import os
+from functools import lru_cache, wraps
+
+from django.apps import apps
+from django.conf import settings
+from django.middleware.csrf import get_token
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from .staticfiles import manifest_version
+
+
+CONDITIONAL_METHODS = ('GET', 'HEAD')
+
+
+@lru_cache(maxsize=None)
+def templates_version():
+    """템플릿 파일의 마지막 수정 시각 - 배포로 템플릿이 바뀌면 검증값도 바뀜 (프로세스마다 한 번 계산)"""
+    directories = [str(directory) for engine in settings.TEMPLATES for directory in engine.get('DIRS', [])]
+    directories += [os.path.join(app.path, 'templates') for app in apps.get_app_configs()]
+    latest = 0.0
+    for directory in directories:
+        for dirpath, _, filenames in os.walk(directory):
+            for filename in filenames:
+                latest = max(latest, os.path.getmtime(os.path.join(dirpath, filename)))
+    return int(latest)
+
+
+def page_etag(request, parts):
+    """페이지 검증값 재료와 사용자/CSRF 비밀값/템플릿·정적 파일 버전으로 만든 ETag"""
+    # 페이지에 들어가는 CSRF 토큰의 비밀값 - 쿠키가 없으면 이번 응답에서 발급할 값
+    get_token(request)
+    user = request.user
+    key = (
+        templates_version(), manifest_version(), user.pk, user.is_authenticated,
+        request.META.get('CSRF_COOKIE'), *parts,
+    )
+    return hashlib.md5(repr(key).encode(), usedforsecurity=False).hexdigest()
+
+
+def conditional_page(validators):
+    """
+    조건부 GET 뷰 데코레이터
+
+    validators(request, *args, **kwargs) 는 (Last-Modified 시각, ETag 재료 튜플)을 반환한다.
+    None 을 반환하면(객체 없음 등) 검증값 없이 뷰를 그대로 실행한다. GET/HEAD 요청에서만 계산하며
+    ETag 와 Last-Modified 에 같은 결과를 쓰도록 요청마다 한 번만 호출한다.
+    """
+    def decorator(view):
+        def get_validators(request, *args, **kwargs):
+            if request.method not in CONDITIONAL_METHODS:
+                return None
+            if not hasattr(request, 'page_validators'):
+                request.page_validators = validators(request, *args, **kwargs)
+            return request.page_validators
+
+        def etag(request, *args, **kwargs):
+            result = get_validators(request, *args, **kwargs)
+            return None if result is None else page_etag(request, result[1])
+
+        def last_modified(request, *args, **kwargs):
+            result = get_validators(request, *args, **kwargs)
+            return None if result is None else result[0]
+
+        conditional_view = condition(etag_func=etag, last_modified_func=last_modified)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if request.method in CONDITIONAL_METHODS and response.has_header('ETag'):
+                # 저장은 브라우저에만, 사용할 때마다 검증값으로 다시 확인
+                patch_cache_control(response, private=True, no_cache=True)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,24 @@
+"""
+SQLite 연결 설정
+
+새 연결이 만들어질 때마다 settings.SQLITE_PRAGMAS 의 PRAGMA를 적용한다 (connection_created).
+WAL 모드에서는 읽기가 쓰기를 막지 않고, synchronous=NORMAL 이면 커밋마다 fsync 하지 않으므로
+보드에서 포스트를 끌 때마다 생기는 짧은 쓰기가 잠금 대기 없이 처리된다.
+"""
+from django.conf import settings
+
+
+def sqlite_pragma_statements(pragmas=None):
+    """PRAGMA 설정을 실행할 SQL 목록으로 변환 (예: PRAGMA journal_mode = wal)"""
+    if pragmas is None:
+        pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+    return [f'PRAGMA {name} = {value}' for name, value in pragmas.items()]
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """connection_created 수신 - SQLite 연결에 PRAGMA 적용"""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for statement in sqlite_pragma_statements():
+            cursor.execute(statement)
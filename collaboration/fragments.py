@@ -0,0 +1,78 @@
+"""
+버전 기반 템플릿 조각 캐시
+
+보드 카드, 게시판 목록 행처럼 자주 그리지만 드물게 바뀌는 조각을 (종류, 객체 id, 버전)
+키로 캐시한다. 객체가 바뀌면 시그널에서 버전만 올리고, 이전 버전 조각은 지우지 않고
+캐시 만료에 맡긴다. 한 프로세스에서 올린 버전이 다른 프로세스에도 보여야 하므로
+공유 캐시에서만 켠다 (settings.FRAGMENT_CACHE_ENABLED - 프로세스별 캐시면 기본으로 꺼짐).
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+
+
+VERSION_KEY_PREFIX = 'fragment-version'
+
+
+def fragment_cache_enabled():
+    return getattr(settings, 'FRAGMENT_CACHE_ENABLED', False)
+
+
+def get_fragment_cache():
+    return caches[getattr(settings, 'FRAGMENT_CACHE_ALIAS', 'default')]
+
+
+def get_fragment_cache_timeout():
+    """조각을 캐시에 보관하는 시간 (초)"""
+    return getattr(settings, 'FRAGMENT_CACHE_TIMEOUT', 3600)
+
+
+def _version_key(kind, obj_id):
+    return f'{VERSION_KEY_PREFIX}:{kind}:{obj_id}'
+
+
+def _initial_version():
+    # 버전 키가 캐시에서 밀려나도 이전 조각의 버전과 겹치지 않도록 시각으로 시작
+    return time.time_ns()
+
+
+def _increment(key):
+    cache = get_fragment_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, _initial_version(), None)
+
+
+def bump_version(kind, obj_id):
+    """
+    객체의 조각 버전 올리기 (모델 save/delete 시그널에서 호출)
+
+    트랜잭션 안이면 커밋 후 한 번 더 올려, 커밋 전에 다른 요청이 이전 데이터로 그린 조각이
+    새 버전으로 남지 않게 한다.
+    """
+    if not fragment_cache_enabled():
+        return
+    key = _version_key(kind, obj_id)
+    _increment(key)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: _increment(key))
+
+
+def attach_versions(kind, objects):
+    """객체들에 fragment_version 속성 설정 (캐시 조회 한 번) - 평가된 목록 반환 (꺼져 있으면 버전 없음)"""
+    objects = list(objects)
+    if not fragment_cache_enabled():
+        return objects
+    cache = get_fragment_cache()
+    keys = {obj.pk: _version_key(kind, obj.pk) for obj in objects}
+    versions = cache.get_many(keys.values())
+    for obj in objects:
+        key = keys[obj.pk]
+        if key not in versions:
+            cache.add(key, _initial_version(), None)
+            versions[key] = cache.get(key)
+        obj.fragment_version = versions[key]
+    return objects
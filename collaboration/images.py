@@ -0,0 +1,155 @@
+"""
+업로드 이미지 파생본(리사이즈 버전) 생성
+
+원본 이미지를 그대로 내려보내지 않도록 용도별 크기(card/canvas/full)로 줄인
+WebP 파일을 만들고, 결과를 모델의 image_variants 필드에 기록한다.
+Pillow가 WebP를 지원하지 않으면 JPEG로 저장한다.
+"""
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+
+# 용도별 최대 너비 (원본이 더 작으면 원본 크기의 파생본까지만 생성)
+DEFAULT_IMAGE_VARIANTS = {
+    'card': 400,
+    'canvas': 800,
+    'full': 1600,
+}
+
+def get_variant_sizes():
+    return getattr(settings, 'IMAGE_VARIANTS', DEFAULT_IMAGE_VARIANTS)
+
+
+def get_variant_format():
+    """저장 형식과 확장자 - WebP 미지원 환경에서는 JPEG 사용"""
+    if features.check('webp'):
+        return 'WEBP', 'webp'
+    return 'JPEG', 'jpg'
+
+
+def _encode(image, image_format):
+    buffer = BytesIO()
+    if image_format == 'JPEG':
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.save(buffer, image_format, quality=82, optimize=True, progressive=True)
+    else:
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        image.save(buffer, image_format, quality=80, method=4)
+    return ContentFile(buffer.getvalue())
+
+
+def generate_variants(field_file):
+    """이미지 파일의 파생본을 생성하고 {'source', 'width', 용도: {'name', 'width'}} 정보 반환"""
+    storage = field_file.storage
+    image_format, extension = get_variant_format()
+
+    try:
+        with storage.open(field_file.name, 'rb') as source:
+            with Image.open(source) as opened:
+                # EXIF 회전 정보 적용 (파생본에는 EXIF를 남기지 않음)
+                image = ImageOps.exif_transpose(opened)
+                image.load()
+    except (OSError, UnidentifiedImageError):
+        return {}
+
+    variants = {'source': field_file.name, 'width': image.width}
+    for variant, max_width in sorted(get_variant_sizes().items(), key=lambda item: item[1]):
+        resized = image.copy()
+        resized.thumbnail((max_width, max_width * 10), Image.LANCZOS)
+
+        # 저장소가 내용 해시로 이름을 정하므로 확장자만 의미 있음 (이전 파생본은 delete_variants 가 해제)
+        saved_name = storage.save(f'{variant}.{extension}', _encode(resized, image_format))
+        variants[variant] = {'name': saved_name, 'width': resized.width}
+        variants['largest'] = variant
+        # 원본이 이 크기 안에 들어가면 더 큰 파생본은 필요 없음
+        if image.width <= max_width:
+            break
+    return variants
+
+
+def strip_exif(instance, field_name='image'):
+    """원본 이미지에서 EXIF(촬영 위치 등)를 제거하고 회전 정보는 픽셀에 반영 - 변경되었으면 True"""
+    field_file = getattr(instance, field_name)
+    storage = field_file.storage
+    try:
+        with storage.open(field_file.name, 'rb') as source:
+            with Image.open(source) as opened:
+                image_format = opened.format
+                if not opened.getexif() or getattr(opened, 'is_animated', False):
+                    return False
+                image = ImageOps.exif_transpose(opened)
+                image.load()
+    except (OSError, UnidentifiedImageError):
+        return False
+
+    buffer = BytesIO()
+    save_options = {'quality': 90} if image_format == 'JPEG' else {}
+    image.save(buffer, image_format, **save_options)
+
+    # 새 파일을 먼저 저장한 뒤 이전 파일 해제 (같은 파일을 쓰는 다른 포스트는 영향 없음)
+    old_name = field_file.name
+    saved_name = storage.save(old_name, ContentFile(buffer.getvalue()))
+    setattr(instance, field_name, saved_name)
+    type(instance).objects.filter(pk=instance.pk).update(**{field_name: saved_name})
+    storage.delete(old_name)
+    return True
+
+
+def delete_variants(variants, storage):
+    """파생본 파일 삭제"""
+    for variant in get_variant_sizes():
+        info = (variants or {}).get(variant)
+        if info and storage.exists(info['name']):
+            storage.delete(info['name'])
+
+
+def update_image_variants(instance, field_name='image', variants_field='image_variants'):
+    """인스턴스 이미지의 파생본을 (다시) 만들고 variants 필드만 저장"""
+    field_file = getattr(instance, field_name)
+    old_variants = getattr(instance, variants_field) or {}
+    if old_variants.get('source') == field_file.name:
+        return old_variants
+
+    delete_variants(old_variants, field_file.storage)
+    variants = generate_variants(field_file) if field_file else {}
+    setattr(instance, variants_field, variants)
+    # save()를 거치지 않아 리비전/시그널에 영향을 주지 않음
+    type(instance).objects.filter(pk=instance.pk).update(**{variants_field: variants})
+    return variants
+
+
+def variant_url(field_file, variants, variant):
+    """용도에 맞는 파생본 URL (없으면 더 큰 파생본, 그것도 없으면 원본)"""
+    if not field_file:
+        return ''
+    variants = variants or {}
+    if variants.get('source') != field_file.name:
+        return field_file.url
+
+    # 요청한 크기 이상의 파생본 중 가장 작은 것, 없으면 가장 큰 파생본
+    sizes = get_variant_sizes()
+    candidates = sorted(sizes, key=sizes.get)
+    if variant in candidates:
+        candidates = candidates[candidates.index(variant):]
+    for name in candidates + [variants.get('largest')]:
+        if name in variants:
+            return field_file.storage.url(variants[name]['name'])
+    return field_file.url
+
+
+def variant_srcset(field_file, variants):
+    """파생본들의 srcset 문자열 (예: '/media/blobs/3f/2a/3f2a....webp 400w, /media/blobs/9c/1e/9c1e....webp 800w')"""
+    variants = variants or {}
+    if not field_file or variants.get('source') != field_file.name:
+        return ''
+    entries = sorted(
+        (info['width'], field_file.storage.url(info['name']))
+        for info in variants.values()
+        if isinstance(info, dict)
+    )
+    return ', '.join(f'{url} {width}w' for width, url in entries)
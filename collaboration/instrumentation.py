@@ -0,0 +1,145 @@
+"""
+요청별 성능 계측
+
+요청 하나가 실행한 DB 쿼리 수와 SQL 시간, 템플릿 렌더링 시간, 응답 크기를 모으고,
+같은 SQL이 매개변수만 바뀌어 여러 번 실행되면 N+1 패턴으로 표시한다.
+RequestMetricsMiddleware 가 결과를 Server-Timing 헤더와 JSON 로그 한 줄로 남긴다
+(settings.REQUEST_METRICS_ENABLED 가 True 일 때만 사용).
+"""
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.backends.django import Template
+
+logger = logging.getLogger(__name__)
+
+_current_metrics = ContextVar('request_metrics', default=None)
+_original_template_render = None
+
+
+def get_n_plus_one_threshold():
+    """같은 SQL이 이 횟수 이상 다른 매개변수로 실행되면 N+1로 표시"""
+    return getattr(settings, 'REQUEST_METRICS_N_PLUS_ONE_THRESHOLD', 5)
+
+
+class RequestMetrics:
+    """요청 하나의 계측 결과"""
+
+    def __init__(self):
+        self.queries = 0
+        self.sql_time = 0.0
+        self.template_time = 0.0
+        self.response_size = None
+        self._statements = Counter()
+        self._params = defaultdict(set)
+
+    def record_query(self, sql, params, duration):
+        self.queries += 1
+        self.sql_time += duration
+        self._statements[sql] += 1
+        self._params[sql].add(repr(params))
+
+    def repeated_queries(self, threshold=None):
+        """N+1로 의심되는 SQL과 실행 횟수 목록 (많이 실행된 순)"""
+        threshold = threshold or get_n_plus_one_threshold()
+        return [
+            (sql, count) for sql, count in self._statements.most_common()
+            if count >= threshold and len(self._params[sql]) > 1
+        ]
+
+    def server_timing(self, total_time):
+        """Server-Timing 헤더 값 (밀리초)"""
+        return ', '.join([
+            f'db;dur={self.sql_time * 1000:.1f};desc="{self.queries} queries"',
+            f'tpl;dur={self.template_time * 1000:.1f}',
+            f'total;dur={total_time * 1000:.1f}',
+        ])
+
+
+def _query_recorder(metrics):
+    def record(execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.record_query(sql, params, time.perf_counter() - started)
+    return record
+
+
+def install_template_timer():
+    """템플릿 렌더링 시간 측정 설치 (한 번만) - 계측 중인 요청에서만 시간을 더함"""
+    global _original_template_render
+    if _original_template_render is not None:
+        return
+    _original_template_render = original = Template.render
+
+    def render(self, context=None, request=None):
+        metrics = _current_metrics.get()
+        if metrics is None:
+            return original(self, context, request)
+        started = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+
+    Template.render = render
+
+
+@contextmanager
+def collect_metrics():
+    """with 블록 안에서 실행된 쿼리와 템플릿 렌더링을 RequestMetrics 로 수집"""
+    install_template_timer()
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(_query_recorder(metrics)))
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+class RequestMetricsMiddleware:
+    """요청별 쿼리/SQL 시간/템플릿 시간/응답 크기를 Server-Timing 헤더와 로그로 남기는 미들웨어"""
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        with collect_metrics() as metrics:
+            response = self.get_response(request)
+        total_time = time.perf_counter() - started
+
+        if not response.streaming:
+            metrics.response_size = len(response.content)
+        response['Server-Timing'] = metrics.server_timing(total_time)
+
+        repeated = metrics.repeated_queries()
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'total_ms': round(total_time * 1000, 1),
+            'queries': metrics.queries,
+            'sql_ms': round(metrics.sql_time * 1000, 1),
+            'template_ms': round(metrics.template_time * 1000, 1),
+            'response_bytes': metrics.response_size,
+            'n_plus_one': [{'sql': sql[:200], 'count': count} for sql, count in repeated],
+        }
+        logger.log(
+            logging.WARNING if repeated else logging.INFO,
+            'request_metrics %s', json.dumps(record, ensure_ascii=False)
+        )
+        return response
@@ -0,0 +1,99 @@
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings, setup_databases, teardown_databases
+from django.utils import timezone
+
+from collaboration.benchmark import DEFAULT_SCALE, BenchmarkRunner, compare_results, seed
+
+
+class Command(BaseCommand):
+    help = (
+        '임시 데이터베이스에 합성 데이터를 만들고 보드/게시판 화면을 반복 호출해 '
+        '지연 시간(p50/p95/p99), 요청당 쿼리 수, 초당 요청 수를 JSON으로 저장합니다.'
+    )
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_SCALE.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default, dest=name)
+        parser.add_argument('--requests', type=int, default=50, help='시나리오마다 측정할 요청 수')
+        parser.add_argument('--warmup', type=int, default=5, help='측정 전에 버리는 요청 수')
+        parser.add_argument(
+            '--scenario',
+            action='append',
+            choices=BenchmarkRunner.SCENARIOS,
+            help='실행할 시나리오 (지정하지 않으면 모두 실행)'
+        )
+        parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmark-results/<시각>-<커밋>.json)')
+        parser.add_argument('--compare', help='비교할 이전 결과 JSON 경로')
+
+    def handle(self, *args, **options):
+        previous = None
+        if options['compare']:
+            try:
+                previous = json.loads(Path(options['compare']).read_text(encoding='utf-8'))
+            except (OSError, ValueError) as e:
+                raise CommandError(f'비교할 결과를 읽을 수 없습니다: {e}')
+
+        scale = {name: options[name] for name in DEFAULT_SCALE}
+        with tempfile.TemporaryDirectory() as directory:
+            # SQLite는 메모리 DB 대신 파일 DB로 측정 (운영과 같은 저널/잠금 동작)
+            if connection.vendor == 'sqlite':
+                connection.settings_dict['TEST']['NAME'] = os.path.join(directory, 'benchmark.sqlite3')
+            old_config = setup_databases(verbosity=0, interactive=False)
+            try:
+                with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                    self.stdout.write(f'데이터 생성 중: {scale}')
+                    users = seed(scale)
+                    runner = BenchmarkRunner(users[0])
+                    results = runner.run(options['scenario'], options['requests'], options['warmup'])
+            finally:
+                teardown_databases(old_config, verbosity=0)
+
+        report = {
+            'created_at': timezone.now().isoformat(),
+            'commit': self.git_commit(),
+            'database': connection.vendor,
+            'scale': scale,
+            'results': results,
+        }
+        self.print_results(results)
+        path = Path(options['output'] or self.default_output(report))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        self.stdout.write(self.style.SUCCESS(f'결과 저장: {path}'))
+
+        if previous:
+            self.stdout.write(f"비교 대상: {previous.get('commit') or options['compare']}")
+            for name, p95_change, query_change in compare_results(previous, report):
+                line = f'{name:20s} p95 {p95_change:+.1f}%  쿼리 {query_change:+.1f}'
+                self.stdout.write(self.style.WARNING(line) if p95_change > 20 or query_change > 0 else line)
+
+    def print_results(self, results):
+        self.stdout.write(
+            f"{'시나리오':20s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'req/s':>8s} {'쿼리':>6s} {'오류':>4s}"
+        )
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:20s} {result['p50_ms']:8.2f} {result['p95_ms']:8.2f} {result['p99_ms']:8.2f} "
+                f"{result['rps']:8.1f} {result['queries_mean']:6.1f} {result['errors']:4d}"
+            )
+
+    def default_output(self, report):
+        stamp = timezone.localtime().strftime('%Y%m%d-%H%M%S')
+        return settings.BASE_DIR / 'benchmark-results' / f"{stamp}-{(report['commit'] or 'unknown')[:8]}.json"
+
+    def git_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
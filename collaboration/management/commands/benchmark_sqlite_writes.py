@@ -0,0 +1,137 @@
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from collaboration.database import sqlite_pragma_statements
+
+
+# 비교할 설정: (이름, 트랜잭션 시작 방식, PRAGMA)
+# default 는 설정 변경 전(롤백 저널, 지연 트랜잭션, Python sqlite3 기본 대기 5초)과 같음
+PROFILES = {
+    'default': ('DEFERRED', {'journal_mode': 'delete', 'synchronous': 'full', 'busy_timeout': 5000}),
+    'tuned': ('IMMEDIATE', None),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        '임시 SQLite 파일에서 보드 레이아웃 저장과 같은 형태의 동시 쓰기를 실행해 '
+        '기본 설정과 SQLITE_PRAGMAS 설정의 쓰기 처리량을 비교합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--writers', type=int, default=8, help='동시에 쓰는 스레드 수')
+        parser.add_argument('--readers', type=int, default=4, help='변경 사항을 조회하는 스레드 수')
+        parser.add_argument('--seconds', type=float, default=5.0, help='설정마다 실행할 시간(초)')
+        parser.add_argument('--posts', type=int, default=200, help='보드에 만들 포스트 수')
+        parser.add_argument(
+            '--profile',
+            choices=sorted(PROFILES),
+            action='append',
+            help='실행할 설정 (지정하지 않으면 모두 실행)'
+        )
+
+    def handle(self, *args, **options):
+        for name in options['profile'] or list(PROFILES):
+            transaction_mode, pragmas = PROFILES[name]
+            if pragmas is None:
+                pragmas = getattr(settings, 'SQLITE_PRAGMAS', {})
+            result = self.run_profile(transaction_mode, pragmas, options)
+            self.stdout.write(
+                f"{name:8s} 쓰기 {result['commits']}회 ({result['commits'] / options['seconds']:.0f}회/s), "
+                f"잠금 실패 {result['locked']}회, 쓰기 p95 {result['p95_ms']:.1f}ms, "
+                f"읽기 {result['reads']}회"
+            )
+
+    def run_profile(self, transaction_mode, pragmas, options):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bench.sqlite3')
+            setup = self.connect(path, pragmas)
+            setup.executescript(
+                'CREATE TABLE board (id INTEGER PRIMARY KEY, revision INTEGER NOT NULL DEFAULT 0);'
+                'CREATE TABLE post (id INTEGER PRIMARY KEY, board_id INTEGER NOT NULL, '
+                'x REAL, y REAL, revision INTEGER NOT NULL DEFAULT 0);'
+                'CREATE INDEX post_board_rev ON post (board_id, revision);'
+                'INSERT INTO board (id) VALUES (1);'
+            )
+            setup.executemany(
+                'INSERT INTO post (board_id, x, y) VALUES (1, 0, 0)',
+                [()] * options['posts']
+            )
+            setup.close()
+
+            deadline = time.monotonic() + options['seconds']
+            lock = threading.Lock()
+            result = {'commits': 0, 'locked': 0, 'reads': 0, 'latencies': []}
+
+            def writer():
+                conn = self.connect(path, pragmas)
+                while time.monotonic() < deadline:
+                    post_id = random.randint(1, options['posts'])
+                    started = time.monotonic()
+                    try:
+                        # board_layout 뷰와 같은 순서: 포스트 조회 -> 리비전 증가 -> 위치 저장
+                        conn.execute(f'BEGIN {transaction_mode}')
+                        conn.execute('SELECT id FROM post WHERE board_id = 1 AND id = ?', [post_id]).fetchall()
+                        conn.execute('UPDATE board SET revision = revision + 1 WHERE id = 1')
+                        revision = conn.execute('SELECT revision FROM board WHERE id = 1').fetchone()[0]
+                        conn.execute(
+                            'UPDATE post SET x = ?, y = ?, revision = ? WHERE id = ?',
+                            [random.random() * 1000, random.random() * 1000, revision, post_id]
+                        )
+                        conn.execute('COMMIT')
+                    except sqlite3.OperationalError:
+                        if conn.in_transaction:
+                            conn.execute('ROLLBACK')
+                        with lock:
+                            result['locked'] += 1
+                        continue
+                    with lock:
+                        result['commits'] += 1
+                        result['latencies'].append(time.monotonic() - started)
+                conn.close()
+
+            def reader():
+                conn = self.connect(path, pragmas)
+                revision = 0
+                while time.monotonic() < deadline:
+                    try:
+                        # board_changes 폴링과 같은 조회
+                        rows = conn.execute(
+                            'SELECT id, x, y, revision FROM post WHERE board_id = 1 AND revision > ?',
+                            [revision]
+                        ).fetchall()
+                    except sqlite3.OperationalError:
+                        continue
+                    revision = max([revision] + [row[3] for row in rows])
+                    with lock:
+                        result['reads'] += 1
+                conn.close()
+
+            threads = (
+                [threading.Thread(target=writer) for _ in range(options['writers'])]
+                + [threading.Thread(target=reader) for _ in range(options['readers'])]
+            )
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        latencies = result.pop('latencies')
+        result['p95_ms'] = (
+            statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) >= 2 else 0.0
+        )
+        return result
+
+    def connect(self, path, pragmas):
+        conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        for statement in sqlite_pragma_statements(pragmas):
+            conn.execute(statement)
+        return conn
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from collaboration.images import update_image_variants
+from collaboration.models import Post
+from collaboration.storage import BLOB_DIRECTORY
+from forum.models import Post as ForumPost
+
+
+# 내용 주소 저장소를 사용하는 모델별 파일 필드
+MEDIA_FIELDS = (
+    (Post, ('image', 'attached_file')),
+    (ForumPost, ('image', 'file')),
+)
+
+
+class Command(BaseCommand):
+    help = '해시 저장 이전에 업로드된 파일을 내용 주소 저장소로 옮겨 중복 파일을 합칩니다.'
+
+    def handle(self, *args, **options):
+        moved = 0
+        for model, field_names in MEDIA_FIELDS:
+            for field_name in field_names:
+                storage = model._meta.get_field(field_name).storage
+                legacy = model.objects.exclude(**{field_name: ''}).exclude(
+                    **{f'{field_name}__isnull': True}
+                ).exclude(**{f'{field_name}__startswith': f'{BLOB_DIRECTORY}/'})
+
+                for pk, name in legacy.values_list('pk', field_name).iterator():
+                    if not storage.exists(name):
+                        self.stdout.write(self.style.WARNING(f'파일이 없습니다: {name}'))
+                        continue
+                    with storage.open(name, 'rb') as source:
+                        new_name = storage.save(name, source)
+                    model.objects.filter(pk=pk).update(**{field_name: new_name})
+                    storage.delete(name)
+                    moved += 1
+
+                    # 원본 경로가 바뀌었으므로 이미지 파생본도 다시 생성
+                    if field_name == 'image':
+                        update_image_variants(model.objects.get(pk=pk))
+
+        self.stdout.write(self.style.SUCCESS(f'{moved}개 파일을 옮겼습니다.'))
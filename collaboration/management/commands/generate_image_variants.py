@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from collaboration.images import delete_variants, update_image_variants
+from collaboration.models import Post
+from forum.models import Post as ForumPost
+
+
+class Command(BaseCommand):
+    help = '기존 업로드 이미지의 파생본(썸네일/캔버스/원본 크기)을 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='이미 파생본이 있는 이미지도 다시 생성합니다.'
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        for model in (Post, ForumPost):
+            posts = model.objects.exclude(image='').exclude(image__isnull=True).only('id', 'image', 'image_variants')
+            count = 0
+            for post in posts.iterator():
+                if options['force']:
+                    delete_variants(post.image_variants, post.image.storage)
+                    post.image_variants = {}
+                elif post.image_variants.get('source') == post.image.name:
+                    continue
+                if update_image_variants(post):
+                    count += 1
+                else:
+                    self.stdout.write(self.style.WARNING(f'이미지를 읽을 수 없습니다: {post.image.name}'))
+            self.stdout.write(f'{model._meta.label}: {count}개 이미지 처리')
+            total += count
+
+        self.stdout.write(self.style.SUCCESS(f'총 {total}개 이미지의 파생본을 생성했습니다.'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from collaboration.search import ensure_fts_tables, rebuild_fts_tables
+
+
+class Command(BaseCommand):
+    help = '전문 검색 색인(SQLite FTS5)을 원본 테이블 기준으로 다시 생성합니다.'
+
+    def handle(self, *args, **options):
+        ensure_fts_tables()
+        if rebuild_fts_tables():
+            self.stdout.write(self.style.SUCCESS('검색 색인을 다시 생성했습니다.'))
+        else:
+            self.stdout.write(self.style.WARNING('현재 데이터베이스는 FTS5 검색을 지원하지 않습니다.'))
@@ -0,0 +1,48 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from collaboration.tasks import claim_next_task, run_task
+
+
+class Command(BaseCommand):
+    help = '백그라운드 작업 대기열(이미지 후처리 등)을 처리합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='대기 중인 작업을 모두 처리한 뒤 종료합니다.'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=1.0,
+            help='대기열이 비어 있을 때 다시 확인하기까지 기다리는 시간(초)'
+        )
+
+    def handle(self, *args, **options):
+        processed = failed = 0
+        self.stdout.write('워커를 시작합니다.')
+        try:
+            while True:
+                background_task = claim_next_task()
+                if background_task is None:
+                    if options['once']:
+                        break
+                    time.sleep(options['sleep'])
+                    continue
+
+                started = time.monotonic()
+                if run_task(background_task):
+                    processed += 1
+                else:
+                    failed += 1
+                self.stdout.write(
+                    f'{background_task.name} #{background_task.id}: '
+                    f'{background_task.get_status_display()} ({time.monotonic() - started:.2f}s)'
+                )
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'처리 {processed}개, 실패 {failed}개'))
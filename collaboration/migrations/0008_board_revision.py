@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0007_post_dislikes_post_likes_comment'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('board_id', models.BigIntegerField(verbose_name='보드 ID')),
+                ('post_id', models.BigIntegerField(verbose_name='포스트 ID')),
+                ('revision', models.PositiveBigIntegerField(verbose_name='리비전')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, verbose_name='삭제일')),
+            ],
+            options={
+                'verbose_name': '삭제된 포스트',
+                'verbose_name_plural': '삭제된 포스트들',
+            },
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='리비전'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0, verbose_name='리비전'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', 'revision'], name='collab_post_board_rev_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='posttombstone',
+            index=models.Index(fields=['board_id', 'revision'], name='collab_tomb_board_rev_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0008_board_revision'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='height',
+            field=models.FloatField(blank=True, null=True, verbose_name='높이'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='rotation',
+            field=models.FloatField(default=0.0, verbose_name='회전 각도'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='width',
+            field=models.FloatField(blank=True, null=True, verbose_name='너비'),
+        ),
+    ]
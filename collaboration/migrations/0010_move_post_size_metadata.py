@@ -0,0 +1,43 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:47
+
+import json
+
+from django.db import migrations
+
+
+def move_metadata_to_columns(apps, schema_editor):
+    """content에 JSON으로 저장된 크기 정보를 width/height 컬럼으로 이동"""
+    Post = apps.get_model('collaboration', 'Post')
+    posts = Post.objects.filter(content__startswith='{', content__contains='metadata')
+    for post in posts.iterator():
+        try:
+            data = json.loads(post.content)
+        except ValueError:
+            continue
+        if not isinstance(data, dict) or set(data) != {'metadata'}:
+            continue
+        metadata = data['metadata'] if isinstance(data['metadata'], dict) else {}
+        post.width = metadata.get('width')
+        post.height = metadata.get('height')
+        post.content = ''
+        post.save(update_fields=['width', 'height', 'content'])
+
+
+def move_columns_to_metadata(apps, schema_editor):
+    """되돌리기 - 텍스트가 없는 포스트의 크기 정보를 다시 content에 저장"""
+    Post = apps.get_model('collaboration', 'Post')
+    posts = Post.objects.filter(content='', width__isnull=False, height__isnull=False)
+    for post in posts.iterator():
+        post.content = json.dumps({'metadata': {'width': post.width, 'height': post.height}})
+        post.save(update_fields=['content'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0009_post_size_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_metadata_to_columns, move_columns_to_metadata),
+    ]
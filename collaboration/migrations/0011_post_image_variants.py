@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0010_move_post_size_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='이미지 파생본'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:51
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0011_post_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackgroundTask',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200, verbose_name='작업 이름')),
+                ('kwargs', models.JSONField(blank=True, default=dict, verbose_name='인자')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10, verbose_name='상태')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now, verbose_name='실행 가능 시각')),
+                ('last_error', models.TextField(blank=True, verbose_name='마지막 오류')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '백그라운드 작업',
+                'verbose_name_plural': '백그라운드 작업들',
+                'ordering': ['run_after', 'id'],
+                'indexes': [models.Index(fields=['status', 'run_after'], name='collab_task_status_run_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:55
+
+import os
+
+import collaboration.storage
+from django.db import migrations, models
+
+
+def fill_file_names(apps, schema_editor):
+    """기존 첨부 파일의 원래 이름을 저장 경로에서 채움"""
+    Post = apps.get_model('collaboration', 'Post')
+    posts = Post.objects.exclude(attached_file='').exclude(attached_file__isnull=True)
+    for post in posts.iterator():
+        post.attached_file_name = os.path.basename(post.attached_file.name)
+        post.save(update_fields=['attached_file_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0012_backgroundtask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='저장 경로')),
+                ('size', models.PositiveBigIntegerField(default=0, verbose_name='크기')),
+                ('ref_count', models.PositiveIntegerField(default=0, verbose_name='참조 수')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '미디어 파일',
+                'verbose_name_plural': '미디어 파일들',
+            },
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='attached_file_name',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='첨부 파일 원래 이름'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='attached_file',
+            field=models.FileField(blank=True, null=True, storage=collaboration.storage.ContentAddressedStorage(), upload_to='files/', verbose_name='첨부 파일'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=collaboration.storage.ContentAddressedStorage(), upload_to='posts/', verbose_name='이미지'),
+        ),
+        migrations.RunPython(fill_file_names, migrations.RunPython.noop),
+    ]
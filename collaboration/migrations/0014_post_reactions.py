@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-18 05:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0013_media_blobs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostReaction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('like', '좋아요')], default='like', max_length=10, verbose_name='종류')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='반응일')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reactions', to='collaboration.post')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='post_reactions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': '포스트 반응',
+                'verbose_name_plural': '포스트 반응들',
+                'constraints': [models.UniqueConstraint(fields=('user', 'post', 'kind'), name='unique_post_reaction')],
+            },
+        ),
+    ]
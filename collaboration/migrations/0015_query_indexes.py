@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-18 05:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('collaboration', '0014_post_reactions'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['-created_at'], name='collab_board_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['is_public', '-created_at'], name='collab_board_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='board',
+            index=models.Index(fields=['creator', '-created_at'], name='collab_board_creator_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', '-created_at'], name='collab_comment_post_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['board', '-created_at'], name='collab_post_board_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-created_at', '-id'], name='collab_post_created_idx'),
+        ),
+    ]
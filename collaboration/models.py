@@ -1,7 +1,102 @@
-from django.db import models
+from django.db import connections, models, transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .images import variant_url
+from .storage import media_storage
 from django.conf import settings
 
 
+# 포스트 색상 매핑 (색상명 -> CSS 그라디언트)
+COLOR_GRADIENTS = {
+    'yellow': ('#fef08a', '#fde047'),
+    'blue': ('#93c5fd', '#60a5fa'),
+    'green': ('#86efac', '#4ade80'),
+    'pink': ('#f9a8d4', '#f472b6'),
+    'purple': ('#c4b5fd', '#a78bfa'),
+    'orange': ('#fdba74', '#fb923c'),
+    'cyan': ('#67e8f9', '#22d3ee'),
+    'lime': ('#bef264', '#a3e635'),
+    'indigo': ('#818cf8', '#6366f1'),
+    'teal': ('#5eead4', '#2dd4bf'),
+}
+
+# 기본 그라디언트 (보라색)
+DEFAULT_GRADIENT = ('#667eea', '#764ba2')
+
+
+def visible_boards_q(user, prefix=''):
+    """
+    사용자가 볼 수 있는 보드 조건 (prefix='board__' 로 포스트 등에서 조인 조건으로 사용)
+
+    포스트를 `board__in=<보드 서브쿼리>` 로 거르면 SQLite가 보드 목록을 먼저 만든 뒤
+    정렬용 임시 B-트리를 쓰므로, 갤러리처럼 최신순으로 일부만 읽는 곳에서는 조인 조건을 쓴다.
+    """
+    if user.is_authenticated and user.pk is not None:
+        return Q(**{f'{prefix}is_public': True}) | Q(**{f'{prefix}creator': user})
+    return Q(**{f'{prefix}is_public': True})
+
+
+class BoardQuerySet(models.QuerySet):
+    """보드 목록 조회용 QuerySet"""
+
+    def visible_to(self, user):
+        """로그인한 사용자는 공개 보드와 자신의 보드, 비로그인 사용자(또는 저장 전 게스트)는 공개 보드만"""
+        return self.filter(visible_boards_q(user))
+
+    def with_card_data(self):
+        """보드 카드에 필요한 썸네일, 미리보기 텍스트, 색상, 포스트 수를 한 번의 쿼리로 주석 처리"""
+        board_posts = Post.objects.filter(board=OuterRef('pk')).order_by('-created_at')
+        return self.annotate(
+            card_thumbnail=Subquery(
+                board_posts.filter(image__isnull=False).exclude(image='').values('image')[:1]
+            ),
+            card_thumbnail_variants=Subquery(
+                board_posts.filter(image__isnull=False).exclude(image='').values('image_variants')[:1]
+            ),
+            card_text=Subquery(
+                board_posts.filter(content__isnull=False).exclude(content='').values('content')[:1]
+            ),
+            card_color=Subquery(
+                board_posts.exclude(color='').values('color')[:1]
+            ),
+            # GROUP BY 없이 세어야 정렬에 인덱스를 그대로 사용
+            post_count=Coalesce(Subquery(
+                Post.objects.filter(board=OuterRef('pk')).order_by().values('board').annotate(
+                    total=Count('*')
+                ).values('total')
+            ), 0),
+        )
+
+    def next_revision(self, board_id):
+        """
+        보드 리비전을 1 증가시키고 새 리비전 반환 (보드가 없으면 None)
+
+        증가시킨 보드 행은 트랜잭션이 끝날 때까지 잠기므로, 리비전을 기록하는 행도 같은 atomic 블록에서 써야
+        리비전 순서대로 커밋되어 changes?since= 폴링이 변경을 놓치지 않는다.
+        """
+        connection = connections[self.db]
+        now = timezone.now()
+        # UPDATE ... RETURNING 으로 증가와 읽기를 한 문장에 (PostgreSQL, SQLite 3.35+)
+        if connection.vendor == 'postgresql' or (
+            connection.vendor == 'sqlite' and connection.features.can_return_columns_from_insert
+        ):
+            table = connection.ops.quote_name(self.model._meta.db_table)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'UPDATE {table} SET revision = revision + 1, updated_at = %s WHERE id = %s RETURNING revision',
+                    [connection.ops.adapt_datetimefield_value(now), board_id]
+                )
+                row = cursor.fetchone()
+            return row[0] if row else None
+
+        updated = self.filter(pk=board_id).update(revision=F('revision') + 1, updated_at=now)
+        if not updated:
+            return None
+        return self.filter(pk=board_id).values_list('revision', flat=True).first()
+
+
 class Board(models.Model):
     """협업 보드 모델"""
     title = models.CharField(max_length=100)
@@ -11,23 +106,38 @@ class Board(models.Model):
         related_name='created_boards'
     )
     is_public = models.BooleanField(default=True, verbose_name='공개 여부')
+    revision = models.PositiveBigIntegerField(default=0, verbose_name='리비전')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BoardQuerySet.as_manager()
+
     class Meta:
         verbose_name = '보드'
         verbose_name_plural = '보드들'
         ordering = ['-created_at']
+        indexes = [
+            # 보드 목록(공개 보드 + 내 보드)과 프로필(내 보드)의 최신순 정렬
+            models.Index(fields=['-created_at'], name='collab_board_created_idx'),
+            models.Index(fields=['is_public', '-created_at'], name='collab_board_public_idx'),
+            models.Index(fields=['creator', '-created_at'], name='collab_board_creator_idx'),
+        ]
 
     def get_thumbnail_url(self):
         """보드의 썸네일 이미지 URL 반환 (이미지가 있는 가장 최신 포스트)"""
+        if hasattr(self, 'card_thumbnail'):
+            if not self.card_thumbnail:
+                return None
+            return variant_url(Post(image=self.card_thumbnail).image, self.card_thumbnail_variants, 'card')
         post_with_image = self.posts.filter(image__isnull=False).exclude(image='').order_by('-created_at').first()
         if post_with_image and post_with_image.image:
-            return post_with_image.image.url
+            return variant_url(post_with_image.image, post_with_image.image_variants, 'card')
         return None
     
     def get_latest_post_text(self):
         """가장 최근 포스트의 텍스트 일부 반환 (이미지가 없을 때 사용)"""
+        if hasattr(self, 'card_text'):
+            return self.card_text[:100] if self.card_text else None
         latest_post = self.posts.filter(content__isnull=False).exclude(content='').order_by('-created_at').first()
         if latest_post and latest_post.content:
             # 최대 100자까지 반환
@@ -36,31 +146,16 @@ class Board(models.Model):
     
     def get_gradient_colors(self):
         """보드의 포스트 색상들을 기반으로 그라디언트 색상 반환"""
-        # 포스트 색상 매핑 (색상명 -> CSS 그라디언트)
-        color_gradients = {
-            'yellow': ('#fef08a', '#fde047'),
-            'blue': ('#93c5fd', '#60a5fa'),
-            'green': ('#86efac', '#4ade80'),
-            'pink': ('#f9a8d4', '#f472b6'),
-            'purple': ('#c4b5fd', '#a78bfa'),
-            'orange': ('#fdba74', '#fb923c'),
-            'cyan': ('#67e8f9', '#22d3ee'),
-            'lime': ('#bef264', '#a3e635'),
-            'indigo': ('#818cf8', '#6366f1'),
-            'teal': ('#5eead4', '#2dd4bf'),
-        }
-        
-        # 보드의 포스트들에서 색상 수집
-        post_colors = self.posts.exclude(color='').values_list('color', flat=True).distinct()[:3]
+        if hasattr(self, 'card_color'):
+            first_color = self.card_color
+        else:
+            # 가장 최근 포스트의 색상 사용
+            first_color = self.posts.exclude(color='').order_by('-created_at').values_list('color', flat=True).first()
         
-        if post_colors:
-            # 첫 번째 색상의 그라디언트 사용
-            first_color = post_colors[0]
-            if first_color in color_gradients:
-                return color_gradients[first_color]
+        if first_color in COLOR_GRADIENTS:
+            return COLOR_GRADIENTS[first_color]
         
-        # 기본 그라디언트 (보라색)
-        return ('#667eea', '#764ba2')
+        return DEFAULT_GRADIENT
     
     def __str__(self):
         return self.title
@@ -96,10 +191,16 @@ class Post(models.Model):
     position_x = models.FloatField(default=0.0, null=True, blank=True)
     position_y = models.FloatField(default=0.0, null=True, blank=True)
     z_index = models.IntegerField(default=1, verbose_name='레이어 순서')
-    image = models.ImageField(upload_to='posts/', null=True, blank=True, verbose_name='이미지')
-    attached_file = models.FileField(upload_to='files/', null=True, blank=True, verbose_name='첨부 파일')
+    width = models.FloatField(null=True, blank=True, verbose_name='너비')
+    height = models.FloatField(null=True, blank=True, verbose_name='높이')
+    rotation = models.FloatField(default=0.0, verbose_name='회전 각도')
+    image = models.ImageField(upload_to='posts/', storage=media_storage, null=True, blank=True, verbose_name='이미지')
+    image_variants = models.JSONField(default=dict, blank=True, editable=False, verbose_name='이미지 파생본')
+    attached_file = models.FileField(upload_to='files/', storage=media_storage, null=True, blank=True, verbose_name='첨부 파일')
+    attached_file_name = models.CharField(max_length=255, blank=True, editable=False, verbose_name='첨부 파일 원래 이름')
     likes = models.IntegerField(default=0, verbose_name='좋아요 수')
     dislikes = models.IntegerField(default=0, verbose_name='싫어요 수')
+    revision = models.PositiveBigIntegerField(default=0, verbose_name='리비전')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -107,11 +208,48 @@ class Post(models.Model):
         verbose_name = '포스트'
         verbose_name_plural = '포스트들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['board', 'revision'], name='collab_post_board_rev_idx'),
+            # 보드 상세/보드 카드(썸네일, 미리보기)의 보드별 최신순 조회
+            models.Index(fields=['board', '-created_at'], name='collab_post_board_created_idx'),
+            # 갤러리 키셋 페이지네이션 (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='collab_post_created_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        """저장할 때마다 보드 리비전을 올리고 포스트에 기록 (리비전 증가와 저장은 한 트랜잭션)"""
+        with transaction.atomic(using=kwargs.get('using')):
+            revision = Board.objects.next_revision(self.board_id)
+            if revision is not None:
+                self.revision = revision
+                update_fields = kwargs.get('update_fields')
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'revision'}
+            super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.user.username}의 포스트 - {self.content[:50]}"
 
 
+class PostTombstone(models.Model):
+    """삭제된 포스트 기록 - 변경 사항 API에서 삭제를 전달하기 위해 사용"""
+    # 보드 삭제와 함께 정리되므로 외래 키 대신 ID만 저장
+    board_id = models.BigIntegerField(verbose_name='보드 ID')
+    post_id = models.BigIntegerField(verbose_name='포스트 ID')
+    revision = models.PositiveBigIntegerField(verbose_name='리비전')
+    deleted_at = models.DateTimeField(auto_now_add=True, verbose_name='삭제일')
+
+    class Meta:
+        verbose_name = '삭제된 포스트'
+        verbose_name_plural = '삭제된 포스트들'
+        indexes = [
+            models.Index(fields=['board_id', 'revision'], name='collab_tomb_board_rev_idx'),
+        ]
+
+    def __str__(self):
+        return f"보드 {self.board_id}의 삭제된 포스트 {self.post_id}"
+
+
 class Comment(models.Model):
     """포스트 댓글 모델"""
     post = models.ForeignKey(
@@ -131,7 +269,90 @@ class Comment(models.Model):
         verbose_name = '댓글'
         verbose_name_plural = '댓글들'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['post', '-created_at'], name='collab_comment_post_idx'),
+        ]
 
     def __str__(self):
         return f"{self.author.username}의 댓글 - {self.content[:30]}"
 
+
+class PostReaction(models.Model):
+    """사용자별 포스트 반응 (좋아요) - 한 사용자는 포스트마다 한 번만 반응할 수 있음"""
+    KIND_LIKE = 'like'
+    KIND_CHOICES = [
+        (KIND_LIKE, '좋아요'),
+    ]
+
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='reactions'
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='post_reactions'
+    )
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default=KIND_LIKE, verbose_name='종류')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='반응일')
+
+    class Meta:
+        verbose_name = '포스트 반응'
+        verbose_name_plural = '포스트 반응들'
+        constraints = [
+            # 사용자 기준 조회(갤러리의 "좋아요 누름" 표시)에 쓰이도록 user를 앞에 둠
+            models.UniqueConstraint(fields=['user', 'post', 'kind'], name='unique_post_reaction'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}의 포스트 {self.post_id} {self.get_kind_display()}"
+
+
+class BackgroundTask(models.Model):
+    """백그라운드 작업 대기열 - manage.py runworker 가 처리"""
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, '대기'),
+        (STATUS_RUNNING, '실행 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    name = models.CharField(max_length=200, verbose_name='작업 이름')
+    kwargs = models.JSONField(default=dict, blank=True, verbose_name='인자')
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name='상태')
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name='시도 횟수')
+    run_after = models.DateTimeField(default=timezone.now, verbose_name='실행 가능 시각')
+    last_error = models.TextField(blank=True, verbose_name='마지막 오류')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '백그라운드 작업'
+        verbose_name_plural = '백그라운드 작업들'
+        ordering = ['run_after', 'id']
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='collab_task_status_run_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.get_status_display()})"
+
+
+class MediaBlob(models.Model):
+    """내용 해시로 저장된 미디어 파일과 참조 수 (collaboration.storage 참고)"""
+    name = models.CharField(max_length=255, unique=True, verbose_name='저장 경로')
+    size = models.PositiveBigIntegerField(default=0, verbose_name='크기')
+    ref_count = models.PositiveIntegerField(default=0, verbose_name='참조 수')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '미디어 파일'
+        verbose_name_plural = '미디어 파일들'
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count})"
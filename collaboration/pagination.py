@@ -0,0 +1,55 @@
+"""
+키셋(커서) 페이지네이션
+
+(created_at, id)를 커서로 삼아 OFFSET 없이 다음 페이지를 읽는다. 행이 아무리 많아도
+한 페이지는 인덱스 범위 검색 한 번이고, 읽는 사이 새 행이 추가되어도 중복/누락이 없다.
+갤러리 포스트와 갤러리/게시판 댓글의 "더 보기"에 사용한다.
+"""
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+
+def encode_cursor(obj):
+    """(created_at, id) 기준 커서 문자열 생성"""
+    raw = f'{obj.created_at.isoformat()}|{obj.id}'
+    return urlsafe_base64_encode(raw.encode())
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (created_at, id) 튜플로 변환 - 잘못된 커서는 ValueError"""
+    try:
+        created_at, obj_id = urlsafe_base64_decode(cursor).decode().split('|')
+        parsed = datetime.fromisoformat(created_at)
+        return parsed, int(obj_id)
+    except (ValueError, TypeError, UnicodeDecodeError) as e:
+        raise ValueError('잘못된 커서입니다.') from e
+
+
+def keyset_page(queryset, cursor, size, descending=True):
+    """
+    (created_at, id) 순서의 한 페이지와 다음 페이지 커서 반환 (마지막 페이지면 커서는 None)
+
+    descending=True 면 최신순, False 면 오래된 순. 잘못된 커서는 ValueError.
+    """
+    lookup = 'lt' if descending else 'gt'
+    if descending:
+        queryset = queryset.order_by('-created_at', '-id')
+    else:
+        queryset = queryset.order_by('created_at', 'id')
+
+    if cursor:
+        created_at, obj_id = decode_cursor(cursor)
+        # created_at__lte/gte 는 인덱스 범위 검색 시작점 (OR 조건만으로는 처음부터 훑음)
+        queryset = queryset.filter(**{f'created_at__{lookup}e': created_at}).filter(
+            Q(**{f'created_at__{lookup}': created_at}) | Q(created_at=created_at, **{f'id__{lookup}': obj_id})
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    page = list(queryset[:size + 1])
+    next_cursor = None
+    if len(page) > size:
+        page = page[:size]
+        next_cursor = encode_cursor(page[-1])
+    return page, next_cursor
@@ -0,0 +1,180 @@
+"""
+보드 실시간 동기화 (WebSocket)
+
+같은 보드를 보고 있는 사용자들에게 포스트 생성/이동/수정/삭제와 댓글 변경 사항을
+전달한다. 기본 백엔드는 프로세스 내부 pub/sub 이므로 HTTP 요청과 WebSocket 연결이
+같은 ASGI 프로세스에서 처리될 때만 동작한다. 여러 프로세스로 운영할 때는
+settings.BOARD_SYNC_BACKEND 에 같은 인터페이스(subscribe/unsubscribe/publish)를
+구현한 클래스를 지정하면 된다.
+"""
+import asyncio
+import json
+import re
+import threading
+from http.cookies import SimpleCookie
+from importlib import import_module
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user
+from django.utils.module_loading import import_string
+
+from .images import variant_url
+
+
+# 구독자별 대기열 최대 크기 (느린 클라이언트가 메모리를 계속 차지하지 않도록)
+SUBSCRIBER_QUEUE_SIZE = 256
+
+BOARD_SOCKET_PATH = re.compile(r'^/ws/collaboration/board/(?P<board_id>\d+)/$')
+
+
+class InProcessBroker:
+    """프로세스 내부 pub/sub - 보드 ID별 구독자 대기열에 메시지 전달"""
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, board_id):
+        """구독자 대기열 생성 (이벤트 루프 안에서 호출)"""
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        subscriber = (asyncio.get_running_loop(), queue)
+        with self._lock:
+            self._subscribers.setdefault(board_id, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, board_id, subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(board_id)
+            if subscribers:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    del self._subscribers[board_id]
+
+    def publish(self, board_id, message):
+        """메시지 발행 - 동기 뷰(다른 스레드)에서도 안전하게 호출 가능"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(board_id, ()))
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(_offer, queue, message)
+
+
+def _offer(queue, message):
+    """대기열이 가득 찬 구독자는 메시지를 건너뜀 (재접속 시 새로고침으로 복구)"""
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """설정된 pub/sub 백엔드 인스턴스 반환"""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                backend = getattr(settings, 'BOARD_SYNC_BACKEND', 'collaboration.realtime.InProcessBroker')
+                _broker = import_string(backend)()
+    return _broker
+
+
+def publish_board_event(board_id, event_type, **payload):
+    """보드 구독자들에게 변경 사항 발행"""
+    get_broker().publish(board_id, {'type': event_type, **payload})
+
+
+def post_payload(post):
+    """WebSocket으로 전달할 포스트 데이터"""
+    return {
+        'id': post.id,
+        'user_id': post.user_id,
+        'content': post.content,
+        'color': post.color,
+        'position_x': post.position_x,
+        'position_y': post.position_y,
+        'z_index': post.z_index,
+        'width': post.width,
+        'height': post.height,
+        'rotation': post.rotation,
+        'revision': post.revision,
+        'image_url': variant_url(post.image, post.image_variants, 'canvas') or None,
+        'file_url': post.attached_file.url if post.attached_file else None,
+        'file_name': post.attached_file_name if post.attached_file else None,
+    }
+
+
+def comment_payload(comment):
+    """WebSocket으로 전달할 댓글 데이터"""
+    return {
+        'id': comment.id,
+        'post_id': comment.post_id,
+        'content': comment.content,
+        'author': comment.author.username,
+        'created_at': comment.created_at.isoformat(),
+    }
+
+
+def _load_user(scope):
+    """쿠키의 세션 키로 사용자 조회"""
+    cookies = SimpleCookie()
+    for name, value in scope.get('headers', []):
+        if name == b'cookie':
+            cookies.load(value.decode('latin-1'))
+    morsel = cookies.get(settings.SESSION_COOKIE_NAME)
+    engine = import_module(settings.SESSION_ENGINE)
+    session = engine.SessionStore(morsel.value if morsel else None)
+    return get_user(SimpleNamespace(session=session))
+
+
+def _can_view_board(user, board_id):
+    from .models import Board
+    return Board.objects.visible_to(user).filter(id=board_id).exists()
+
+
+async def _authorize(scope, board_id):
+    user = await sync_to_async(_load_user)(scope)
+    return await sync_to_async(_can_view_board)(user, board_id)
+
+
+async def board_socket(scope, receive, send):
+    """보드 WebSocket ASGI 애플리케이션 - /ws/collaboration/board/<id>/"""
+    match = BOARD_SOCKET_PATH.match(scope['path'])
+
+    message = await receive()
+    if message['type'] != 'websocket.connect':
+        return
+    if not match:
+        await send({'type': 'websocket.close', 'code': 4404})
+        return
+
+    board_id = int(match.group('board_id'))
+    if not await _authorize(scope, board_id):
+        await send({'type': 'websocket.close', 'code': 4403})
+        return
+
+    await send({'type': 'websocket.accept'})
+
+    broker = get_broker()
+    subscriber = broker.subscribe(board_id)
+    _, queue = subscriber
+
+    async def forward():
+        while True:
+            event = await queue.get()
+            await send({'type': 'websocket.send', 'text': json.dumps(event)})
+
+    forward_task = asyncio.create_task(forward())
+    try:
+        # 클라이언트가 보내는 메시지는 무시하고 연결 종료만 감지
+        while True:
+            message = await receive()
+            if message['type'] == 'websocket.disconnect':
+                break
+    finally:
+        broker.unsubscribe(board_id, subscriber)
+        forward_task.cancel()
@@ -0,0 +1,147 @@
+"""
+SQLite FTS5 전문 검색 색인
+
+게시판 글(제목/내용), 보드 포스트 내용, 댓글 내용을 외부 콘텐츠(external content) FTS5
+테이블로 색인한다. 색인은 원본 테이블의 트리거로 갱신되므로 시그널을 거치지 않는
+일괄 삭제/수정에도 맞게 유지된다. 한국어 조사("보드를", "보드에서")도 찾을 수 있도록
+검색어의 각 단어는 접두어로 검색한다.
+
+SQLite가 아니거나 FTS5를 지원하지 않으면 search_ids()가 None을 반환하고,
+호출하는 쪽에서 기존 icontains 검색으로 처리한다.
+"""
+import re
+
+from django.db import connection, connections
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.expressions import RawSQL
+
+
+# 색인 테이블 이름: (원본 테이블, 색인할 컬럼, 컬럼별 순위 가중치)
+FTS_TABLES = {
+    'forum_post_fts': ('forum_post', ('title', 'content'), (10.0, 1.0)),
+    'collaboration_post_fts': ('collaboration_post', ('content',), (1.0,)),
+    'collaboration_comment_fts': ('collaboration_comment', ('content',), (1.0,)),
+}
+
+# 한 번의 검색에서 순위대로 가져올 최대 결과 수 (전체 결과가 필요하면 match_ids_query 와 함께 사용)
+SEARCH_RESULT_LIMIT = 500
+
+# 검색어에서 사용할 최대 단어 수
+MAX_SEARCH_TERMS = 8
+
+_fts5_available = {}
+
+
+def fts5_available(conn=None):
+    """현재 DB 연결에서 FTS5 검색을 사용할 수 있는지"""
+    conn = conn or connection
+    if conn.vendor != 'sqlite':
+        return False
+    if conn.alias not in _fts5_available:
+        with conn.cursor() as cursor:
+            cursor.execute('PRAGMA compile_options')
+            options = {row[0] for row in cursor.fetchall()}
+        _fts5_available[conn.alias] = 'ENABLE_FTS5' in options
+    return _fts5_available[conn.alias]
+
+
+def build_match_query(text):
+    """사용자 입력을 FTS5 MATCH 식으로 변환 - 모든 단어를 접두어로 포함 (예: "보드"* "공유"*)"""
+    terms = re.findall(r'\w+', text)[:MAX_SEARCH_TERMS]
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search_ids(table, text, limit=SEARCH_RESULT_LIMIT):
+    """검색 순위(bm25)대로 정렬한 원본 행 ID 목록 - FTS5를 쓸 수 없으면 None"""
+    if not fts5_available():
+        return None
+    match = build_match_query(text)
+    if not match:
+        return []
+    weights = ', '.join(str(weight) for weight in FTS_TABLES[table][2])
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT rowid FROM {table} WHERE {table} MATCH %s ORDER BY bm25({table}, {weights}) LIMIT %s',
+            [match, limit]
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def match_ids_query(table, text):
+    """
+    검색어와 일치하는 모든 원본 행 ID 서브쿼리 (pk__in 조건용, 결과 수 제한 없음)
+
+    FTS5를 쓸 수 없으면 None, 검색할 단어가 없으면 빈 목록을 반환한다.
+    """
+    if not fts5_available():
+        return None
+    match = build_match_query(text)
+    if not match:
+        return []
+    return RawSQL(f'SELECT rowid FROM {table} WHERE {table} MATCH %s', [match])
+
+
+def order_by_ids(queryset, ids):
+    """ID 목록 순서(검색 순위)대로 정렬 - 목록에 없는 행은 그 뒤에 최신순으로"""
+    ranking = Case(
+        *[When(pk=pk, then=Value(position)) for position, pk in enumerate(ids)],
+        default=Value(len(ids)),
+        output_field=IntegerField()
+    )
+    return queryset.order_by(ranking, '-pk')
+
+
+def ensure_fts_tables(using='default', **kwargs):
+    """
+    색인 테이블과 동기화 트리거가 없으면 만들고 기존 데이터를 색인 (post_migrate)
+
+    SQLite는 컬럼 변경 마이그레이션에서 테이블을 다시 만들며 트리거도 함께 지우므로
+    마이그레이션 파일 대신 migrate 후마다 확인한다.
+    """
+    conn = connections[using]
+    if not fts5_available(conn):
+        return
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = {name for _, name in cursor.fetchall()}
+
+        for table, (source, columns, _) in FTS_TABLES.items():
+            if source not in existing:
+                continue
+            column_list = ', '.join(columns)
+            new_values = ', '.join(f'new.{column}' for column in columns)
+            old_values = ', '.join(f'old.{column}' for column in columns)
+            delete_old = (
+                f"INSERT INTO {table}({table}, rowid, {column_list}) "
+                f"VALUES ('delete', old.id, {old_values});"
+            )
+            insert_new = f"INSERT INTO {table}(rowid, {column_list}) VALUES (new.id, {new_values});"
+            statements = {
+                table: (
+                    f"CREATE VIRTUAL TABLE {table} USING fts5("
+                    f"{column_list}, content='{source}', content_rowid='id', "
+                    f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+                ),
+                f'{table}_ai': f"CREATE TRIGGER {table}_ai AFTER INSERT ON {source} BEGIN {insert_new} END",
+                f'{table}_ad': f"CREATE TRIGGER {table}_ad AFTER DELETE ON {source} BEGIN {delete_old} END",
+                f'{table}_au': (
+                    f"CREATE TRIGGER {table}_au AFTER UPDATE OF {column_list} ON {source} "
+                    f"BEGIN {delete_old} {insert_new} END"
+                ),
+            }
+            missing = [name for name in statements if name not in existing]
+            for name in missing:
+                cursor.execute(statements[name])
+            # 트리거가 없던 동안의 변경 사항까지 반영
+            if missing:
+                cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+
+
+def rebuild_fts_tables():
+    """모든 색인을 원본 테이블 기준으로 다시 생성"""
+    if not fts5_available():
+        return False
+    with connection.cursor() as cursor:
+        for table in FTS_TABLES:
+            cursor.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+    return True
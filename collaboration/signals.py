@@ -0,0 +1,85 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .fragments import bump_version
+from .models import Board, Post, PostTombstone, Comment
+from .realtime import publish_board_event, post_payload, comment_payload
+from .storage import release_files, release_replaced_files, remember_previous_files
+
+
+POST_FILE_FIELDS = ('image', 'attached_file')
+
+
+@receiver(post_save, sender=Post)
+def broadcast_post_saved(sender, instance, created, update_fields=None, **kwargs):
+    """포스트 생성/수정을 보드 구독자에게 전달 (커밋 후)"""
+    event_type = 'post.created' if created else 'post.updated'
+    # 위치/레이어만 바뀐 경우는 이동 이벤트로 구분
+    if update_fields and set(update_fields) <= {'position_x', 'position_y', 'z_index'}:
+        event_type = 'post.moved'
+    payload = post_payload(instance)
+    transaction.on_commit(lambda: publish_board_event(instance.board_id, event_type, post=payload))
+
+
+@receiver(post_delete, sender=Post)
+def record_post_deleted(sender, instance, origin=None, **kwargs):
+    """포스트 삭제 기록(tombstone)을 남기고 보드 구독자에게 전달 (커밋 후)"""
+    # 보드 자체가 삭제되는 경우에는 기록할 필요 없음
+    if isinstance(origin, Board) or getattr(origin, 'model', None) is Board:
+        return
+    board_id, post_id = instance.board_id, instance.id
+    revision = Board.objects.next_revision(board_id)
+    if revision is None:
+        return
+    PostTombstone.objects.create(board_id=board_id, post_id=post_id, revision=revision)
+    transaction.on_commit(lambda: publish_board_event(
+        board_id, 'post.deleted', post={'id': post_id}, revision=revision
+    ))
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_files(sender, instance, update_fields=None, **kwargs):
+    remember_previous_files(sender, instance, POST_FILE_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=Post)
+def release_replaced_post_files(sender, instance, **kwargs):
+    """이미지/첨부 파일이 바뀌면 이전 파일의 참조 해제"""
+    release_replaced_files(instance)
+
+
+@receiver(post_delete, sender=Post)
+def release_post_files(sender, instance, **kwargs):
+    """포스트(또는 보드) 삭제 시 파일과 이미지 파생본의 참조 해제"""
+    release_files(instance, POST_FILE_FIELDS, variants_field='image_variants')
+
+
+@receiver(post_delete, sender=Board)
+def clear_board_tombstones(sender, instance, **kwargs):
+    """보드 삭제 시 남아 있는 삭제 기록도 정리"""
+    PostTombstone.objects.filter(board_id=instance.id).delete()
+
+
+@receiver(post_save, sender=Board)
+@receiver(post_delete, sender=Board)
+def bump_board_card_version(sender, instance, **kwargs):
+    """보드 카드 조각 캐시 무효화 (제목/공개 여부 변경, 삭제)"""
+    bump_version('board', instance.id)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def bump_post_board_card_version(sender, instance, **kwargs):
+    """포스트가 바뀌면 보드 카드(썸네일/색상/포스트 수) 조각 캐시 무효화"""
+    bump_version('board', instance.board_id)
+
+
+@receiver(post_save, sender=Comment)
+def broadcast_comment_saved(sender, instance, created, **kwargs):
+    """댓글 작성을 보드 구독자에게 전달 (커밋 후)"""
+    if not created:
+        return
+    board_id = instance.post.board_id
+    payload = comment_payload(instance)
+    transaction.on_commit(lambda: publish_board_event(board_id, 'comment.created', comment=payload))
@@ -0,0 +1,77 @@
+// 카드 배치 방식 변경 함수
+function changeLayout(layout) {
+    const container = document.getElementById('boardListContainer');
+    if (!container) return;
+
+    // 기존 레이아웃 클래스 제거
+    const layouts = ['grid', 'list', 'masonry', 'compact', 'tile', 'card', 'table', 'gallery'];
+    layouts.forEach(l => {
+        container.classList.remove(`layout-${l}`);
+    });
+
+    // 새 레이아웃 클래스 추가
+    container.classList.add(`layout-${layout}`);
+
+    // 로컬 스토리지에 저장
+    localStorage.setItem('boardLayout', layout);
+}
+
+// 배경 테마 변경 함수
+function changeTheme(theme) {
+    const body = document.body;
+    if (!body) return;
+
+    // 기존 테마 클래스 제거
+    const themes = ['default', 'dark', 'light', 'colorful', 'minimal', 'creamy', 'blue', 'green'];
+    themes.forEach(t => {
+        body.classList.remove(`theme-${t}`);
+    });
+
+    // 새 테마 클래스 추가
+    body.classList.add(`theme-${theme}`);
+
+    // 로컬 스토리지에 저장
+    localStorage.setItem('boardTheme', theme);
+}
+
+// 저장된 배치 방식 불러오기
+function loadLayout() {
+    const savedLayout = localStorage.getItem('boardLayout') || 'grid';
+    const select = document.getElementById('layoutSelect');
+    if (select) {
+        select.value = savedLayout;
+        changeLayout(savedLayout);
+    }
+}
+
+// 저장된 테마 불러오기
+function loadTheme() {
+    const savedTheme = localStorage.getItem('boardTheme') || 'default';
+    const select = document.getElementById('themeSelect');
+    if (select) {
+        select.value = savedTheme;
+        changeTheme(savedTheme);
+    }
+}
+
+// 페이지 로드 시 실행
+document.addEventListener('DOMContentLoaded', function() {
+    loadLayout();
+    loadTheme();
+
+    // 배치 방식 드롭다운 변경 이벤트
+    const layoutSelect = document.getElementById('layoutSelect');
+    if (layoutSelect) {
+        layoutSelect.addEventListener('change', function(e) {
+            changeLayout(e.target.value);
+        });
+    }
+
+    // 테마 드롭다운 변경 이벤트
+    const themeSelect = document.getElementById('themeSelect');
+    if (themeSelect) {
+        themeSelect.addEventListener('change', function(e) {
+            changeTheme(e.target.value);
+        });
+    }
+});
@@ -0,0 +1,397 @@
+// 카드 배치 방식 변경 함수
+function changeGalleryLayout(layout) {
+    const container = document.getElementById('galleryContainer');
+    if (!container) return;
+
+    // 기존 레이아웃 클래스 제거
+    const layouts = ['grid', 'list', 'masonry', 'compact', 'tile', 'card', 'table', 'gallery'];
+    layouts.forEach(l => {
+        container.classList.remove(`gallery-layout-${l}`);
+    });
+
+    // 새 레이아웃 클래스 추가
+    container.classList.add(`gallery-layout-${layout}`);
+
+    // 로컬 스토리지에 저장
+    localStorage.setItem('galleryLayout', layout);
+}
+
+// 배경 테마 변경 함수
+function changeGalleryTheme(theme) {
+    const body = document.body;
+    if (!body) return;
+
+    // 기존 테마 클래스 제거
+    const themes = ['default', 'dark', 'light', 'colorful', 'minimal', 'creamy', 'blue', 'green'];
+    themes.forEach(t => {
+        body.classList.remove(`theme-${t}`);
+    });
+
+    // 새 테마 클래스 추가
+    body.classList.add(`theme-${theme}`);
+
+    // 로컬 스토리지에 저장
+    localStorage.setItem('galleryTheme', theme);
+}
+
+// 저장된 배치 방식 불러오기
+function loadGalleryLayout() {
+    const savedLayout = localStorage.getItem('galleryLayout') || 'masonry';
+    const select = document.getElementById('layoutSelect');
+    if (select) {
+        select.value = savedLayout;
+        changeGalleryLayout(savedLayout);
+    }
+}
+
+// 저장된 테마 불러오기
+function loadGalleryTheme() {
+    const savedTheme = localStorage.getItem('galleryTheme') || 'default';
+    const select = document.getElementById('themeSelect');
+    if (select) {
+        select.value = savedTheme;
+        changeGalleryTheme(savedTheme);
+    }
+}
+
+// 좋아요를 누른 포스트 ID를 저장 (중복 클릭 방지)
+const likedPosts = new Set();
+
+// 피드백 버튼 클릭 이벤트 (root: 새로 추가된 카드 영역)
+function setupFeedbackButtons(root = document) {
+    // 서버에서 좋아요 누른 상태로 렌더링한 버튼
+    root.querySelectorAll('.feedback-like-btn.liked').forEach(button => {
+        likedPosts.add(button.getAttribute('data-post-id'));
+    });
+
+    root.querySelectorAll('.feedback-btn[data-type]').forEach(button => {
+        button.addEventListener('click', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+
+            const postId = this.getAttribute('data-post-id');
+            const feedbackType = this.getAttribute('data-type');
+
+            // postId와 feedbackType 유효성 검사
+            if (!postId || postId === 'null' || !feedbackType) {
+                console.error('Invalid postId or feedbackType:', postId, feedbackType);
+                return;
+            }
+
+            // 중복 클릭 방지 (이미 좋아요를 누른 포스트인지 확인)
+            if (likedPosts.has(postId)) {
+                alert('이미 좋아요를 누르셨습니다.');
+                return;
+            }
+
+            // 버튼 비활성화 (중복 클릭 방지)
+            this.disabled = true;
+            this.style.opacity = '0.6';
+            this.style.cursor = 'not-allowed';
+
+            // CSRF 토큰 가져오기
+            const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]');
+            if (!csrfToken) {
+                alert('CSRF 토큰을 찾을 수 없습니다.');
+                this.disabled = false;
+                this.style.opacity = '1';
+                this.style.cursor = 'pointer';
+                return;
+            }
+
+            // AJAX 요청
+            fetch(`/collaboration/post/${postId}/feedback/`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                    'X-CSRFToken': csrfToken.value,
+                    'X-Requested-With': 'XMLHttpRequest'
+                },
+                body: `type=${feedbackType}`
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    // 좋아요 카운트 업데이트
+                    const likesCount = document.querySelector(`.feedback-like-btn[data-post-id="${postId}"] .likes-count`);
+                    if (likesCount) {
+                        likesCount.textContent = data.likes;
+                    }
+
+                    // 좋아요를 누른 포스트로 표시
+                    likedPosts.add(postId);
+
+                    // 버튼 스타일 변경 (좋아요 누른 상태)
+                    const likeBtn = document.querySelector(`.feedback-like-btn[data-post-id="${postId}"]`);
+                    if (likeBtn) {
+                        likeBtn.classList.add('liked');
+                        const icon = likeBtn.querySelector('i');
+                        if (icon) {
+                            icon.classList.replace('bi-heart', 'bi-heart-fill');
+                        }
+                    }
+                } else {
+                    // 실패 시 버튼 다시 활성화
+                    this.disabled = false;
+                    this.style.opacity = '1';
+                    this.style.cursor = 'pointer';
+
+                    if (data.login_url) {
+                        window.location.href = data.login_url;
+                    } else {
+                        alert(data.message || '오류가 발생했습니다.');
+                    }
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                // 에러 시 버튼 다시 활성화
+                this.disabled = false;
+                this.style.opacity = '1';
+                this.style.cursor = 'pointer';
+                alert('오류가 발생했습니다.');
+            });
+        });
+    });
+}
+
+// 댓글 작성 폼 제출 이벤트 (root: 새로 추가된 카드 영역)
+function setupCommentForms(root = document) {
+    root.querySelectorAll('.comment-form').forEach(form => {
+        form.addEventListener('submit', function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+
+            const postId = this.getAttribute('data-post-id');
+            const content = this.querySelector('input[name="content"]').value.trim();
+            const csrfToken = this.querySelector('[name=csrfmiddlewaretoken]').value;
+
+            if (!content) {
+                alert('댓글 내용을 입력해주세요.');
+                return;
+            }
+
+            // AJAX 요청
+            fetch(`/collaboration/post/${postId}/comment/create/`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/x-www-form-urlencoded',
+                    'X-CSRFToken': csrfToken,
+                    'X-Requested-With': 'XMLHttpRequest'
+                },
+                body: `content=${encodeURIComponent(content)}`
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    // 댓글 목록에 새 댓글 추가
+                    const commentsList = document.querySelector(`.comments-list[data-post-id="${postId}"]`);
+                    if (commentsList) {
+                        // "아직 댓글이 없습니다" 메시지 제거
+                        const emptyMsg = commentsList.querySelector('.comment-empty');
+                        if (emptyMsg) {
+                            emptyMsg.remove();
+                        }
+
+                        // 새 댓글 요소 생성
+                        const commentDiv = createCommentElement(data.comment);
+                        commentsList.insertBefore(commentDiv, commentsList.firstChild);
+                    }
+
+                    // 댓글 수 업데이트
+                    const commentsCount = document.querySelector(`.comments-toggle-btn[data-post-id="${postId}"] .comments-count`);
+                    if (commentsCount) {
+                        commentsCount.textContent = parseInt(commentsCount.textContent || '0', 10) + 1;
+                    }
+
+                    // 폼 초기화
+                    this.querySelector('input[name="content"]').value = '';
+                } else {
+                    if (data.login_url) {
+                        window.location.href = data.login_url;
+                    } else {
+                        alert(data.message || '오류가 발생했습니다.');
+                    }
+                }
+            })
+            .catch(error => {
+                console.error('Error:', error);
+                alert('오류가 발생했습니다.');
+            });
+        });
+    });
+}
+
+// 댓글 요소 생성
+function createCommentElement(comment) {
+    const commentDiv = document.createElement('div');
+    commentDiv.className = 'comment-item';
+    commentDiv.dataset.commentId = comment.id;
+
+    const authorDiv = document.createElement('div');
+    authorDiv.className = 'comment-author';
+    const author = document.createElement('strong');
+    author.textContent = comment.author;
+    const time = document.createElement('small');
+    time.className = 'comment-time';
+    time.textContent = comment.created_at;
+    authorDiv.append(author, ' ', time);
+
+    const content = document.createElement('span');
+    content.className = 'comment-content';
+    content.textContent = comment.content;
+
+    commentDiv.append(authorDiv, content);
+    return commentDiv;
+}
+
+// 댓글 한 페이지 불러오기 (cursor: 이전 댓글을 이어서 불러올 때)
+function loadComments(commentsList, postId, cursor = '') {
+    const params = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+    return fetch(`/collaboration/post/${postId}/comments/${params}`, {
+        headers: {'X-Requested-With': 'XMLHttpRequest'}
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (!data.success) {
+            throw new Error(data.message || '오류가 발생했습니다.');
+        }
+
+        const moreButton = commentsList.querySelector('.comments-more-btn');
+        if (moreButton) {
+            moreButton.remove();
+        }
+
+        // 작성 직후 추가된 댓글은 유지하고 기존 댓글을 뒤에 붙임
+        const shownIds = new Set(
+            Array.from(commentsList.querySelectorAll('.comment-item'), item => item.dataset.commentId)
+        );
+        data.comments.forEach(comment => {
+            if (!shownIds.has(String(comment.id))) {
+                commentsList.appendChild(createCommentElement(comment));
+            }
+        });
+
+        if (data.next_cursor) {
+            const button = document.createElement('button');
+            button.type = 'button';
+            button.className = 'comments-more-btn';
+            button.textContent = '이전 댓글 더 보기';
+            button.addEventListener('click', function(e) {
+                e.preventDefault();
+                this.disabled = true;
+                loadComments(commentsList, postId, data.next_cursor).catch(error => {
+                    console.error('Error:', error);
+                    this.disabled = false;
+                });
+            });
+            commentsList.appendChild(button);
+        }
+
+        if (!commentsList.children.length) {
+            const emptyMsg = document.createElement('p');
+            emptyMsg.className = 'comment-empty';
+            emptyMsg.textContent = '아직 댓글이 없습니다.';
+            commentsList.appendChild(emptyMsg);
+        }
+    });
+}
+
+// 카드를 열 때 댓글 불러오기 (처음 한 번만 요청)
+function setupCommentToggles(root = document) {
+    root.querySelectorAll('.comments-toggle-btn').forEach(button => {
+        button.addEventListener('click', function(e) {
+            e.preventDefault();
+
+            const postId = this.getAttribute('data-post-id');
+            const commentsList = document.querySelector(`.comments-list[data-post-id="${postId}"]`);
+            if (!commentsList) return;
+
+            commentsList.hidden = !commentsList.hidden;
+            if (commentsList.hidden || commentsList.dataset.loaded) return;
+            commentsList.dataset.loaded = 'true';
+
+            loadComments(commentsList, postId).catch(error => {
+                console.error('Error:', error);
+                commentsList.dataset.loaded = '';
+                alert(error.message || '오류가 발생했습니다.');
+            });
+        });
+    });
+}
+
+// 카드 영역 이벤트 초기화
+function setupGalleryCards(root = document) {
+    setupFeedbackButtons(root);
+    setupCommentForms(root);
+    setupCommentToggles(root);
+}
+
+// 무한 스크롤 - 감지용 요소가 보이면 다음 페이지 불러오기
+function setupInfiniteScroll() {
+    const container = document.getElementById('galleryContainer');
+    const sentinel = document.getElementById('gallerySentinel');
+    if (!container || !sentinel || !('IntersectionObserver' in window)) return;
+
+    let loading = false;
+    const observer = new IntersectionObserver(entries => {
+        if (!entries[0].isIntersecting || loading) return;
+
+        const cursor = container.dataset.nextCursor;
+        if (!cursor) {
+            observer.disconnect();
+            sentinel.hidden = true;
+            return;
+        }
+
+        loading = true;
+        fetch(`${container.dataset.nextUrl}?cursor=${encodeURIComponent(cursor)}`, {
+            headers: {'X-Requested-With': 'XMLHttpRequest'}
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) return;
+
+            const fragment = document.createElement('div');
+            fragment.innerHTML = data.html;
+            setupGalleryCards(fragment);
+            container.append(...fragment.children);
+
+            container.dataset.nextCursor = data.next_cursor || '';
+            if (!data.next_cursor) {
+                observer.disconnect();
+                sentinel.hidden = true;
+            }
+        })
+        .catch(error => console.error('Error:', error))
+        .finally(() => { loading = false; });
+    }, {rootMargin: '400px'});
+
+    observer.observe(sentinel);
+}
+
+// 페이지 로드 시 실행
+document.addEventListener('DOMContentLoaded', function() {
+    loadGalleryLayout();
+    loadGalleryTheme();
+
+    // 배치 방식 드롭다운 변경 이벤트
+    const layoutSelect = document.getElementById('layoutSelect');
+    if (layoutSelect) {
+        layoutSelect.addEventListener('change', function(e) {
+            changeGalleryLayout(e.target.value);
+        });
+    }
+
+    // 테마 드롭다운 변경 이벤트
+    const themeSelect = document.getElementById('themeSelect');
+    if (themeSelect) {
+        themeSelect.addEventListener('change', function(e) {
+            changeGalleryTheme(e.target.value);
+        });
+    }
+
+    // 피드백 및 댓글 기능 초기화
+    setupGalleryCards();
+    setupInfiniteScroll();
+});
@@ -0,0 +1,60 @@
+"""
+정적 파일 저장소와 서빙
+
+collectstatic 이 파일 내용 해시를 이름에 붙인 사본(예: board_detail.3f2a9c1e7b4d.css)과
+원래 이름 -> 해시 이름 매니페스트(staticfiles.json)를 만들고, {% static %} 은 해시 이름을 돌려준다.
+내용이 바뀌면 URL도 바뀌므로 해시 이름 파일은 브라우저/프록시가 1년 동안 다시 확인하지 않고 쓴다.
+"""
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage, staticfiles_storage
+from django.utils.cache import patch_cache_control
+from django.views.static import serve
+
+
+# 해시 이름 파일의 캐시 시간 (1년)
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+
+class ManifestStaticStorage(ManifestStaticFilesStorage):
+    """
+    매니페스트 기반 해시 이름 저장소
+
+    collectstatic 전(개발 서버, 테스트)에는 매니페스트가 없으므로 원래 이름을 돌려주고,
+    매니페스트에 없고 STATIC_ROOT 에도 없는 파일도 오류 대신 원래 이름을 돌려준다.
+    """
+
+    manifest_strict = False
+
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
+
+
+def manifest_version():
+    """매니페스트 해시 - collectstatic 으로 정적 파일이 바뀌면 달라짐 (매니페스트가 없으면 빈 문자열)"""
+    return getattr(staticfiles_storage, 'manifest_hash', '')
+
+
+def is_hashed_name(path):
+    """collectstatic 이 만든 해시 이름 파일인지 여부"""
+    hashed_files = getattr(staticfiles_storage, 'hashed_files', {})
+    return path in hashed_files.values()
+
+
+def serve_static(request, path):
+    """
+    STATIC_ROOT 의 수집된 정적 파일 서빙 (SERVE_STATIC=True 일 때 config.urls 에 연결)
+
+    해시 이름 파일은 내용이 바뀌지 않으므로 immutable 로 1년 캐시하고,
+    원래 이름 파일은 매번 Last-Modified 로 다시 확인하게 한다.
+    """
+    response = serve(request, path, document_root=settings.STATIC_ROOT)
+    if is_hashed_name(path):
+        patch_cache_control(response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, no_cache=True)
+    return response
@@ -0,0 +1,157 @@
+"""
+내용 주소 기반(content-addressed) 미디어 저장소
+
+업로드 파일을 SHA-256 해시로 이름 붙여(blobs/ab/cd/<해시>.<확장자>) 같은 내용은
+한 번만 저장하고, MediaBlob 테이블에 참조 수를 기록한다.
+save()는 참조를 하나 늘리고 delete()는 참조를 하나 줄이며, 참조가 모두 사라진
+경우에만 실제 파일을 지운다. 같은 파일은 URL도 같으므로 브라우저/CDN 캐시도 공유된다.
+"""
+import hashlib
+import os
+from collections import Counter, defaultdict
+
+from django.apps import apps
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils.deconstruct import deconstructible
+
+
+BLOB_DIRECTORY = 'blobs'
+
+
+def content_hash(content):
+    """파일 내용의 SHA-256 해시 (읽은 뒤 처음 위치로 되돌림)"""
+    digest = hashlib.sha256()
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    for chunk in content.chunks():
+        digest.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+    if hasattr(content, 'seek'):
+        content.seek(0)
+    return digest.hexdigest()
+
+
+def blob_name(digest, original_name):
+    """해시와 원래 확장자로 저장 경로 생성 (예: blobs/ab/cd/abcd...ef.png)"""
+    extension = os.path.splitext(original_name)[1].lower()[:10]
+    return f'{BLOB_DIRECTORY}/{digest[:2]}/{digest[2:4]}/{digest}{extension}'
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """해시 이름으로 중복 없이 저장하고 참조 수로 삭제 시점을 정하는 저장소"""
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+
+        name = blob_name(content_hash(content), name)
+        if self.retain(name):
+            return name
+        if not self.exists(name):
+            # 동시에 같은 이름으로 저장되면 Django 기본 규칙대로 다른 이름이 붙음
+            name = super().save(name, content, max_length=max_length)
+        self._create_blob(name, content.size)
+        return name
+
+    def retain(self, name):
+        """이미 등록된 파일이면 참조 수를 늘리고 True 반환"""
+        MediaBlob = apps.get_model('collaboration', 'MediaBlob')
+        return MediaBlob.objects.filter(name=name).update(ref_count=F('ref_count') + 1) > 0
+
+    def _create_blob(self, name, size):
+        MediaBlob = apps.get_model('collaboration', 'MediaBlob')
+        try:
+            with transaction.atomic():
+                MediaBlob.objects.create(name=name, size=size, ref_count=1)
+        except IntegrityError:
+            # 동시에 같은 파일이 올라온 경우 - 먼저 등록된 행의 참조 수만 늘림
+            self.retain(name)
+
+    def delete(self, name):
+        """참조 하나 해제 - 남은 참조가 없으면 커밋 후 파일 삭제"""
+        if not name:
+            return
+        MediaBlob = apps.get_model('collaboration', 'MediaBlob')
+        with transaction.atomic():
+            blobs = MediaBlob.objects.filter(name=name)
+            if blobs.update(ref_count=Greatest(F('ref_count') - 1, 0)):
+                deleted, _ = blobs.filter(ref_count__lte=0).delete()
+                if not deleted:
+                    return
+            # 참조 기록이 없는 파일(해시 저장 이전 업로드)은 공유되지 않으므로 바로 삭제 대상
+            self._delete_after_commit({name})
+
+    def release_many(self, names):
+        """여러 참조를 한 번에 해제 - 참조가 남지 않은 파일은 커밋 후 삭제하고 그 목록 반환"""
+        counts = Counter(name for name in names if name)
+        if not counts:
+            return set()
+        MediaBlob = apps.get_model('collaboration', 'MediaBlob')
+
+        # 같은 횟수만큼 해제되는 이름끼리 묶어 한 번에 갱신
+        names_by_count = defaultdict(list)
+        for name, count in counts.items():
+            names_by_count[count].append(name)
+        for count, group in names_by_count.items():
+            MediaBlob.objects.filter(name__in=group).update(ref_count=Greatest(F('ref_count') - count, 0))
+
+        blobs = MediaBlob.objects.filter(name__in=counts)
+        registered = set(blobs.values_list('name', flat=True))
+        released = blobs.filter(ref_count=0)
+        unreferenced = set(released.values_list('name', flat=True)) | (set(counts) - registered)
+        released.delete()
+
+        self._delete_after_commit(unreferenced)
+        return unreferenced
+
+    def _delete_after_commit(self, names):
+        """
+        커밋 후 파일 삭제 - 트랜잭션이 롤백되면 MediaBlob 행과 함께 파일도 남는다.
+        커밋 전에 같은 내용이 다시 올라와 등록된 파일은 지우지 않는다.
+        """
+        MediaBlob = apps.get_model('collaboration', 'MediaBlob')
+
+        def delete_files():
+            reused = set(MediaBlob.objects.filter(name__in=names).values_list('name', flat=True))
+            for name in names - reused:
+                FileSystemStorage.delete(self, name)
+        transaction.on_commit(delete_files)
+
+
+media_storage = ContentAddressedStorage()
+
+
+def release_files(instance, field_names, variants_field=None):
+    """인스턴스가 참조하던 파일(과 이미지 파생본)의 참조 해제"""
+    for field_name in field_names:
+        field_file = getattr(instance, field_name)
+        if field_file:
+            field_file.storage.delete(field_file.name)
+    if variants_field:
+        from .images import delete_variants
+        delete_variants(getattr(instance, variants_field), media_storage)
+
+
+def remember_previous_files(sender, instance, field_names, update_fields=None):
+    """pre_save에서 호출 - 저장 전 DB에 기록된 파일 이름을 인스턴스에 보관"""
+    if update_fields is not None:
+        field_names = [name for name in field_names if name in update_fields]
+    instance._previous_files = {}
+    if instance.pk is not None and field_names:
+        instance._previous_files = sender.objects.filter(pk=instance.pk).values(*field_names).first() or {}
+
+
+def release_replaced_files(instance):
+    """post_save에서 호출 - 다른 파일로 바뀌거나 지워진 이전 파일의 참조 해제"""
+    previous_files = getattr(instance, '_previous_files', None) or {}
+    for field_name, old_name in previous_files.items():
+        field_file = getattr(instance, field_name)
+        if old_name and old_name != field_file.name:
+            field_file.storage.delete(old_name)
+    instance._previous_files = {}
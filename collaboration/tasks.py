@@ -0,0 +1,106 @@
+"""
+데이터베이스 기반 백그라운드 작업 대기열
+
+요청 안에서 처리하기엔 무거운 작업(이미지 디코딩/리사이즈, EXIF 제거)을
+BackgroundTask 로 저장해 두고 `manage.py runworker` 가 순서대로 처리한다.
+settings.TASK_QUEUE_EAGER 가 True 이면 대기열 없이 커밋 직후 바로 실행한다.
+"""
+import logging
+import traceback
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .images import strip_exif, update_image_variants
+from .models import BackgroundTask
+
+logger = logging.getLogger(__name__)
+
+# 실패한 작업의 최대 시도 횟수
+MAX_ATTEMPTS = 3
+
+# 실행 중 상태로 이 시간 이상 남아 있는 작업은 워커가 중단된 것으로 보고 다시 처리
+STALE_AFTER = timedelta(minutes=10)
+
+TASKS = {}
+
+
+def task(func):
+    """백그라운드 작업으로 등록"""
+    TASKS[f'{func.__module__}.{func.__name__}'] = func
+    return func
+
+
+def enqueue(func, **kwargs):
+    """작업을 대기열에 추가 - 인자는 JSON으로 저장 가능한 값만 허용"""
+    name = f'{func.__module__}.{func.__name__}'
+    if name not in TASKS:
+        raise ValueError(f'등록되지 않은 작업입니다: {name}')
+    if getattr(settings, 'TASK_QUEUE_EAGER', False):
+        transaction.on_commit(lambda: func(**kwargs))
+        return None
+    return BackgroundTask.objects.create(name=name, kwargs=kwargs)
+
+
+def claim_next_task():
+    """실행할 작업 하나를 가져와 실행 중으로 표시 (다른 워커와 경쟁 시 건너뜀)"""
+    now = timezone.now()
+    candidates = BackgroundTask.objects.filter(
+        Q(status=BackgroundTask.STATUS_PENDING, run_after__lte=now) |
+        Q(status=BackgroundTask.STATUS_RUNNING, updated_at__lt=now - STALE_AFTER)
+    ).order_by('run_after', 'id').values_list('id', 'status')[:10]
+
+    for task_id, status in candidates:
+        claimed = BackgroundTask.objects.filter(id=task_id, status=status).update(
+            status=BackgroundTask.STATUS_RUNNING,
+            attempts=F('attempts') + 1,
+            updated_at=now
+        )
+        if claimed:
+            return BackgroundTask.objects.get(id=task_id)
+    return None
+
+
+def run_task(background_task):
+    """작업 실행 후 결과 기록 - 실패하면 지수 백오프로 재시도"""
+    func = TASKS.get(background_task.name)
+    try:
+        if func is None:
+            raise LookupError(f'등록되지 않은 작업입니다: {background_task.name}')
+        func(**background_task.kwargs)
+    except Exception:
+        background_task.last_error = traceback.format_exc()
+        if func is not None and background_task.attempts < MAX_ATTEMPTS:
+            background_task.status = BackgroundTask.STATUS_PENDING
+            background_task.run_after = timezone.now() + timedelta(seconds=2 ** background_task.attempts)
+        else:
+            background_task.status = BackgroundTask.STATUS_FAILED
+        logger.exception('백그라운드 작업 실패: %s', background_task.name)
+    else:
+        background_task.status = BackgroundTask.STATUS_DONE
+        background_task.last_error = ''
+    background_task.save(update_fields=['status', 'run_after', 'last_error', 'updated_at'])
+    return background_task.status == BackgroundTask.STATUS_DONE
+
+
+@task
+def process_post_image(model, pk):
+    """업로드 이미지 후처리 - EXIF 제거 후 파생본 생성"""
+    instance = apps.get_model(model).objects.filter(pk=pk).first()
+    if instance is None or not instance.image:
+        return
+    if strip_exif(instance, 'image'):
+        # 원본 파일 이름이 바뀌었으므로 수정 시각을 올려 이전 이름을 담은 페이지의 검증값(ETag)을 무효화
+        type(instance).objects.filter(pk=pk).update(updated_at=timezone.now())
+    update_image_variants(instance)
+
+
+def enqueue_image_processing(instance):
+    """인스턴스에 이미지가 있으면 후처리 작업을 대기열에 추가"""
+    if instance.image and instance.image_variants.get('source') != instance.image.name:
+        return enqueue(process_post_image, model=instance._meta.label, pk=instance.pk)
+    return None
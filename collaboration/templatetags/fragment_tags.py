@@ -0,0 +1,50 @@
+from django import template
+from django.core.cache.utils import make_template_fragment_key
+
+from collaboration.fragments import get_fragment_cache, get_fragment_cache_timeout
+
+register = template.Library()
+
+
+class FragmentCacheNode(template.Node):
+    def __init__(self, nodelist, fragment_name, obj, vary_on):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.obj = obj
+        self.vary_on = vary_on
+
+    def render(self, context):
+        obj = self.obj.resolve(context)
+        version = getattr(obj, 'fragment_version', None)
+        # 뷰에서 버전을 붙이지 않은 객체는 캐시하지 않음
+        if version is None:
+            return self.nodelist.render(context)
+
+        vary_on = [obj.pk, version, *(var.resolve(context) for var in self.vary_on)]
+        key = make_template_fragment_key(self.fragment_name, vary_on)
+        cache = get_fragment_cache()
+        value = cache.get(key)
+        if value is None:
+            value = self.nodelist.render(context)
+            cache.set(key, value, get_fragment_cache_timeout())
+        return value
+
+
+@register.tag
+def fragment_cache(parser, token):
+    """
+    객체 버전 기반 조각 캐시 - {% fragment_cache 'board_card' board [vary_on ...] %} ... {% endfragment_cache %}
+
+    키는 (조각 이름, 객체 id, 객체의 fragment_version, vary_on 값들).
+    """
+    bits = token.split_contents()
+    if len(bits) < 3:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' 태그에는 조각 이름과 객체가 필요합니다.")
+    nodelist = parser.parse(('endfragment_cache',))
+    parser.delete_first_token()
+    return FragmentCacheNode(
+        nodelist,
+        bits[1].strip('\'"'),
+        parser.compile_filter(bits[2]),
+        [parser.compile_filter(bit) for bit in bits[3:]],
+    )
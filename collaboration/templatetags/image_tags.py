@@ -0,0 +1,17 @@
+from django import template
+
+from collaboration.images import variant_url, variant_srcset
+
+register = template.Library()
+
+
+@register.simple_tag
+def image_variant(instance, variant='canvas', field_name='image'):
+    """용도에 맞는 파생본 URL - {% image_variant post 'card' %}"""
+    return variant_url(getattr(instance, field_name), getattr(instance, f'{field_name}_variants', None), variant)
+
+
+@register.simple_tag
+def image_srcset(instance, field_name='image'):
+    """파생본 srcset 문자열 - {% image_srcset post as srcset %}"""
+    return variant_srcset(getattr(instance, field_name), getattr(instance, f'{field_name}_variants', None))
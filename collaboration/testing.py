@@ -0,0 +1,55 @@
+"""
+테스트 도우미 - 뷰가 실행한 쿼리의 실행 계획과 쿼리 수 검사
+"""
+import re
+
+from django.db import connection
+
+from .instrumentation import collect_metrics
+
+
+# 인덱스 없이 테이블 전체를 읽는 단계 (예: "SCAN collaboration_board")
+FULL_SCAN = re.compile(r'^SCAN \S+$')
+# 정렬/GROUP BY를 위해 임시 B-트리를 만드는 단계
+TEMP_BTREE = 'USE TEMP B-TREE'
+
+
+def query_plan(sql, params=None):
+    """SQLite EXPLAIN QUERY PLAN 결과의 단계 설명 목록"""
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params or ())
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def unindexed_queries(captured_queries):
+    """
+    전체 스캔이나 임시 B-트리 정렬을 하는 SELECT 쿼리와 그 실행 계획 목록
+
+    CaptureQueriesContext.captured_queries 를 받는다. 인덱스 순서대로 읽는
+    "SCAN ... USING INDEX" 는 정렬 없이 LIMIT 만큼만 읽으므로 허용한다.
+    """
+    problems = []
+    for query in captured_queries:
+        sql = query['sql']
+        if not sql.startswith('SELECT'):
+            continue
+        plan = query_plan(sql)
+        if any(FULL_SCAN.match(step) or TEMP_BTREE in step for step in plan):
+            problems.append((sql, plan))
+    return problems
+
+
+class QueryBudgetMixin:
+    """TestCase 에 섞어 쓰는 뷰별 쿼리 예산 검사"""
+
+    def assertQueryBudget(self, url, budget, data=None):
+        """GET 요청이 budget 개 이하의 쿼리를 실행하고 N+1 패턴이 없는지 확인한 뒤 응답 반환"""
+        with collect_metrics() as metrics:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(
+            metrics.queries, budget,
+            f'{url}: 쿼리 {metrics.queries}개 (예산 {budget}개)'
+        )
+        self.assertEqual(metrics.repeated_queries(), [], f'{url}: 반복 실행된 쿼리(N+1)')
+        return response
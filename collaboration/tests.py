@@ -1,4 +1,1040 @@
-from django.test import TestCase
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import skipUnless
+from io import BytesIO, StringIO
+from importlib import import_module
 
-# Create your tests here.
+from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.testing import ApplicationCommunicator
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.templatetags.static import static
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from PIL import Image
 
+from .models import Board, Post, PostReaction, PostTombstone, Comment, BackgroundTask, MediaBlob, COLOR_GRADIENTS
+from .images import variant_srcset, variant_url
+from .realtime import InProcessBroker, board_socket, get_broker
+from .staticfiles import serve_static
+from .storage import media_storage
+from .search import SEARCH_RESULT_LIMIT, fts5_available, search_ids
+from .benchmark import BenchmarkRunner, compare_results, percentile, seed
+from .instrumentation import RequestMetrics
+from .testing import QueryBudgetMixin, query_plan, unindexed_queries
+from .tasks import claim_next_task, enqueue, run_task, task
+from .views import COMMENT_LIST_LIMIT, GALLERY_PAGE_SIZE
+from accounts.management.commands.cleanup_guests import expired_guests
+
+
+class BoardCardDataTests(TestCase):
+    """보드 카드 데이터 주석 처리 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+
+    def _create_boards(self, count):
+        for i in range(count):
+            board = Board.objects.create(title=f'보드 {i}', creator=self.user)
+            Post.objects.create(board=board, user=self.user, content=f'첫 포스트 {i}', color='blue')
+            Post.objects.create(board=board, user=self.user, content='', color='green', image=f'posts/img_{i}.png')
+
+    def _count_queries(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_card_data_matches_model_methods(self):
+        self._create_boards(1)
+        board = Board.objects.with_card_data().get()
+        plain = Board.objects.get()
+        self.assertEqual(board.post_count, 2)
+        self.assertEqual(board.get_thumbnail_url(), plain.get_thumbnail_url())
+        self.assertEqual(board.get_latest_post_text(), plain.get_latest_post_text())
+        self.assertEqual(board.get_gradient_colors(), plain.get_gradient_colors())
+        self.assertEqual(board.get_gradient_colors(), COLOR_GRADIENTS['green'])
+
+    def test_board_list_query_count_is_constant(self):
+        self._create_boards(2)
+        baseline = self._count_queries(reverse('collaboration:board_list'))
+        self._create_boards(10)
+        self.assertEqual(self._count_queries(reverse('collaboration:board_list')), baseline)
+
+    def test_profile_query_count_is_constant(self):
+        self._create_boards(2)
+        baseline = self._count_queries(reverse('accounts:profile'))
+        self._create_boards(10)
+        self.assertEqual(self._count_queries(reverse('accounts:profile')), baseline)
+
+    def test_board_list_fetches_cards_in_one_query(self):
+        self._create_boards(5)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse('collaboration:board_list'))
+        board_queries = [q for q in ctx.captured_queries if 'collaboration_post' in q['sql']]
+        self.assertEqual(len(board_queries), 1)
+
+
+class GalleryPaginationTests(TestCase):
+    """갤러리 커서 페이지네이션 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='보드', creator=self.user)
+        Post.objects.bulk_create([
+            Post(board=self.board, user=self.user, content=f'포스트 {i}')
+            for i in range(GALLERY_PAGE_SIZE * 2 + 3)
+        ])
+
+    def test_first_page_is_bounded(self):
+        response = self.client.get(reverse('collaboration:gallery'))
+        self.assertEqual(len(response.context['posts']), GALLERY_PAGE_SIZE)
+        self.assertTrue(response.context['next_cursor'])
+
+    def test_cursor_walks_all_posts_once(self):
+        response = self.client.get(reverse('collaboration:gallery'))
+        total = len(response.context['posts'])
+        cursor = response.context['next_cursor']
+        while cursor:
+            data = self.client.get(reverse('collaboration:gallery_posts'), {'cursor': cursor}).json()
+            self.assertTrue(data['success'])
+            total += data['count']
+            cursor = data['next_cursor']
+        self.assertEqual(total, Post.objects.count())
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(reverse('collaboration:gallery_posts'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_comments_load_separately(self):
+        post = Post.objects.first()
+        Comment.objects.create(post=post, author=self.user, content='댓글')
+        response = self.client.get(reverse('collaboration:comment_list', args=[post.id]))
+        self.assertEqual([c['content'] for c in response.json()['comments']], ['댓글'])
+
+    def test_comments_load_more_with_cursor(self):
+        post = Post.objects.first()
+        Comment.objects.bulk_create([
+            Comment(post=post, author=self.user, content=f'댓글 {i}') for i in range(COMMENT_LIST_LIMIT + 5)
+        ])
+        url = reverse('collaboration:comment_list', args=[post.id])
+        first = self.client.get(url).json()
+        self.assertEqual(len(first['comments']), COMMENT_LIST_LIMIT)
+        second = self.client.get(url, {'cursor': first['next_cursor']}).json()
+        self.assertEqual(len(second['comments']), 5)
+        self.assertIsNone(second['next_cursor'])
+        ids = [c['id'] for c in first['comments'] + second['comments']]
+        self.assertEqual(len(set(ids)), COMMENT_LIST_LIMIT + 5)
+
+    def test_private_board_comments_are_hidden(self):
+        owner = User.objects.create_user(username='owner', password='pw-12345')
+        board = Board.objects.create(title='비공개', creator=owner, is_public=False)
+        post = Post.objects.create(board=board, user=owner, content='비밀')
+        response = self.client.get(reverse('collaboration:comment_list', args=[post.id]))
+        self.assertEqual(response.status_code, 403)
+
+
+class PostReactionTests(TestCase):
+    """포스트 좋아요(반응 테이블) 테스트"""
+
+    def setUp(self):
+        self.owner = User.objects.create_user(username='owner', password='pw-12345')
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='공개 보드', creator=self.owner, is_public=True)
+        self.post = Post.objects.create(board=self.board, user=self.owner, content='메모')
+
+    def _like(self, post=None):
+        post = post or self.post
+        return self.client.post(reverse('collaboration:post_feedback', args=[post.id]), {'type': 'like'})
+
+    def test_like_is_counted_once_per_user(self):
+        response = self._like()
+        self.assertEqual(response.json()['likes'], 1)
+
+        response = self._like()
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['likes'], 1)
+        self.assertEqual(PostReaction.objects.filter(post=self.post).count(), 1)
+        # 중복 방지 목록을 세션에 쌓지 않음
+        self.assertNotIn('liked_posts', self.client.session)
+
+    def test_like_does_not_overwrite_concurrent_updates(self):
+        # 다른 요청이 그 사이 올린 좋아요 수를 덮어쓰지 않고 그 위에 더함
+        Post.objects.filter(pk=self.post.pk).update(likes=5)
+        response = self._like()
+        self.assertEqual(response.json()['likes'], 6)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.likes, 6)
+
+    def test_gallery_marks_liked_posts(self):
+        other = Post.objects.create(board=self.board, user=self.owner, content='다른 메모')
+        self._like()
+
+        response = self.client.get(reverse('collaboration:gallery'))
+        liked = {post.id: post.is_liked for post in response.context['posts']}
+        self.assertEqual(liked, {self.post.id: True, other.id: False})
+        self.assertContains(response, 'feedback-like-btn liked', count=1)
+
+    def test_gallery_liked_lookup_is_one_query(self):
+        Post.objects.bulk_create([
+            Post(board=self.board, user=self.owner, content=f'포스트 {i}') for i in range(5)
+        ])
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(reverse('collaboration:gallery_posts'))
+        Post.objects.bulk_create([
+            Post(board=self.board, user=self.owner, content=f'포스트 {i}') for i in range(5, 10)
+        ])
+        for post in Post.objects.all()[:8]:
+            PostReaction.objects.create(post=post, user=self.user)
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(reverse('collaboration:gallery_posts'))
+        self.assertEqual(len(few.captured_queries), len(many.captured_queries))
+
+
+class BoardLayoutTests(TestCase):
+    """보드 레이아웃 일괄 업데이트 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='보드', creator=self.user)
+        self.posts = [
+            Post.objects.create(board=self.board, user=self.user, content=f'포스트 {i}')
+            for i in range(5)
+        ]
+        self.url = reverse('collaboration:board_layout', args=[self.board.id])
+
+    def _post(self, changes):
+        return self.client.post(self.url, json.dumps(changes), content_type='application/json')
+
+    def test_applies_all_changes_in_constant_queries(self):
+        changes = [
+            {'id': post.id, 'x': 10.0 * i, 'y': 20.0 * i, 'z': 100 + i}
+            for i, post in enumerate(self.posts)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            response = self._post(changes)
+        self.assertEqual(response.json(), {'success': True, 'updated': 5})
+        writes = [q for q in ctx.captured_queries if q['sql'].startswith('UPDATE "collaboration_post"')]
+        self.assertEqual(len(writes), 1)
+        for i, post in enumerate(self.posts):
+            post.refresh_from_db()
+            self.assertEqual((post.position_x, post.position_y, post.z_index), (10.0 * i, 20.0 * i, 100 + i))
+
+    def test_rejects_whole_set_without_permission(self):
+        other = User.objects.create_user(username='other', password='pw-12345')
+        foreign = Post.objects.create(board=self.board, user=other, content='남의 포스트', position_x=1.0)
+        response = self._post([
+            {'id': self.posts[0].id, 'x': 50},
+            {'id': foreign.id, 'x': 50},
+        ])
+        self.assertEqual(response.status_code, 403)
+        self.posts[0].refresh_from_db()
+        self.assertEqual(self.posts[0].position_x, 0.0)
+
+    def test_rejects_posts_from_other_boards(self):
+        other_board = Board.objects.create(title='다른 보드', creator=self.user)
+        post = Post.objects.create(board=other_board, user=self.user, content='다른 보드 포스트')
+        response = self._post([{'id': post.id, 'x': 5}])
+        self.assertEqual(response.status_code, 404)
+
+    def test_rejects_malformed_payload(self):
+        self.assertEqual(self._post({'id': 1}).status_code, 400)
+        self.assertEqual(self._post([{'id': self.posts[0].id, 'x': 'abc'}]).status_code, 400)
+
+
+class BoardRealtimeTests(TestCase):
+    """보드 실시간 동기화 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.board = Board.objects.create(title='보드', creator=self.user)
+
+    def test_broker_delivers_only_to_board_subscribers(self):
+        async def scenario():
+            broker = InProcessBroker()
+            first = broker.subscribe(1)
+            second = broker.subscribe(2)
+            broker.publish(1, {'type': 'post.deleted'})
+            event = await asyncio.wait_for(first[1].get(), 1)
+            return event, second[1].empty()
+
+        event, other_empty = async_to_sync(scenario)()
+        self.assertEqual(event, {'type': 'post.deleted'})
+        self.assertTrue(other_empty)
+
+    def test_post_changes_are_broadcast_after_commit(self):
+        def create_post():
+            with self.captureOnCommitCallbacks(execute=True):
+                return Post.objects.create(board=self.board, user=self.user, content='새 포스트')
+
+        async def scenario():
+            broker = get_broker()
+            subscriber = broker.subscribe(self.board.id)
+            try:
+                post = await sync_to_async(create_post)()
+                event = await asyncio.wait_for(subscriber[1].get(), 1)
+            finally:
+                broker.unsubscribe(self.board.id, subscriber)
+            return post, event
+
+        post, event = async_to_sync(scenario)()
+        self.assertEqual(event['type'], 'post.created')
+        self.assertEqual(event['post']['id'], post.id)
+
+    def test_socket_rejects_private_board_for_anonymous(self):
+        private = Board.objects.create(title='비공개', creator=self.user, is_public=False)
+
+        async def scenario():
+            communicator = ApplicationCommunicator(board_socket, {
+                'type': 'websocket',
+                'path': f'/ws/collaboration/board/{private.id}/',
+                'headers': [],
+            })
+            await communicator.send_input({'type': 'websocket.connect'})
+            return await communicator.receive_output(1)
+
+        message = async_to_sync(scenario)()
+        self.assertEqual(message, {'type': 'websocket.close', 'code': 4403})
+
+
+class BoardChangesTests(TestCase):
+    """보드 변경 사항 API 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='보드', creator=self.user)
+        self.url = reverse('collaboration:board_changes', args=[self.board.id])
+
+    def _changes(self, since):
+        return self.client.get(self.url, {'since': since}).json()
+
+    def test_save_bumps_board_revision(self):
+        first = Post.objects.create(board=self.board, user=self.user, content='첫 번째')
+        second = Post.objects.create(board=self.board, user=self.user, content='두 번째')
+        self.board.refresh_from_db()
+        self.assertEqual((first.revision, second.revision, self.board.revision), (1, 2, 2))
+
+    def test_revision_bump_is_one_statement_and_rolls_back_with_the_row(self):
+        with CaptureQueriesContext(connection) as queries:
+            revision = Board.objects.next_revision(self.board.id)
+        self.assertEqual(revision, 1)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertIsNone(Board.objects.next_revision(0))
+
+        # 포스트 저장이 실패하면 리비전 증가도 함께 취소
+        with self.assertRaises(IntegrityError):
+            Post(board=self.board, user=self.user, content=None).save()
+        self.assertEqual(Board.objects.get(pk=self.board.pk).revision, 1)
+
+    def test_returns_only_changes_since_revision(self):
+        old = Post.objects.create(board=self.board, user=self.user, content='이전')
+        since = Board.objects.get(pk=self.board.pk).revision
+        new = Post.objects.create(board=self.board, user=self.user, content='새 포스트')
+        old.content = '수정됨'
+        old.save(update_fields=['content'])
+
+        data = self._changes(since)
+        self.assertEqual([post['id'] for post in data['posts']], [new.id, old.id])
+        self.assertEqual(data['revision'], since + 2)
+        self.assertEqual(self._changes(data['revision'])['posts'], [])
+
+    def test_deleted_posts_are_reported_as_tombstones(self):
+        post = Post.objects.create(board=self.board, user=self.user, content='삭제 예정')
+        since = Board.objects.get(pk=self.board.pk).revision
+        post_id = post.id
+        post.delete()
+        data = self._changes(since)
+        self.assertEqual(data['deleted'], [post_id])
+        self.assertEqual(data['posts'], [])
+
+    def test_board_delete_clears_tombstones(self):
+        Post.objects.create(board=self.board, user=self.user, content='삭제 예정').delete()
+        self.assertTrue(PostTombstone.objects.filter(board_id=self.board.id).exists())
+        board_id = self.board.id
+        self.board.delete()
+        self.assertFalse(PostTombstone.objects.filter(board_id=board_id).exists())
+
+    def test_layout_batch_shares_one_revision(self):
+        posts = [Post.objects.create(board=self.board, user=self.user, content=str(i)) for i in range(3)]
+        since = Board.objects.get(pk=self.board.pk).revision
+        self.client.post(
+            reverse('collaboration:board_layout', args=[self.board.id]),
+            json.dumps([{'id': post.id, 'x': 10} for post in posts]),
+            content_type='application/json'
+        )
+        data = self._changes(since)
+        self.assertEqual(data['revision'], since + 1)
+        self.assertEqual(len(data['posts']), 3)
+
+    def test_invalid_or_future_revision(self):
+        self.assertEqual(self.client.get(self.url, {'since': 'x'}).status_code, 400)
+        self.assertTrue(self._changes(999)['reset'])
+
+
+class PostSizeTests(TestCase):
+    """포스트 크기 컬럼 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='보드', creator=self.user)
+        self.post = Post.objects.create(board=self.board, user=self.user, content='', image='posts/a.png')
+
+    def test_resize_updates_columns_without_touching_content(self):
+        response = self.client.post(
+            reverse('collaboration:post_update', args=[self.post.id]),
+            {'width': '240', 'height': '180'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertTrue(response.json()['success'])
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.width, self.post.height, self.post.content), (240.0, 180.0, ''))
+
+    def test_layout_accepts_size_and_rotation(self):
+        self.client.post(
+            reverse('collaboration:board_layout', args=[self.board.id]),
+            json.dumps([{'id': self.post.id, 'w': 320, 'h': 200, 'r': 15}]),
+            content_type='application/json'
+        )
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.width, self.post.height, self.post.rotation), (320.0, 200.0, 15.0))
+
+    def test_layout_rejects_infinite_values(self):
+        url = reverse('collaboration:board_layout', args=[self.board.id])
+        for payload in (f'[{{"id": {self.post.id}, "z": 1e999}}]', '[{"id": 1e999, "x": 10}]'):
+            response = self.client.post(url, payload, content_type='application/json')
+            self.assertEqual(response.status_code, 400, payload)
+            self.assertFalse(response.json()['success'])
+
+    def test_layout_rejects_out_of_range_values(self):
+        url = reverse('collaboration:board_layout', args=[self.board.id])
+        payloads = (
+            f'[{{"id": {self.post.id}, "z": 1e30}}]',
+            f'[{{"id": {self.post.id}, "z": {2 ** 31}}}]',
+            f'[{{"id": {10 ** 30}, "x": 1}}]',
+            '[{"id": 1.5, "x": 1}]',
+            '[{"id": true, "x": 1}]',
+            f'[{{"id": "{self.post.id}", "x": 1}}]',
+        )
+        for payload in payloads:
+            response = self.client.post(url, payload, content_type='application/json')
+            self.assertEqual(response.status_code, 400, payload)
+            self.assertFalse(response.json()['success'])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.z_index, 1)
+
+    def test_data_migration_moves_metadata_out_of_content(self):
+        Post.objects.filter(pk=self.post.pk).update(content=json.dumps({'metadata': {'width': 120, 'height': 90}}))
+        text_post = Post.objects.create(board=self.board, user=self.user, content='{ "metadata" 라는 글자가 있는 일반 텍스트')
+        migration = import_module('collaboration.migrations.0010_move_post_size_metadata')
+        migration.move_metadata_to_columns(apps, None)
+        self.post.refresh_from_db()
+        text_post.refresh_from_db()
+        self.assertEqual((self.post.width, self.post.height, self.post.content), (120, 90, ''))
+        self.assertTrue(text_post.content.startswith('{ "metadata"'))
+
+
+class ImageVariantTests(TestCase):
+    """이미지 파생본 생성 테스트"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        # 대기열에 쌓인 작업을 워커(run_task)로 처리하는 경로를 검사
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root, TASK_QUEUE_EAGER=False)
+        self.settings_override.enable()
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='보드', creator=self.user)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def _upload(self, width, height, process=True):
+        buffer = BytesIO()
+        Image.new('RGB', (width, height), 'red').save(buffer, 'PNG')
+        response = self.client.post(reverse('collaboration:post_create'), {
+            'board_id': self.board.id,
+            'image': SimpleUploadedFile('photo.png', buffer.getvalue(), content_type='image/png'),
+        })
+        self.assertTrue(response.json()['success'])
+        if process:
+            call_command('runworker', '--once', stdout=StringIO())
+        return Post.objects.get(pk=response.json()['post']['id'])
+
+    def _variant_url(self, post, variant):
+        return post.image.storage.url(post.image_variants[variant]['name'])
+
+    def test_upload_creates_resized_variants(self):
+        post = self._upload(1000, 500)
+        widths = {name: info['width'] for name, info in post.image_variants.items() if isinstance(info, dict)}
+        self.assertEqual(widths, {'card': 400, 'canvas': 800, 'full': 1000})
+        self.assertEqual(variant_url(post.image, post.image_variants, 'card'), self._variant_url(post, 'card'))
+        self.assertEqual(variant_srcset(post.image, post.image_variants).count('w,'), 2)
+
+    def test_small_image_falls_back_to_largest_variant(self):
+        post = self._upload(200, 100)
+        self.assertEqual(set(post.image_variants) - {'source', 'width', 'largest'}, {'card'})
+        self.assertEqual(variant_url(post.image, post.image_variants, 'full'), self._variant_url(post, 'card'))
+
+    def test_board_list_thumbnail_uses_card_variant(self):
+        post = self._upload(1000, 500)
+        board = Board.objects.with_card_data().get(pk=self.board.pk)
+        self.assertEqual(board.get_thumbnail_url(), self._variant_url(post, 'card'))
+
+    def test_backfill_command_generates_missing_variants(self):
+        post = self._upload(1000, 500)
+        Post.objects.filter(pk=post.pk).update(image_variants={})
+        call_command('generate_image_variants', stdout=StringIO())
+        post.refresh_from_db()
+        self.assertEqual(post.image_variants['source'], post.image.name)
+
+    def test_stale_variants_are_ignored(self):
+        post = self._upload(1000, 500)
+        post.image = 'posts/other.png'
+        self.assertEqual(variant_url(post.image, post.image_variants, 'card'), post.image.url)
+
+
+_flaky_calls = []
+
+
+@task
+def _flaky_task(fail_times):
+    _flaky_calls.append(fail_times)
+    if len(_flaky_calls) <= fail_times:
+        raise RuntimeError('일시적 오류')
+
+
+class BackgroundTaskTests(TestCase):
+    """백그라운드 작업 대기열 테스트"""
+
+    def setUp(self):
+        _flaky_calls.clear()
+        self.media_root = tempfile.mkdtemp()
+        # 대기열에 쌓인 작업을 워커(run_task)로 처리하는 경로를 검사
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root, TASK_QUEUE_EAGER=False)
+        self.settings_override.enable()
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        self.board = Board.objects.create(title='보드', creator=self.user)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_upload_is_processed_by_worker(self):
+        buffer = BytesIO()
+        Image.new('RGB', (1000, 500), 'red').save(buffer, 'PNG')
+        response = self.client.post(reverse('collaboration:post_create'), {
+            'board_id': self.board.id,
+            'image': SimpleUploadedFile('photo.png', buffer.getvalue(), content_type='image/png'),
+        })
+        post = Post.objects.get(pk=response.json()['post']['id'])
+        # 요청 안에서는 원본만 저장하고 후처리는 대기열에 남김
+        self.assertEqual(post.image_variants, {})
+        self.assertEqual(BackgroundTask.objects.filter(status=BackgroundTask.STATUS_PENDING).count(), 1)
+
+        call_command('runworker', '--once', stdout=StringIO())
+        post.refresh_from_db()
+        self.assertEqual(post.image_variants['source'], post.image.name)
+        self.assertEqual(BackgroundTask.objects.get().status, BackgroundTask.STATUS_DONE)
+
+    def test_worker_strips_exif_from_original(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # 90도 회전
+        exif[0x010F] = 'Camera'
+        buffer = BytesIO()
+        Image.new('RGB', (300, 200), 'blue').save(buffer, 'JPEG', exif=exif)
+        response = self.client.post(reverse('collaboration:post_create'), {
+            'board_id': self.board.id,
+            'image': SimpleUploadedFile('photo.jpg', buffer.getvalue(), content_type='image/jpeg'),
+        })
+        call_command('runworker', '--once', stdout=StringIO())
+
+        post = Post.objects.get(pk=response.json()['post']['id'])
+        with post.image.open('rb') as stored, Image.open(stored) as image:
+            self.assertFalse(image.getexif())
+            self.assertEqual(image.size, (200, 300))
+
+    def test_failed_task_is_retried_with_backoff(self):
+        enqueue(_flaky_task, fail_times=1)
+        background_task = claim_next_task()
+        with self.assertLogs('collaboration.tasks', level='ERROR'):
+            self.assertFalse(run_task(background_task))
+        self.assertEqual(background_task.status, BackgroundTask.STATUS_PENDING)
+        self.assertIn('일시적 오류', background_task.last_error)
+        # 백오프 시간 전에는 다시 가져가지 않음
+        self.assertIsNone(claim_next_task())
+
+        BackgroundTask.objects.update(run_after=background_task.created_at)
+        background_task = claim_next_task()
+        self.assertEqual(background_task.attempts, 2)
+        self.assertTrue(run_task(background_task))
+        self.assertEqual(background_task.status, BackgroundTask.STATUS_DONE)
+
+    def test_task_fails_after_max_attempts(self):
+        enqueue(_flaky_task, fail_times=10)
+        for _ in range(3):
+            BackgroundTask.objects.update(run_after=BackgroundTask.objects.get().created_at)
+            with self.assertLogs('collaboration.tasks', level='ERROR'):
+                run_task(claim_next_task())
+        self.assertEqual(BackgroundTask.objects.get().status, BackgroundTask.STATUS_FAILED)
+        self.assertIsNone(claim_next_task())
+
+    @override_settings(TASK_QUEUE_EAGER=True)
+    def test_eager_mode_runs_without_worker(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            post = self._upload_without_worker()
+        post.refresh_from_db()
+        self.assertEqual(post.image_variants['source'], post.image.name)
+        self.assertFalse(BackgroundTask.objects.exists())
+
+    def _upload_without_worker(self):
+        buffer = BytesIO()
+        Image.new('RGB', (500, 500), 'red').save(buffer, 'PNG')
+        response = self.client.post(reverse('collaboration:post_create'), {
+            'board_id': self.board.id,
+            'image': SimpleUploadedFile('photo.png', buffer.getvalue(), content_type='image/png'),
+        })
+        return Post.objects.get(pk=response.json()['post']['id'])
+
+
+class MediaStorageTests(TestCase):
+    """내용 주소 기반 미디어 저장소 테스트"""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.board = Board.objects.create(title='보드', creator=self.user)
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def _attach(self, board, content=b'same bytes', name='report.txt'):
+        return Post.objects.create(
+            board=board, user=self.user,
+            attached_file=SimpleUploadedFile(name, content), attached_file_name=name
+        )
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self._attach(self.board)
+        second = self._attach(self.board, name='copy.txt')
+        self.assertEqual(first.attached_file.name, second.attached_file.name)
+        self.assertTrue(first.attached_file.name.startswith('blobs/'))
+        self.assertEqual(MediaBlob.objects.get().ref_count, 2)
+        self.assertEqual(second.attached_file_name, 'copy.txt')
+
+    def test_blob_is_deleted_with_last_reference(self):
+        other_board = Board.objects.create(title='다른 보드', creator=self.user)
+        post = self._attach(self.board)
+        self._attach(other_board)
+        name = post.attached_file.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            post.delete()
+        self.assertTrue(media_storage.exists(name))
+        self.assertEqual(MediaBlob.objects.get().ref_count, 1)
+
+        # 보드 삭제로 포스트가 함께 지워져도 참조가 해제됨 (파일은 커밋 후 삭제)
+        with self.captureOnCommitCallbacks(execute=True):
+            other_board.delete()
+        self.assertFalse(media_storage.exists(name))
+        self.assertFalse(MediaBlob.objects.exists())
+
+    def test_replacing_file_releases_previous_blob(self):
+        post = self._attach(self.board)
+        old_name = post.attached_file.name
+        post.attached_file = SimpleUploadedFile('new.txt', b'new bytes')
+        with self.captureOnCommitCallbacks(execute=True):
+            post.save(update_fields=['attached_file'])
+        self.assertFalse(media_storage.exists(old_name))
+        self.assertEqual(list(MediaBlob.objects.values_list('name', flat=True)), [post.attached_file.name])
+
+    def test_file_is_kept_when_delete_rolls_back(self):
+        post = self._attach(self.board)
+        name = post.attached_file.name
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            media_storage.delete(name)
+            raise RuntimeError
+        self.assertTrue(media_storage.exists(name))
+        self.assertEqual(MediaBlob.objects.get().ref_count, 1)
+
+        # 커밋 전에 같은 내용이 다시 등록되면 파일을 지우지 않음
+        with self.captureOnCommitCallbacks(execute=True):
+            media_storage.delete(name)
+            self._attach(self.board)
+        self.assertTrue(media_storage.exists(name))
+
+    def test_dedupe_command_moves_legacy_files(self):
+        post = self._attach(self.board)
+        FileSystemStorage().save('files/legacy.txt', ContentFile(b'same bytes'))
+        legacy = Post.objects.create(board=self.board, user=self.user)
+        Post.objects.filter(pk=legacy.pk).update(attached_file='files/legacy.txt')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command('dedupe_media', stdout=StringIO())
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.attached_file.name, post.attached_file.name)
+        self.assertEqual(MediaBlob.objects.get().ref_count, 2)
+        self.assertFalse(media_storage.exists('files/legacy.txt'))
+
+
+@override_settings(FRAGMENT_CACHE_ENABLED=True)
+class FragmentCacheTests(TestCase):
+    """보드 카드 조각 캐시 테스트"""
+
+    def setUp(self):
+        caches['default'].clear()
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.board = Board.objects.create(title='첫 제목', creator=self.user, is_public=True)
+        self.client.force_login(self.user)
+
+    def test_card_is_cached_until_board_or_post_changes(self):
+        url = reverse('collaboration:board_list')
+        self.assertContains(self.client.get(url), '첫 제목')
+
+        # 시그널 없이 바뀐 값은 캐시된 조각에 반영되지 않음
+        Board.objects.filter(pk=self.board.pk).update(title='몰래 바꾼 제목')
+        self.assertContains(self.client.get(url), '첫 제목')
+
+        self.board.title = '새 제목'
+        self.board.save()
+        self.assertContains(self.client.get(url), '새 제목')
+
+        Post.objects.create(board=self.board, user=self.user, content='메모')
+        self.assertContains(self.client.get(url), '<span>1개</span>', html=True)
+        self.assertContains(self.client.get(reverse('accounts:profile')), '1개 포스트')
+
+    def test_delete_button_is_rendered_per_user(self):
+        url = reverse('collaboration:board_list')
+        self.assertContains(self.client.get(url), 'title="보드 삭제"')
+
+        self.client.force_login(User.objects.create_user(username='other'))
+        response = self.client.get(url)
+        self.assertContains(response, '첫 제목')
+        self.assertNotContains(response, 'title="보드 삭제"')
+
+    @override_settings(FRAGMENT_CACHE_ENABLED=False)
+    def test_cards_are_rendered_uncached_when_disabled(self):
+        # 프로세스별 캐시에서는 다른 프로세스의 버전 증가를 볼 수 없으므로 캐시하지 않음
+        url = reverse('collaboration:board_list')
+        self.assertContains(self.client.get(url), '첫 제목')
+        Board.objects.filter(pk=self.board.pk).update(title='몰래 바꾼 제목')
+        self.assertContains(self.client.get(url), '몰래 바꾼 제목')
+
+
+class ConditionalGetTests(TestCase):
+    """보드 상세/갤러리 조건부 GET 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.board = Board.objects.create(title='보드', creator=self.user, is_public=True)
+        self.post = Post.objects.create(board=self.board, user=self.user, content='메모')
+        self.client.force_login(self.user)
+
+    def assertNotModified(self, url, etag):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual([template.name for template in response.templates], [])
+        return queries
+
+    def test_board_detail_revalidates_until_posts_change(self):
+        url = reverse('collaboration:board_detail', args=[self.board.id])
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('Last-Modified', response)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        queries = self.assertNotModified(url, etag)
+        # 세션/사용자 조회를 빼면 검증값 쿼리 한 번
+        self.assertEqual(len([q for q in queries.captured_queries if 'collaboration_board' in q['sql']]), 1)
+
+        self.client.post(
+            reverse('collaboration:board_layout', args=[self.board.id]),
+            json.dumps([{'id': self.post.id, 'x': 10, 'y': 20}]), content_type='application/json'
+        )
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_etag_differs_per_user(self):
+        url = reverse('collaboration:board_detail', args=[self.board.id])
+        etag = self.client.get(url)['ETag']
+        self.client.force_login(User.objects.create_user(username='other'))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_gallery_changes_with_likes_and_comments(self):
+        url = reverse('collaboration:gallery')
+        etag = self.client.get(url)['ETag']
+        self.assertNotModified(url, etag)
+
+        self.client.post(reverse('collaboration:post_feedback', args=[self.post.id]), {'type': 'like'})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        Comment.objects.create(post=self.post, author=self.user, content='댓글')
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+
+class StaticAssetTests(TestCase):
+    """보드/갤러리/게시판 CSS/JS 정적 파일 분리와 해시 이름 캐시 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.board = Board.objects.create(title='보드', creator=self.user, is_public=True)
+        self.client.force_login(self.user)
+
+        self.static_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.static_root, ignore_errors=True)
+        os.makedirs(os.path.join(self.static_root, 'css'))
+        for name in ('app.css', 'app.0123456789ab.css'):
+            with open(os.path.join(self.static_root, 'css', name), 'w') as f:
+                f.write('body {}')
+        with open(os.path.join(self.static_root, 'staticfiles.json'), 'w') as f:
+            json.dump({'paths': {'css/app.css': 'css/app.0123456789ab.css'}, 'version': '1.1', 'hash': 'abc'}, f)
+
+    def test_pages_have_no_inline_css_or_js(self):
+        pages = [
+            (reverse('collaboration:board_detail', args=[self.board.id]), 'css/collaboration/board_detail.css', 'js/collaboration/board_detail.js'),
+            (reverse('collaboration:gallery'), 'css/collaboration/gallery.css', 'js/collaboration/gallery.js'),
+            (reverse('collaboration:board_list'), 'css/collaboration/board_list.css', 'js/collaboration/board_list.js'),
+            (reverse('forum:post_list'), 'css/forum/post_list.css', 'js/forum/post_list.js'),
+        ]
+        for url, css, js in pages:
+            content = self.client.get(url).content.decode()
+            # base.html 의 공통 스타일 블록만 남음
+            self.assertEqual(content.count('<style>'), 1, url)
+            self.assertNotIn('<script>', content, url)
+            self.assertIn(f'href="{static(css)}"', content, url)
+            self.assertIn(f'src="{static(js)}"', content, url)
+
+    def test_board_detail_passes_values_as_json(self):
+        response = self.client.get(reverse('collaboration:board_detail', args=[self.board.id]))
+        config = json.loads(response.content.decode().split('id="board-config" type="application/json">')[1].split('</script>')[0])
+        self.assertEqual(config['boardId'], self.board.id)
+        self.assertEqual(config['revision'], self.board.revision)
+        self.assertEqual(config['currentUserId'], self.user.id)
+        self.assertFalse(config['isSuperuser'])
+        self.assertEqual(config['defaultColor'], 'yellow')
+        self.assertEqual(config['urls']['layout'], reverse('collaboration:board_layout', args=[self.board.id]))
+        self.assertTrue(config['csrfToken'])
+
+    def test_static_urls_use_hashed_names_from_manifest(self):
+        with override_settings(STATIC_ROOT=self.static_root):
+            self.assertEqual(static('css/app.css'), '/static/css/app.0123456789ab.css')
+            # 수집되지 않은 파일은 원래 이름
+            self.assertEqual(static('css/missing.css'), '/static/css/missing.css')
+
+    def test_hashed_files_are_served_immutable(self):
+        factory = RequestFactory()
+        with override_settings(STATIC_ROOT=self.static_root):
+            response = serve_static(factory.get('/static/css/app.0123456789ab.css'), 'css/app.0123456789ab.css')
+            self.assertIn('immutable', response['Cache-Control'])
+            self.assertIn('max-age=31536000', response['Cache-Control'])
+
+            response = serve_static(factory.get('/static/css/app.css'), 'css/app.css')
+            self.assertIn('no-cache', response['Cache-Control'])
+            self.assertNotIn('immutable', response['Cache-Control'])
+
+
+class BoardSearchTests(TestCase):
+    """보드 포스트/댓글 검색 테스트"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.other = User.objects.create_user(username='other', password='pw-12345')
+        self.client.force_login(self.user)
+
+    def test_search_returns_visible_posts_and_comments(self):
+        public = Board.objects.create(title='공개', creator=self.other, is_public=True)
+        private = Board.objects.create(title='비공개', creator=self.other, is_public=False)
+        post = Post.objects.create(board=public, user=self.other, content='회의록 정리')
+        Post.objects.create(board=private, user=self.other, content='회의록 비밀')
+        Comment.objects.create(post=post, author=self.user, content='다음 회의는 언제인가요')
+
+        data = self.client.get(reverse('collaboration:search'), {'q': '회의'}).json()
+        self.assertEqual([item['id'] for item in data['posts']], [post.id])
+        self.assertEqual([item['post_id'] for item in data['comments']], [post.id])
+
+    def test_hidden_matches_do_not_crowd_out_visible_results(self):
+        if not fts5_available():
+            self.skipTest('FTS5를 지원하지 않는 데이터베이스')
+        private = Board.objects.create(title='비공개', creator=self.other, is_public=False)
+        hidden = Post.objects.bulk_create([
+            Post(board=private, user=self.other, content='회의 회의 회의') for _ in range(SEARCH_RESULT_LIMIT + 1)
+        ])
+        Comment.objects.bulk_create([
+            Comment(post=post, author=self.other, content='회의 회의 회의') for post in hidden
+        ])
+        public = Board.objects.create(title='공개', creator=self.other, is_public=True)
+        post = Post.objects.create(board=public, user=self.other, content='다음 주 회의 안건과 준비물 정리')
+        Comment.objects.create(post=post, author=self.user, content='지난번 회의 때 나온 이야기도 포함해 주세요')
+        # 비공개 보드의 일치 결과가 순위 상위를 모두 차지
+        self.assertNotIn(post.id, search_ids('collaboration_post_fts', '회의'))
+
+        data = self.client.get(reverse('collaboration:search'), {'q': '회의'}).json()
+        self.assertEqual([item['id'] for item in data['posts']], [post.id])
+        self.assertEqual([item['post_id'] for item in data['comments']], [post.id])
+
+
+class SqliteSettingsTests(TestCase):
+    """SQLite 연결 설정(PRAGMA) 테스트"""
+
+    def test_pragmas_are_applied_to_connections(self):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS['busy_timeout'])
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+
+    def test_write_benchmark_compares_profiles(self):
+        out = StringIO()
+        call_command(
+            'benchmark_sqlite_writes', '--seconds', '0.3', '--writers', '2', '--readers', '1', '--posts', '10',
+            stdout=out
+        )
+        self.assertIn('default', out.getvalue())
+        self.assertIn('tuned', out.getvalue())
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite 실행 계획 검사')
+class QueryPlanTests(TestCase):
+    """주요 화면 쿼리가 인덱스를 사용하는지 (전체 스캔/임시 B-트리 정렬 없음) 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        other = User.objects.create_user(username='other', password='pw-12345')
+        self.client.force_login(self.user)
+        for index in range(4):
+            board = Board.objects.create(title=f'보드 {index}', creator=self.user if index % 2 else other)
+            posts = Post.objects.bulk_create([
+                Post(board=board, user=self.user, content=f'포스트 {i}') for i in range(GALLERY_PAGE_SIZE)
+            ])
+            Comment.objects.create(post=posts[0], author=other, content='댓글')
+        self.board = board
+
+    def assertIndexedQueries(self, url, data=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(unindexed_queries(queries.captured_queries), [])
+        return response
+
+    def test_board_list(self):
+        self.assertIndexedQueries(reverse('collaboration:board_list'))
+
+    def test_profile(self):
+        self.assertIndexedQueries(reverse('accounts:profile'))
+
+    def test_board_detail(self):
+        self.assertIndexedQueries(reverse('collaboration:board_detail', args=[self.board.id]))
+
+    def test_gallery_pages(self):
+        response = self.assertIndexedQueries(reverse('collaboration:gallery'))
+        self.assertIndexedQueries(reverse('collaboration:gallery_posts'), {'cursor': response.context['next_cursor']})
+
+    def test_guest_cleanup_selection(self):
+        guests = expired_guests(timezone.now() - timedelta(hours=24))
+        sql, params = guests.values('id').query.sql_with_params()
+        self.assertIn('accounts_user_joined_idx', ' '.join(query_plan(sql, params)))
+
+
+class QueryBudgetTests(QueryBudgetMixin, TestCase):
+    """화면별 쿼리 예산 - 데이터가 늘어도 쿼리 수가 그대로인지 확인"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='tester', password='pw-12345')
+        self.client.force_login(self.user)
+        authors = [User.objects.create_user(username=f'author{i}', password='pw-12345') for i in range(6)]
+        for index, author in enumerate(authors):
+            board = Board.objects.create(title=f'보드 {index}', creator=author)
+            posts = Post.objects.bulk_create([
+                Post(board=board, user=writer, content=f'포스트 {i}') for i, writer in enumerate(authors)
+            ])
+            Comment.objects.bulk_create([Comment(post=post, author=author, content='댓글') for post in posts])
+        self.board = board
+
+    def test_board_list(self):
+        self.assertQueryBudget(reverse('collaboration:board_list'), 3)
+
+    def test_gallery(self):
+        self.assertQueryBudget(reverse('collaboration:gallery'), 4)
+
+    def test_board_detail(self):
+        # 세션 조회 포함 (공유 캐시가 없으면 DB 세션)
+        self.assertQueryBudget(reverse('collaboration:board_detail', args=[self.board.id]), 5)
+
+
+class RequestMetricsTests(TestCase):
+    """요청별 성능 계측 미들웨어 테스트"""
+
+    def test_repeated_queries_are_flagged(self):
+        metrics = RequestMetrics()
+        for user_id in range(5):
+            metrics.record_query('SELECT * FROM auth_user WHERE id = %s', (user_id,), 0.001)
+        for _ in range(5):
+            metrics.record_query('SELECT 1', (), 0.001)
+        self.assertEqual(metrics.queries, 10)
+        self.assertEqual(metrics.repeated_queries(), [('SELECT * FROM auth_user WHERE id = %s', 5)])
+
+    @override_settings(REQUEST_METRICS_ENABLED=True)
+    def test_middleware_adds_server_timing_and_log(self):
+        with self.assertLogs('collaboration.instrumentation', 'INFO') as logs:
+            response = self.client.get(reverse('collaboration:gallery'))
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('tpl;dur=', response['Server-Timing'])
+        record = json.loads(logs.records[0].getMessage().split(' ', 1)[1])
+        self.assertEqual(record['path'], reverse('collaboration:gallery'))
+        self.assertGreater(record['template_ms'], 0)
+        self.assertEqual(record['response_bytes'], len(response.content))
+        self.assertEqual(record['n_plus_one'], [])
+
+    def test_middleware_is_off_by_default(self):
+        response = self.client.get(reverse('collaboration:gallery'))
+        self.assertNotIn('Server-Timing', response)
+
+
+class BenchmarkTests(TestCase):
+    """벤치마크 데이터 생성/시나리오 실행 테스트"""
+
+    def test_all_scenarios_run_without_errors(self):
+        users = seed({
+            'users': 3, 'boards': 3, 'posts_per_board': 4, 'comments_per_post': 1,
+            'forum_posts': 6, 'comments_per_forum_post': 1,
+        })
+        self.assertEqual(Post.objects.count(), 12)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            results = BenchmarkRunner(users[0]).run(requests=2, warmup=0)
+        self.assertEqual(set(results), set(BenchmarkRunner.SCENARIOS))
+        for name, result in results.items():
+            self.assertEqual(result['errors'], 0, name)
+            self.assertGreater(result['queries_mean'], 0, name)
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+
+    def test_percentile_and_compare(self):
+        self.assertEqual(percentile(list(range(1, 101)), 95), 95)
+        previous = {'results': {'gallery': {'p95_ms': 10.0, 'queries_mean': 4.0}}}
+        current = {'results': {'gallery': {'p95_ms': 15.0, 'queries_mean': 5.0}, 'new': {'p95_ms': 1.0}}}
+        self.assertEqual(compare_results(previous, current), [('gallery', 50.0, 1.0)])
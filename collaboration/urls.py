@@ -8,11 +8,16 @@ urlpatterns = [
     path('board/<int:board_id>/', views.board_detail, name='board_detail'),
     path('board/create/', views.board_create, name='board_create'),
     path('board/<int:board_id>/delete/', views.board_delete, name='board_delete'),
+    path('board/<int:board_id>/layout/', views.board_layout, name='board_layout'),
+    path('board/<int:board_id>/changes/', views.board_changes, name='board_changes'),
     path('post/create/', views.post_create, name='post_create'),
     path('post/<int:post_id>/update/', views.post_update, name='post_update'),
     path('post/<int:post_id>/delete/', views.post_delete, name='post_delete'),
     path('post/<int:post_id>/feedback/', views.post_feedback, name='post_feedback'),
     path('post/<int:post_id>/comment/create/', views.comment_create, name='comment_create'),
+    path('post/<int:post_id>/comments/', views.comment_list, name='comment_list'),
     path('gallery/', views.gallery, name='gallery'),
+    path('gallery/posts/', views.gallery_posts, name='gallery_posts'),
+    path('search/', views.search, name='search'),
 ]
 
@@ -1,12 +1,26 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.http import HttpResponse, JsonResponse, HttpResponseForbidden
 from django.conf import settings
+from django.middleware.csrf import get_token
+from django.urls import reverse
+from django.template.loader import render_to_string
+from django.utils import timezone
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.http import require_POST
-from django.db.models import Q
-from math import isnan
-from .models import Board, Post, Comment
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from math import isnan, isfinite
+import json
+from .models import Board, Post, PostReaction, PostTombstone, Comment, visible_boards_q
 from .forms import BoardForm, PostForm
+from .conditional import conditional_page
+from .fragments import attach_versions
+from .images import variant_url
+from .pagination import keyset_page
+from .search import match_ids_query, order_by_ids, search_ids
+from .tasks import enqueue_image_processing
+from .realtime import publish_board_event, post_payload
 
 
 def index(request):
@@ -16,14 +30,10 @@ def index(request):
 
 def board_list(request):
     """보드 목록 조회 - 로그인한 사용자는 자신의 보드와 공개 보드, 비로그인 사용자는 공개 보드만"""
-    if request.user.is_authenticated:
-        # 로그인한 사용자: 공개 보드 또는 자신이 만든 보드
-        boards = Board.objects.filter(
-            Q(is_public=True) | Q(creator=request.user)
-        ).order_by('-created_at')
-    else:
-        # 비로그인 사용자: 공개 보드만
-        boards = Board.objects.filter(is_public=True).order_by('-created_at')
+    # 썸네일/색상/포스트 수를 보드마다 따로 조회하지 않도록 한 번에 주석 처리
+    boards = Board.objects.visible_to(request.user).with_card_data().order_by('-created_at')
+    # 카드 조각 캐시 버전
+    boards = attach_versions('board', boards)
     
     context = {
         'boards': boards
@@ -31,27 +41,107 @@ def board_list(request):
     return render(request, 'collaboration/board_list.html', context)
 
 
+# 갤러리 한 페이지에 표시할 포스트 수
+GALLERY_PAGE_SIZE = 24
+
+# 댓글 목록 API 한 페이지의 댓글 수 (이전 댓글은 커서로 이어서 조회)
+COMMENT_LIST_LIMIT = 50
+
+# 검색 결과 종류별 최대 개수
+SEARCH_PAGE_SIZE = 20
+
+
+def _gallery_page(request, cursor=None):
+    """갤러리 포스트 한 페이지와 다음 페이지 커서 반환 (키셋 페이지네이션)"""
+    comment_counts = Comment.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(
+        total=Count('*')
+    ).values('total')
+    posts = (
+        Post.objects.filter(visible_boards_q(request.user, 'board__'))
+        .select_related('user', 'board')
+        .annotate(comment_count=Coalesce(Subquery(comment_counts), 0))
+    )
+    page, next_cursor = keyset_page(posts, cursor, GALLERY_PAGE_SIZE)
+    _mark_liked_posts(request.user, page)
+    return page, next_cursor
+
+
+def _mark_liked_posts(user, posts):
+    """현재 사용자가 좋아요를 누른 포스트에 is_liked 표시 - 페이지의 포스트 ID 집합으로 한 번만 조회"""
+    liked_ids = set()
+    if user.is_authenticated and user.pk is not None and posts:
+        liked_ids = set(
+            PostReaction.objects.filter(
+                user=user, kind=PostReaction.KIND_LIKE, post_id__in=[post.id for post in posts]
+            ).values_list('post_id', flat=True)
+        )
+    for post in posts:
+        post.is_liked = post.id in liked_ids
+
+
+def _gallery_validators(request):
+    """
+    갤러리 검증값 - 첫 페이지 포스트의 수정 시각/좋아요/댓글 수와 다음 페이지 커서
+
+    페이지 조회 결과를 요청에 담아 두어 200 응답일 때 뷰가 다시 조회하지 않는다.
+    """
+    posts, next_cursor = request.gallery_page = _gallery_page(request)
+    last_modified = max((post.updated_at for post in posts), default=None)
+    return last_modified, (next_cursor, *(
+        (post.id, post.updated_at, post.likes, post.comment_count, post.is_liked) for post in posts
+    ))
+
+
+@conditional_page(_gallery_validators)
 def gallery(request):
     """갤러리 - 공개 보드만 최신순으로 표시 (작성자는 자신의 비공개 보드도 볼 수 있음)"""
-    if request.user.is_authenticated:
-        # 로그인한 사용자: 공개 보드 또는 자신이 만든 보드
-        boards = Board.objects.filter(
-            Q(is_public=True) | Q(creator=request.user)
-        ).order_by('-created_at')
-    else:
-        # 비로그인 사용자: 공개 보드만
-        boards = Board.objects.filter(is_public=True).order_by('-created_at')
-    
-    # 각 보드의 모든 포스트를 가져와서 컨텍스트에 포함
-    posts = Post.objects.filter(board__in=boards).select_related('user', 'board').prefetch_related('comments')
+    posts, next_cursor = getattr(request, 'gallery_page', None) or _gallery_page(request)
     
     context = {
-        'boards': boards,
-        'posts': posts
+        'posts': posts,
+        'next_cursor': next_cursor
     }
     return render(request, 'collaboration/gallery.html', context)
 
 
+def gallery_posts(request):
+    """갤러리 다음 페이지 - 무한 스크롤용 JSON 응답"""
+    try:
+        posts, next_cursor = _gallery_page(request, request.GET.get('cursor'))
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    html = render_to_string(
+        'collaboration/gallery_cards.html',
+        {'posts': posts},
+        request=request
+    )
+    return JsonResponse({
+        'success': True,
+        'html': html,
+        'count': len(posts),
+        'next_cursor': next_cursor
+    })
+
+
+def _board_detail_validators(request, board_id):
+    """
+    보드 상세 검증값 - 보드 리비전/수정 시각과 포스트의 마지막 수정 시각/개수 (쿼리 한 번)
+
+    포스트 이동(bulk_update)과 삭제는 보드 리비전과 수정 시각을 올린다.
+    """
+    # GROUP BY 없이 상관 서브쿼리로 집계해 보드 한 행만 읽음
+    board_posts = Post.objects.filter(board=OuterRef('pk')).order_by().values('board')
+    row = Board.objects.filter(pk=board_id).annotate(
+        last_post=Subquery(board_posts.annotate(last=Max('updated_at')).values('last')),
+        post_total=Subquery(board_posts.annotate(total=Count('*')).values('total')),
+    ).values_list('updated_at', 'revision', 'last_post', 'post_total').first()
+    if row is None:
+        return None
+    return max(filter(None, (row[0], row[2]))), row
+
+
+@conditional_page(_board_detail_validators)
 def board_detail(request, board_id):
     """보드 상세 페이지"""
     board = get_object_or_404(Board, id=board_id)
@@ -61,18 +151,67 @@ def board_detail(request, board_id):
         if not request.user.is_authenticated or board.creator != request.user:
             return HttpResponseForbidden("이 보드에 접근할 권한이 없습니다.")
     
-    posts = Post.objects.filter(board=board)
+    # 템플릿이 포스트마다 작성자를 표시하므로 함께 조회
+    posts = Post.objects.filter(board=board).select_related('user')
     post_form = PostForm()
     
+    # board_detail.js 는 모두에게 같은 정적 파일이므로 보드/사용자별 값은 JSON 블록으로 전달
+    board_config = {
+        'boardId': board.id,
+        'revision': board.revision,
+        'currentUserId': request.user.pk,
+        'isSuperuser': request.user.is_superuser,
+        'csrfToken': get_token(request),
+        'defaultColor': Post.COLOR_CHOICES[0][0],
+        'urls': {
+            'postCreate': reverse('collaboration:post_create'),
+            'layout': reverse('collaboration:board_layout', args=[board.id]),
+            'changes': reverse('collaboration:board_changes', args=[board.id]),
+        },
+    }
+    
     context = {
         'board': board,
         'posts': posts,
         'post_form': post_form,
-        'color_choices': Post.COLOR_CHOICES
+        'color_choices': Post.COLOR_CHOICES,
+        'board_config': board_config,
     }
     return render(request, 'collaboration/board_detail.html', context)
 
 
+def board_changes(request, board_id):
+    """보드 변경 사항 조회 - since 리비전 이후 생성/수정/삭제된 포스트만 반환"""
+    board = get_object_or_404(Board, id=board_id)
+    
+    # 비공개 보드는 작성자만 접근 가능
+    if not board.is_public:
+        if not request.user.is_authenticated or board.creator_id != request.user.id:
+            return JsonResponse({'success': False, 'message': '이 보드에 접근할 권한이 없습니다.'}, status=403)
+    
+    try:
+        since = int(request.GET.get('since', 0))
+        if since < 0:
+            raise ValueError
+    except (ValueError, TypeError):
+        return JsonResponse({'success': False, 'message': 'since 값이 올바르지 않습니다.'}, status=400)
+    
+    # 클라이언트 리비전이 서버보다 앞서면 (보드 재생성 등) 전체 새로고침 필요
+    if since > board.revision:
+        return JsonResponse({'success': True, 'reset': True, 'revision': board.revision})
+    
+    posts = Post.objects.filter(board=board, revision__gt=since).order_by('revision')
+    deleted = PostTombstone.objects.filter(board_id=board.id, revision__gt=since).values_list('post_id', flat=True)
+    
+    return JsonResponse({
+        'success': True,
+        'reset': False,
+        'revision': board.revision,
+        'posts': [post_payload(post) for post in posts],
+        'deleted': list(deleted)
+    })
+
+
 @login_required
 def board_create(request):
     """새 보드 생성"""
@@ -179,6 +318,9 @@ def post_create(request):
         # 6. 저장
         post.save()
         
+        # 7. 이미지 후처리(EXIF 제거, 파생본 생성)는 워커에서 처리
+        enqueue_image_processing(post)
+        
         # 응답 데이터 준비
         response_data = {
             'success': True,
@@ -190,13 +332,13 @@ def post_create(request):
                 'position_x': post.position_x,
                 'position_y': post.position_y,
                 'z_index': post.z_index,
-                'image_url': post.image.url if post.image else None
+                'image_url': variant_url(post.image, post.image_variants, 'canvas') or None
             }
         }
         
         # 캔버스 이미지인 경우 추가 정보 포함
         if post.image:
-            response_data['image_url'] = post.image.url
+            response_data['image_url'] = response_data['post']['image_url']
             response_data['post_id'] = post.id
         
         return JsonResponse(response_data, status=200)
@@ -225,9 +367,10 @@ def post_update(request, post_id):
                 try:
                     post.image = request.FILES['image']
                     post.save(update_fields=['image'])  # 명시적으로 image 필드만 업데이트
+                    enqueue_image_processing(post)
                     
                     # 이미지 URL이 제대로 생성되는지 확인
-                    image_url = post.image.url if post.image else None
+                    image_url = variant_url(post.image, post.image_variants, 'canvas') or None
                     if not image_url:
                         return JsonResponse({
                             'success': False,
@@ -250,11 +393,12 @@ def post_update(request, post_id):
             if 'attached_file' in request.FILES:
                 try:
                     post.attached_file = request.FILES['attached_file']
-                    post.save(update_fields=['attached_file'])
+                    post.attached_file_name = request.FILES['attached_file'].name
+                    post.save(update_fields=['attached_file', 'attached_file_name'])
                     return JsonResponse({
                         'success': True,
                         'file_url': post.attached_file.url if post.attached_file else None,
-                        'file_name': post.attached_file.name.split('/')[-1] if post.attached_file else None
+                        'file_name': post.attached_file_name if post.attached_file else None
                     })
                 except Exception as e:
                     return JsonResponse({
@@ -286,24 +430,15 @@ def post_update(request, post_id):
                 try:
                     width = float(request.POST.get('width'))
                     height = float(request.POST.get('height'))
-                    # width와 height를 content에 JSON 형태로 저장 (임시 방법)
-                    # 나중에 모델 필드를 추가할 수 있음
-                    import json
-                    metadata = {}
-                    try:
-                        if post.content and post.content.startswith('{') and 'metadata' in post.content:
-                            metadata = json.loads(post.content).get('metadata', {})
-                    except:
-                        pass
-                    metadata['width'] = width
-                    metadata['height'] = height
-                    # content가 비어있으면 metadata만 저장, 아니면 기존 content 유지
-                    if not post.content or post.content.strip() == '':
-                        post.content = json.dumps({'metadata': metadata})
-                        post.save(update_fields=['content'])
-                    else:
-                        # content가 있으면 metadata를 저장하지 않음 (포스트잇의 텍스트 보호)
-                        pass
+                    if not (isfinite(width) and isfinite(height)):
+                        raise ValueError('크기 값이 올바르지 않습니다.')
+                    # save()를 거치지 않으므로 리비전과 실시간 이벤트를 직접 처리 (리비전 증가와 저장은 한 트랜잭션)
+                    with transaction.atomic():
+                        revision = Board.objects.next_revision(post.board_id)
+                        Post.objects.filter(pk=post.pk).update(width=width, height=height, revision=revision)
+                    publish_board_event(post.board_id, 'layout.changed', revision=revision, changes=[
+                        {'id': post.id, 'w': width, 'h': height}
+                    ])
                     return JsonResponse({
                         'success': True
                     })
@@ -343,15 +478,127 @@ def post_update(request, post_id):
                         'position_x': post.position_x,
                         'position_y': post.position_y,
                         'z_index': post.z_index,
-                        'image_url': post.image.url if post.image else None,
+                        'image_url': variant_url(post.image, post.image_variants, 'canvas') or None,
                         'file_url': post.attached_file.url if post.attached_file else None,
-                        'file_name': post.attached_file.name.split('/')[-1] if post.attached_file else None
+                        'file_name': post.attached_file_name if post.attached_file else None
                     }
                 })
     
     return JsonResponse({'success': False}, status=400)
 
 
+# 레이아웃 변경 항목의 키별 변환 함수
+LAYOUT_CONVERTERS = {
+    'x': float,
+    'y': float,
+    'z': int,
+    'w': float,
+    'h': float,
+    'r': float,
+}
+
+# 레이아웃 변경 항목의 키와 Post 필드 매핑
+LAYOUT_FIELDS = {
+    'x': 'position_x',
+    'y': 'position_y',
+    'z': 'z_index',
+    'w': 'width',
+    'h': 'height',
+    'r': 'rotation',
+}
+
+# 한 번의 레이아웃 요청에서 허용하는 최대 변경 수
+LAYOUT_MAX_CHANGES = 500
+
+# id 는 DB 정수 컬럼(부호 있는 64비트), z 는 IntegerField(부호 있는 32비트) 범위 안이어야 함
+LAYOUT_ID_RANGE = (-2 ** 63, 2 ** 63 - 1)
+LAYOUT_Z_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+
+def _in_range(value, bounds):
+    low, high = bounds
+    return low <= value <= high
+
+
+def _parse_layout_changes(body):
+    """
+    레이아웃 변경 JSON 배열을 {post_id: {key: value}} 형태로 변환
+
+    잘못된 값은 ValueError/TypeError, 정수로 바꿀 수 없는 무한대(예: 1e999)는 OverflowError.
+    id 는 정수(bool 제외)만 받고, id/z 가 DB 정수 범위를 벗어나면 ValueError.
+    """
+    changes = json.loads(body)
+    if not isinstance(changes, list):
+        raise ValueError('변경 목록은 배열이어야 합니다.')
+    if len(changes) > LAYOUT_MAX_CHANGES:
+        raise ValueError(f'한 번에 최대 {LAYOUT_MAX_CHANGES}개까지 변경할 수 있습니다.')
+    
+    parsed = {}
+    for change in changes:
+        if not isinstance(change, dict) or 'id' not in change:
+            raise ValueError('각 변경 항목에는 id가 필요합니다.')
+        post_id = change['id']
+        if not isinstance(post_id, int) or isinstance(post_id, bool) or not _in_range(post_id, LAYOUT_ID_RANGE):
+            raise ValueError('id 값이 올바르지 않습니다.')
+        values = parsed.setdefault(post_id, {})
+        for key, convert in LAYOUT_CONVERTERS.items():
+            if change.get(key) is None:
+                continue
+            value = convert(change[key])
+            if isinstance(value, float) and not isfinite(value):
+                raise ValueError(f'{key} 값이 올바르지 않습니다.')
+            if key == 'z' and not _in_range(value, LAYOUT_Z_RANGE):
+                raise ValueError(f'{key} 값이 올바르지 않습니다.')
+            # 같은 포스트의 변경이 여러 번 오면 마지막 값 사용
+            values[key] = value
+    return parsed
+
+
+@require_POST
+def board_layout(request, board_id):
+    """보드 레이아웃 일괄 업데이트 - 위치/레이어/크기 변경을 한 트랜잭션으로 저장"""
+    board = get_object_or_404(Board, id=board_id)
+    
+    if not request.user.is_authenticated:
+        return JsonResponse({'success': False, 'message': '로그인이 필요합니다.'}, status=403)
+    
+    try:
+        changes = _parse_layout_changes(request.body)
+    except (ValueError, TypeError, OverflowError) as e:
+        return JsonResponse({'success': False, 'message': f'레이아웃 업데이트 실패: {str(e)}'}, status=400)
+    
+    if not changes:
+        return JsonResponse({'success': True, 'updated': 0})
+    
+    with transaction.atomic():
+        posts = list(Post.objects.select_for_update().filter(board=board, id__in=changes.keys()))
+        if len(posts) != len(changes):
+            return JsonResponse({'success': False, 'message': '보드에 없는 포스트가 포함되어 있습니다.'}, status=404)
+        
+        # 작성자 또는 관리자만 수정 가능 (하나라도 권한이 없으면 전체 거부)
+        if not request.user.is_superuser and any(post.user_id != request.user.id for post in posts):
+            return JsonResponse({'success': False, 'message': '수정 권한이 없습니다.'}, status=403)
+        
+        revision = Board.objects.next_revision(board.id)
+        update_fields = {'revision'}
+        for post in posts:
+            post.revision = revision
+            values = changes[post.id]
+            for key, field_name in LAYOUT_FIELDS.items():
+                if key in values:
+                    setattr(post, field_name, values[key])
+                    update_fields.add(field_name)
+        
+        Post.objects.bulk_update(posts, sorted(update_fields))
+    
+    # bulk_update는 시그널을 보내지 않으므로 직접 발행
+    publish_board_event(board.id, 'layout.changed', revision=revision, changes=[
+        {'id': post_id, **values} for post_id, values in changes.items()
+    ])
+    
+    return JsonResponse({'success': True, 'updated': len(posts)})
+
+
 @login_required
 def board_delete(request, board_id):
     """보드 삭제 (작성자 또는 관리자만 가능)"""
@@ -415,13 +662,13 @@ def post_feedback(request, post_id):
             'message': '잘못된 피드백 타입입니다.'
         }, status=400)
     
-    # 세션을 사용하여 중복 클릭 방지
-    session_key = 'liked_posts'
-    liked_posts = request.session.get(session_key, [])
-    
-    # post_id를 문자열로 변환하여 비교
-    post_id_str = str(post_id)
-    if post_id_str in liked_posts:
+    # 반응 행의 유니크 제약으로 중복을 막고, 카운터는 한 문장으로 증가시켜 동시 요청에도 값이 유실되지 않음
+    try:
+        with transaction.atomic():
+            PostReaction.objects.create(post=post, user=request.user, kind=PostReaction.KIND_LIKE)
+            Post.objects.filter(pk=post.pk).update(likes=F('likes') + 1)
+    except IntegrityError:
+        post.refresh_from_db(fields=['likes', 'dislikes'])
         return JsonResponse({
             'success': False,
             'message': '이미 좋아요를 누르셨습니다.',
@@ -429,14 +676,10 @@ def post_feedback(request, post_id):
             'dislikes': post.dislikes
         }, status=400)
     
-    # 좋아요 증가
-    post.likes += 1
-    post.save(update_fields=['likes'])
-    
-    # 세션에 추가 (문자열로 저장)
-    liked_posts.append(post_id_str)
-    request.session[session_key] = liked_posts
+    # 이전 방식의 세션 중복 방지 목록 정리
+    request.session.pop('liked_posts', None)
     
+    post.refresh_from_db(fields=['likes', 'dislikes'])
     return JsonResponse({
         'success': True,
         'likes': post.likes,
@@ -480,3 +723,80 @@ def comment_create(request, post_id):
         }
     })
 
+
+
+def comment_list(request, post_id):
+    """댓글 목록 조회 - 갤러리 카드를 열 때 AJAX로 불러오고, cursor 로 이전 댓글을 이어서 불러옴"""
+    post = get_object_or_404(Post.objects.select_related('board'), id=post_id)
+    
+    # 비공개 보드의 댓글은 작성자만 조회 가능
+    if not Board.objects.visible_to(request.user).filter(id=post.board_id).exists():
+        return JsonResponse({'success': False, 'message': '접근 권한이 없습니다.'}, status=403)
+    
+    try:
+        comments, next_cursor = keyset_page(
+            post.comments.select_related('author'), request.GET.get('cursor'), COMMENT_LIST_LIMIT
+        )
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    return JsonResponse({
+        'success': True,
+        'next_cursor': next_cursor,
+        'comments': [
+            {
+                'id': comment.id,
+                'content': comment.content,
+                'author': comment.author.username,
+                'created_at': timezone.localtime(comment.created_at).strftime('%m-%d %H:%M')
+            }
+            for comment in comments
+        ]
+    })
+
+
+def search(request):
+    """보드 포스트/댓글 검색 - 볼 수 있는 보드의 결과만 검색 순위대로 반환"""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'success': True, 'posts': [], 'comments': []})
+    
+    boards = Board.objects.visible_to(request.user)
+    posts = Post.objects.filter(board__in=boards).select_related('board')
+    comments = Comment.objects.filter(post__board__in=boards).select_related('author', 'post')
+    
+    # 순위(상위 SEARCH_RESULT_LIMIT 개)는 정렬에만 쓰고, 일치 조건은 볼 수 있는 보드 안에서 전체 색인으로 확인
+    # (다른 사용자의 비공개 보드 결과가 순위를 채워도 볼 수 있는 결과가 빠지지 않음)
+    post_ids = search_ids('collaboration_post_fts', query)
+    comment_ids = search_ids('collaboration_comment_fts', query)
+    if post_ids is None:
+        posts = posts.filter(content__icontains=query).order_by('-created_at')
+        comments = comments.filter(content__icontains=query).order_by('-created_at')
+    else:
+        posts = order_by_ids(posts.filter(pk__in=match_ids_query('collaboration_post_fts', query)), post_ids)
+        comments = order_by_ids(
+            comments.filter(pk__in=match_ids_query('collaboration_comment_fts', query)), comment_ids
+        )
+    
+    return JsonResponse({
+        'success': True,
+        'posts': [
+            {
+                'id': post.id,
+                'board_id': post.board_id,
+                'board_title': post.board.title,
+                'content': post.content[:200],
+            }
+            for post in posts[:SEARCH_PAGE_SIZE]
+        ],
+        'comments': [
+            {
+                'id': comment.id,
+                'post_id': comment.post_id,
+                'board_id': comment.post.board_id,
+                'content': comment.content[:200],
+                'author': comment.author.username,
+            }
+            for comment in comments[:SEARCH_PAGE_SIZE]
+        ]
+    })
@@ -13,7 +13,17 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Django 앱 로딩 이후에 import (모델 접근)
+from collaboration.realtime import board_socket  # noqa: E402
+
+
+async def application(scope, receive, send):
+    """HTTP 요청은 Django로, WebSocket 연결은 보드 실시간 동기화로 전달"""
+    if scope['type'] == 'websocket':
+        return await board_socket(scope, receive, send)
+    return await django_application(scope, receive, send)
 
 
 
@@ -2,6 +2,7 @@
 Django settings for EduPlatform project.
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -35,6 +36,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'collaboration.instrumentation.RequestMetricsMiddleware',  # 요청별 성능 계측 (REQUEST_METRICS_ENABLED)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -69,11 +71,54 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# 기본은 SQLite. DATABASE_ENGINE=postgresql 이면 DATABASE_* 환경 변수의 접속 정보로 PostgreSQL 사용
+DATABASE_ENGINE = os.environ.get('DATABASE_ENGINE', 'sqlite')
+
+if DATABASE_ENGINE == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DATABASE_NAME', 'todolist'),
+            'USER': os.environ.get('DATABASE_USER', ''),
+            'PASSWORD': os.environ.get('DATABASE_PASSWORD', ''),
+            'HOST': os.environ.get('DATABASE_HOST', 'localhost'),
+            'PORT': os.environ.get('DATABASE_PORT', '5432'),
+            # 재사용하는 연결이 끊겼는지 요청 시작 시 확인
+            'CONN_HEALTH_CHECKS': True,
+            'CONN_MAX_AGE': int(os.environ.get('DATABASE_CONN_MAX_AGE', '60')),
+        }
+    }
+    # psycopg 3 연결 풀 (풀을 쓰면 Django의 영구 연결은 끔)
+    if os.environ.get('DATABASE_POOL', '').lower() in ('1', 'true', 'yes'):
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['OPTIONS'] = {
+            'pool': {
+                'min_size': int(os.environ.get('DATABASE_POOL_MIN_SIZE', '2')),
+                'max_size': int(os.environ.get('DATABASE_POOL_MAX_SIZE', '10')),
+                'timeout': 10,
+            },
+        }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+            'OPTIONS': {
+                # 트랜잭션 시작 시 쓰기 잠금을 잡아, 읽은 뒤 쓰는 트랜잭션이 잠금 승격 중
+                # 대기 없이 "database is locked" 로 실패하지 않도록 함
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
     }
+
+# SQLite 연결마다 적용할 PRAGMA (collaboration.database.configure_sqlite)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': 20000,
+    'mmap_size': 128 * 1024 * 1024,
+    'temp_store': 'memory',
+    'cache_size': -16000,
 }
 
 
@@ -114,6 +159,18 @@ USE_TZ = True
 STATIC_URL = 'static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
+# collectstatic 이 파일 내용 해시를 붙인 이름으로 수집 (collaboration.staticfiles)
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'collaboration.staticfiles.ManifestStaticStorage',
+    },
+}
+# 웹 서버가 정적 파일 캐시 헤더를 지정할 수 없을 때 Django가 직접 서빙 (해시 이름 파일은 1년 immutable)
+SERVE_STATIC = os.environ.get('SERVE_STATIC', '').lower() in ('1', 'true', 'yes')
+
 # Media files (User uploaded files)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
@@ -128,3 +185,74 @@ LOGIN_URL = '/accounts/login/'
 LOGIN_REDIRECT_URL = '/collaboration/'
 LOGOUT_REDIRECT_URL = '/'
 
+
+# 캐시 - 기본은 프로세스별 메모리 캐시. 여러 프로세스로 운영하면 CACHE_BACKEND/CACHE_LOCATION 환경 변수로
+# 공유 캐시(예: django.core.cache.backends.redis.RedisCache, redis://127.0.0.1:6379/1)를 지정
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    },
+}
+# 프로세스마다 따로인 캐시인지 여부 - 한 프로세스에서 지운 항목이 다른 프로세스에는 남음
+CACHE_IS_LOCAL = CACHES['default']['BACKEND'].endswith('LocMemCache')
+if CACHE_IS_LOCAL:
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': 5000}
+else:
+    # 세션 캐시는 같은 공유 캐시에 별도 별칭/키 접두사로 둠
+    CACHES['sessions'] = {**CACHES['default'], 'KEY_PREFIX': 'sessions'}
+
+# 보드 카드/게시판 목록 행 조각 캐시 (collaboration.fragments)
+# 버전을 올린 프로세스의 캐시만 무효화되므로 프로세스별 캐시에서는 기본으로 끔
+# (프로세스 하나로 운영하면 FRAGMENT_CACHE_ENABLED=1 로 켤 수 있음)
+FRAGMENT_CACHE_ENABLED = os.environ.get(
+    'FRAGMENT_CACHE_ENABLED', '' if CACHE_IS_LOCAL else '1'
+).lower() in ('1', 'true', 'yes')
+FRAGMENT_CACHE_ALIAS = 'default'
+FRAGMENT_CACHE_TIMEOUT = int(os.environ.get('FRAGMENT_CACHE_TIMEOUT', '3600'))
+
+# 세션 - 공유 캐시가 있으면 DB 앞에 캐시를 둔 write-through 세션 (accounts.sessions)
+# 프로세스별 캐시로는 한 워커의 로그아웃이 다른 워커 캐시에 남으므로 DB 세션을 그대로 사용
+# 바뀐 세션만 저장하고, 로그인하지 않은 게스트는 세션 없이 서명된 쿠키로만 식별
+if CACHE_IS_LOCAL:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+else:
+    SESSION_ENGINE = 'accounts.sessions'
+    SESSION_CACHE_ALIAS = 'sessions'
+# 세션을 캐시에 보관하는 최대 시간 (초)
+SESSION_CACHE_TIMEOUT = 300
+SESSION_SAVE_EVERY_REQUEST = False
+
+
+# 보드 실시간 동기화 pub/sub 백엔드 - WebSocket은 ASGI 서버(config.asgi)에서만 동작하며,
+# 기본 InProcessBroker 는 한 프로세스 안에서만 전달하므로 ASGI 프로세스를 하나로 운영하거나
+# 여러 프로세스일 때는 공유 pub/sub 구현으로 교체 (WSGI 배포에서는 브라우저가 변경 사항 API 폴링으로 전환)
+BOARD_SYNC_BACKEND = 'collaboration.realtime.InProcessBroker'
+
+# 백그라운드 작업(이미지 후처리) - 기본은 워커 없이 요청 처리(커밋) 직후 바로 실행
+# 워커를 상시 실행할 수 있으면 TASK_QUEUE_EAGER=0 으로 두고 `python manage.py runworker` 를 별도 프로세스로 실행
+# (파생본이 아직 없는 이미지는 원본으로 표시)
+TASK_QUEUE_EAGER = os.environ.get('TASK_QUEUE_EAGER', '1').lower() in ('1', 'true', 'yes')
+
+
+# 요청별 성능 계측 - 쿼리 수/SQL 시간/템플릿 시간을 Server-Timing 헤더와 로그로 남김
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', '').lower() in ('1', 'true', 'yes')
+# 같은 SQL이 이 횟수 이상 다른 매개변수로 실행되면 N+1로 표시
+REQUEST_METRICS_N_PLUS_ONE_THRESHOLD = 5
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'collaboration.instrumentation': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+}
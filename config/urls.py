@@ -1,8 +1,11 @@
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 from collaboration import views
+from collaboration.staticfiles import serve_static
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -12,6 +15,12 @@ urlpatterns = [
     path('', views.index, name='index'),
 ]
 
+# 수집된 정적 파일을 캐시 헤더와 함께 서빙 (웹 서버가 정적 파일을 맡지 않을 때)
+if settings.SERVE_STATIC:
+    urlpatterns += [
+        re_path(r'^%s(?P<path>.*)$' % re.escape(settings.STATIC_URL.lstrip('/')), serve_static),
+    ]
+
 # 개발 모드에서 미디어 파일 서빙
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
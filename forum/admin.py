@@ -4,10 +4,10 @@ from .models import Post, Comment
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ['title', 'author', 'is_notice', 'views', 'created_at']
+    list_display = ['title', 'author', 'is_notice', 'views', 'like_count', 'comment_count', 'created_at']
     list_filter = ['is_notice', 'created_at']
     search_fields = ['title', 'content', 'author__username']
-    readonly_fields = ['views', 'created_at', 'updated_at']
+    readonly_fields = ['views', 'like_count', 'comment_count', 'created_at', 'updated_at']
     ordering = ['-created_at']
 
 
@@ -1,6 +1,14 @@
 from django.apps import AppConfig
+from django.core.signals import request_finished
 
 
 class ForumConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'forum'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .counters import flush_if_due
+
+        # 모아 둔 조회수는 응답을 보낸 뒤 반영
+        request_finished.connect(flush_if_due)
@@ -0,0 +1,122 @@
+"""
+게시글 조회수 지연 반영(write-behind)
+
+상세 페이지를 볼 때마다 DB에 쓰지 않고 프로세스 메모리에 증가분을 모아 두었다가,
+일정 시간이 지나거나 일정 개수가 쌓이면 응답을 보낸 뒤(request_finished)
+`UPDATE ... SET views = views + n` 으로 한 번에 반영한다. 같은 방문자가 짧은 시간에
+다시 본 것은 캐시로 걸러 낸다. 프로세스가 비정상 종료되면 반영 전 증가분은 사라질 수 있다.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.db.models import F
+
+from accounts.guests import get_guest_token
+
+logger = logging.getLogger(__name__)
+
+
+def get_flush_interval():
+    """증가분을 DB에 반영하는 최소 간격(초)"""
+    return getattr(settings, 'FORUM_VIEW_FLUSH_INTERVAL', 10)
+
+
+def get_flush_size():
+    """이 개수 이상의 게시글에 증가분이 쌓이면 간격과 관계없이 반영"""
+    return getattr(settings, 'FORUM_VIEW_FLUSH_SIZE', 200)
+
+
+def get_dedup_seconds():
+    """같은 방문자의 조회를 한 번으로 세는 시간(초) - 0이면 중복 제거 안 함"""
+    return getattr(settings, 'FORUM_VIEW_DEDUP_SECONDS', 30 * 60)
+
+
+class ViewCountBuffer:
+    """게시글별 조회수 증가분 버퍼"""
+
+    def __init__(self):
+        self._pending = Counter()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def add(self, post_id, amount=1):
+        with self._lock:
+            self._pending[post_id] += amount
+
+    def pending(self, post_id):
+        """아직 DB에 반영되지 않은 증가분"""
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def due(self):
+        with self._lock:
+            if not self._pending:
+                return False
+            return (
+                len(self._pending) >= get_flush_size()
+                or time.monotonic() - self._last_flush >= get_flush_interval()
+            )
+
+    def flush(self):
+        """모인 증가분을 반영 - 증가량이 같은 게시글끼리 UPDATE 한 번으로 처리"""
+        from .models import Post
+
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+
+        post_ids_by_amount = defaultdict(list)
+        for post_id, amount in pending.items():
+            post_ids_by_amount[amount].append(post_id)
+        try:
+            for amount, post_ids in post_ids_by_amount.items():
+                Post.objects.filter(pk__in=post_ids).update(views=F('views') + amount)
+        except DatabaseError:
+            # DB가 잠겨 있거나 일시적으로 실패하면 다음 반영 때 다시 시도
+            logger.exception('조회수 반영 실패')
+            with self._lock:
+                self._pending.update(pending)
+            return 0
+        return len(pending)
+
+
+view_buffer = ViewCountBuffer()
+
+
+def _viewer_key(request):
+    """방문자 식별 키 - 세션 또는 게스트 식별자 (없으면 None)"""
+    if request.session.session_key:
+        return request.session.session_key
+    return get_guest_token(request)
+
+
+def record_view(request, post):
+    """조회 기록 - 같은 방문자의 반복 조회는 중복 제거 시간 동안 한 번만 셈 (같은 요청에서 다시 불러도 한 번)"""
+    recorded = request.__dict__.setdefault('forum_viewed_posts', set())
+    if post.pk in recorded:
+        return False
+    recorded.add(post.pk)
+    dedup_seconds = get_dedup_seconds()
+    viewer = _viewer_key(request)
+    if dedup_seconds and viewer:
+        if not cache.add(f'forum:viewed:{viewer}:{post.pk}', True, dedup_seconds):
+            return False
+    view_buffer.add(post.pk)
+    return True
+
+
+def flush_if_due(**kwargs):
+    """request_finished 수신 - 반영할 때가 되었으면 증가분 반영"""
+    if view_buffer.due():
+        view_buffer.flush()
+
+
+atexit.register(view_buffer.flush)
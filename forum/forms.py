@@ -40,6 +40,12 @@ class PostForm(forms.ModelForm):
             'file': '첨부 파일'
         }
 
+    def save(self, commit=True):
+        # 파일은 내용 해시 이름으로 저장되므로 다운로드용 원래 이름을 따로 기록
+        if 'file' in self.changed_data and self.cleaned_data.get('file'):
+            self.instance.file_name = self.cleaned_data['file'].name
+        return super().save(commit)
+
 
 class CommentForm(forms.ModelForm):
     """댓글 작성 폼"""
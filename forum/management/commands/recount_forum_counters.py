@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from forum.models import Post
+
+
+class Command(BaseCommand):
+    help = '게시글의 좋아요 수/댓글 수를 실제 데이터 기준으로 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        updated = Post.objects.all().recount()
+        self.stdout.write(self.style.SUCCESS(f'{updated}개 게시글의 카운터를 다시 계산했습니다.'))
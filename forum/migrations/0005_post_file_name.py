@@ -0,0 +1,41 @@
+# Generated by Django 5.2.8 on 2026-10-18 04:55
+
+import os
+
+import collaboration.storage
+from django.db import migrations, models
+
+
+def fill_file_names(apps, schema_editor):
+    """기존 첨부 파일의 원래 이름을 저장 경로에서 채움"""
+    Post = apps.get_model('forum', 'Post')
+    posts = Post.objects.exclude(file='').exclude(file__isnull=True)
+    for post in posts.iterator():
+        post.file_name = os.path.basename(post.file.name)
+        post.save(update_fields=['file_name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0004_post_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='file_name',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='첨부 파일 원래 이름'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='file',
+            field=models.FileField(blank=True, null=True, storage=collaboration.storage.ContentAddressedStorage(), upload_to='forum/files/%Y/%m/%d/', verbose_name='첨부 파일'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=collaboration.storage.ContentAddressedStorage(), upload_to='forum/images/%Y/%m/%d/', verbose_name='이미지'),
+        ),
+        migrations.RunPython(fill_file_names, migrations.RunPython.noop),
+    ]
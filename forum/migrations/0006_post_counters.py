@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-18 05:08
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_existing(apps, schema_editor):
+    """기존 게시글의 좋아요 수/댓글 수 채우기"""
+    Post = apps.get_model('forum', 'Post')
+    Comment = apps.get_model('forum', 'Comment')
+    likes = Post.likes.through.objects.filter(post_id=OuterRef('pk')).values('post_id').annotate(
+        total=Count('*')
+    ).values('total')
+    comments = Comment.objects.filter(post_id=OuterRef('pk')).values('post_id').annotate(
+        total=Count('*')
+    ).values('total')
+    Post.objects.update(
+        like_count=Coalesce(Subquery(likes), 0),
+        comment_count=Coalesce(Subquery(comments), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forum', '0005_post_file_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='댓글 수'),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='좋아요 수'),
+        ),
+        migrations.RunPython(count_existing, migrations.RunPython.noop),
+    ]
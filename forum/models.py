@@ -1,7 +1,26 @@
 from django.db import models
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.conf import settings
 from django.urls import reverse
 
+from collaboration.storage import media_storage
+
+
+class PostQuerySet(models.QuerySet):
+    def recount(self):
+        """좋아요 수/댓글 수를 실제 행 수로 다시 계산 (UPDATE 한 번)"""
+        likes = Post.likes.through.objects.filter(post_id=OuterRef('pk')).values('post_id').annotate(
+            total=Count('*')
+        ).values('total')
+        comments = Comment.objects.filter(post_id=OuterRef('pk')).values('post_id').annotate(
+            total=Count('*')
+        ).values('total')
+        return self.update(
+            like_count=Coalesce(Subquery(likes), 0),
+            comment_count=Coalesce(Subquery(comments), 0)
+        )
+
 
 class Post(models.Model):
     """게시판 포스트 모델"""
@@ -23,6 +42,8 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='작성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
     views = models.PositiveIntegerField(default=0, verbose_name='조회수')
+    like_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='좋아요 수')
+    comment_count = models.PositiveIntegerField(default=0, editable=False, verbose_name='댓글 수')
     is_notice = models.BooleanField(default=False, verbose_name='공지사항')
     category = models.CharField(
         max_length=20,
@@ -38,21 +59,42 @@ class Post(models.Model):
     )
     image = models.ImageField(
         upload_to='forum/images/%Y/%m/%d/',
+        storage=media_storage,
         blank=True,
         null=True,
         verbose_name='이미지'
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name='이미지 파생본'
+    )
     file = models.FileField(
         upload_to='forum/files/%Y/%m/%d/',
+        storage=media_storage,
         blank=True,
         null=True,
         verbose_name='첨부 파일'
     )
+    file_name = models.CharField(
+        max_length=255,
+        blank=True,
+        editable=False,
+        verbose_name='첨부 파일 원래 이름'
+    )
+    
+    objects = PostQuerySet.as_manager()
     
     class Meta:
         verbose_name = '게시글'
         verbose_name_plural = '게시글들'
         ordering = ['-is_notice', '-created_at']
+        indexes = [
+            # 목록 정렬(공지 먼저, 최신순)과 카테고리별 목록
+            models.Index(fields=['-is_notice', '-created_at'], name='forum_post_list_idx'),
+            models.Index(fields=['category', '-is_notice', '-created_at'], name='forum_post_category_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -61,13 +103,13 @@ class Post(models.Model):
         return reverse('forum:post_detail', kwargs={'pk': self.pk})
     
     def increase_views(self):
-        """조회수 증가"""
+        """조회수 즉시 증가 (상세 페이지는 forum.counters.record_view로 모아서 반영)"""
+        Post.objects.filter(pk=self.pk).update(views=F('views') + 1)
         self.views += 1
-        self.save(update_fields=['views'])
     
     def total_likes(self):
         """좋아요 수 반환"""
-        return self.likes.count()
+        return self.like_count
 
 
 class Comment(models.Model):
@@ -92,6 +134,9 @@ class Comment(models.Model):
         verbose_name = '댓글'
         verbose_name_plural = '댓글들'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['post', 'created_at'], name='forum_comment_post_idx'),
+        ]
     
     def __str__(self):
         return f'{self.author.username}의 댓글 - {self.content[:30]}'
@@ -0,0 +1,41 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from collaboration.fragments import bump_version
+from collaboration.storage import release_files, release_replaced_files, remember_previous_files
+
+from .models import Comment, Post
+
+
+POST_FILE_FIELDS = ('image', 'file')
+
+
+@receiver(pre_save, sender=Post)
+def remember_post_files(sender, instance, update_fields=None, **kwargs):
+    remember_previous_files(sender, instance, POST_FILE_FIELDS, update_fields)
+
+
+@receiver(post_save, sender=Post)
+def release_replaced_post_files(sender, instance, **kwargs):
+    """이미지/첨부 파일이 바뀌면 이전 파일의 참조 해제"""
+    release_replaced_files(instance)
+
+
+@receiver(post_delete, sender=Post)
+def release_post_files(sender, instance, **kwargs):
+    """게시글 삭제 시 파일과 이미지 파생본의 참조 해제"""
+    release_files(instance, POST_FILE_FIELDS, variants_field='image_variants')
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def bump_post_row_version(sender, instance, **kwargs):
+    """목록 행 조각 캐시 무효화 (제목/분류/공지 변경, 삭제)"""
+    bump_version('forum_post', instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_comment_post_row_version(sender, instance, **kwargs):
+    """댓글이 바뀌면 글의 목록 행 조각 캐시 무효화"""
+    bump_version('forum_post', instance.post_id)
@@ -0,0 +1,17 @@
+// 모바일 필터 드롭다운 자동 닫기 (Bootstrap dropdown은 기본적으로 자동으로 닫히지만, 확실하게 처리)
+document.addEventListener('DOMContentLoaded', function() {
+    const dropdownItems = document.querySelectorAll('.mobile-filter-menu .dropdown-item');
+
+    dropdownItems.forEach(function(item) {
+        item.addEventListener('click', function() {
+            // 드롭다운 인스턴스 가져오기
+            const dropdownElement = document.getElementById('mobileFilterDropdown');
+            if (dropdownElement) {
+                const bsDropdown = bootstrap.Dropdown.getInstance(dropdownElement);
+                if (bsDropdown) {
+                    bsDropdown.hide();
+                }
+            }
+        });
+    });
+});
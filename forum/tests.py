@@ -1,3 +1,362 @@
-from django.test import TestCase
+from io import StringIO
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from collaboration.search import fts5_available, search_ids
+from collaboration.testing import QueryBudgetMixin, query_plan, unindexed_queries
+from .counters import view_buffer
+from .models import Comment, Post
+from .views import COMMENT_PAGE_SIZE
+
+
+class PostSearchTests(TestCase):
+    """게시글 전문 검색 테스트"""
+
+    def setUp(self):
+        self.author = User.objects.create_user(username='writer', password='pw-12345')
+        self.other = User.objects.create_user(username='reader', password='pw-12345')
+
+    def _titles(self, response):
+        return [post.title for post in response.context['page_obj']]
+
+    def test_search_ranks_title_matches_first(self):
+        Post.objects.create(title='일상 이야기', content='오늘 협업 보드를 써봤어요', author=self.author)
+        Post.objects.create(title='협업 보드 사용 팁', content='단축키 정리', author=self.author)
+        Post.objects.create(title='무관한 글', content='내용 없음', author=self.author)
+
+        response = self.client.get(reverse('forum:post_list'), {'search': '보드'})
+        self.assertEqual(self._titles(response), ['협업 보드 사용 팁', '일상 이야기'])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        post = Post.objects.create(title='초안', content='내용', author=self.author)
+        Post.objects.filter(pk=post.pk).update(title='완성본')
+        self.assertEqual(search_ids('forum_post_fts', '완성본'), [post.pk])
+        self.assertEqual(search_ids('forum_post_fts', '초안'), [])
+
+        Post.objects.filter(pk=post.pk).delete()
+        self.assertEqual(search_ids('forum_post_fts', '완성본'), [])
+
+    def test_search_by_author_username(self):
+        Post.objects.create(title='첫 글', content='안녕하세요', author=self.author)
+        Post.objects.create(title='다른 글', content='반가워요', author=self.other)
+        # 아이디 일부로도 검색
+        for query in ('writer', 'rite'):
+            response = self.client.get(reverse('forum:post_list'), {'search': query})
+            self.assertEqual(self._titles(response), ['첫 글'], query)
+
+    def test_search_pages_past_ranked_results(self):
+        for index in range(7):
+            Post.objects.create(title=f'공지 {index}', content='내용', author=self.author)
+        # 순위를 상위 2개만 매겨도 나머지 일치 글이 다음 페이지에 빠짐없이 표시
+        with mock.patch('forum.views.search_ids', lambda table, text: search_ids(table, text, limit=2)):
+            titles = [
+                title
+                for page in (1, 2)
+                for title in self._titles(self.client.get(reverse('forum:post_list'), {'search': '공지', 'page': page}))
+            ]
+        self.assertEqual(sorted(titles), [f'공지 {index}' for index in range(7)])
+
+    def test_search_uses_index(self):
+        if not fts5_available():
+            self.skipTest('FTS5를 지원하지 않는 데이터베이스')
+        # 실행 계획과 쿼리 수는 행 수와 무관하므로 적은 데이터로 확인 (대량 데이터 측정은 benchmark 명령)
+        Post.objects.bulk_create(
+            Post(title=f'게시글 {index}', content=f'일반 내용 {index}', author=self.author) for index in range(300)
+        )
+        Post.objects.create(title='희귀한 주제', content='찾기 어려운 글', author=self.author)
+
+        self.assertEqual(len(search_ids('forum_post_fts', '희귀한')), 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('forum:post_list'), {'search': '희귀한'})
+        self.assertEqual(self._titles(response), ['희귀한 주제'])
+        # 색인 검색 + 개수 + 목록 - 게시글은 색인/기본 키/작성자 인덱스로만 찾고 전체 스캔하지 않음
+        self.assertLessEqual(len(queries), 5)
+        plans = [
+            step for query in queries.captured_queries if query['sql'].startswith('SELECT')
+            for step in query_plan(query['sql'])
+        ]
+        self.assertTrue(any(step.startswith('SCAN forum_post_fts VIRTUAL TABLE') for step in plans))
+        self.assertNotIn('SCAN forum_post', plans)
+
+
+class PostCounterTests(TestCase):
+    """좋아요 수/댓글 수 카운터 테스트"""
+
+    def setUp(self):
+        self.author = User.objects.create_user(username='writer', password='pw-12345')
+        self.reader = User.objects.create_user(username='reader', password='pw-12345')
+        self.post = Post.objects.create(title='글', content='내용', author=self.author)
+        self.client.force_login(self.reader)
+
+    def test_like_toggle_updates_counter(self):
+        url = reverse('forum:post_like', args=[self.post.pk])
+        self.assertEqual(self.client.post(url).json()['total_likes'], 1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.like_count, 1)
+
+        data = self.client.post(url).json()
+        self.assertEqual((data['is_liked'], data['total_likes']), (False, 0))
+
+    def test_comment_create_and_delete_update_counter(self):
+        self.client.post(reverse('forum:post_detail', args=[self.post.pk]), {'content': '댓글'})
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+
+        self.client.post(reverse('forum:comment_delete', args=[Comment.objects.get().pk]))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 0)
+
+    def test_decrements_stop_at_zero_when_counters_drifted(self):
+        self.client.post(reverse('forum:post_like', args=[self.post.pk]))
+        self.client.post(reverse('forum:post_detail', args=[self.post.pk]), {'content': '댓글'})
+        Post.objects.filter(pk=self.post.pk).update(like_count=0, comment_count=0)
+
+        data = self.client.post(reverse('forum:post_like', args=[self.post.pk])).json()
+        self.assertEqual((data['is_liked'], data['total_likes']), (False, 0))
+        response = self.client.post(reverse('forum:comment_delete', args=[Comment.objects.get().pk]))
+        self.assertEqual(response.status_code, 302)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.comment_count), (0, 0))
+
+    def test_list_query_count_does_not_grow_with_posts(self):
+        for index in range(4):
+            Post.objects.create(title=f'글 {index}', content='내용', author=self.reader)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(reverse('forum:post_list'))
+        for index in range(6):
+            Post.objects.create(title=f'추가 {index}', content='내용', author=User.objects.create_user(f'u{index}'))
+        with CaptureQueriesContext(connection) as many:
+            self.client.get(reverse('forum:post_list'))
+        self.assertEqual(len(few), len(many))
+
+    @override_settings(FRAGMENT_CACHE_ENABLED=True)
+    def test_list_rows_follow_counters_and_edits(self):
+        caches['default'].clear()
+        url = reverse('forum:post_list')
+        self.client.get(url)
+
+        # 목록 행은 조각 캐시 - 시그널 없이 바뀐 제목은 반영되지 않음
+        Post.objects.filter(pk=self.post.pk).update(title='몰래 바꾼 제목')
+        self.assertNotContains(self.client.get(url), '몰래 바꾼 제목')
+
+        # 카운터는 캐시 키에 포함되어 바로 반영
+        self.client.post(reverse('forum:post_like', args=[self.post.pk]))
+        response = self.client.get(url)
+        self.assertContains(response, '몰래 바꾼 제목')
+        self.assertContains(response, '<span>1</span>', html=True)
+
+        self.post.refresh_from_db()
+        self.post.title = '수정한 제목'
+        self.post.save()
+        self.assertContains(self.client.get(url), '수정한 제목')
+
+    def test_recount_command_fixes_drift(self):
+        self.post.likes.add(self.reader)
+        Comment.objects.create(post=self.post, author=self.reader, content='댓글')
+        Post.objects.filter(pk=self.post.pk).update(like_count=7, comment_count=9)
+
+        call_command('recount_forum_counters', stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.like_count, self.post.comment_count), (1, 1))
+
+
+class ConditionalGetTests(TestCase):
+    """게시판 목록/상세 조건부 GET 테스트"""
+
+    def setUp(self):
+        self.author = User.objects.create_user(username='writer', password='pw-12345')
+        self.post = Post.objects.create(title='글', content='내용', author=self.author)
+        self.client.force_login(self.author)
+
+    def test_post_list_revalidates_until_counters_change(self):
+        url = reverse('forum:post_list')
+        etag = self.client.get(url)['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual([template.name for template in response.templates], [])
+
+        self.client.post(reverse('forum:post_like', args=[self.post.pk]))
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_empty_list_page_is_queried_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('forum:post_list'), {'category': 'tip'})
+        self.assertEqual(len(response.context['page_obj']), 0)
+        counts = [query for query in queries.captured_queries if 'COUNT(*)' in query['sql']]
+        self.assertEqual(len(counts), 1)
+
+    def test_post_detail_revalidates_until_comment(self):
+        url = reverse('forum:post_detail', args=[self.post.pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.client.post(url, {'content': '댓글'})
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    @override_settings(FORUM_VIEW_FLUSH_INTERVAL=3600, FORUM_VIEW_DEDUP_SECONDS=0)
+    def test_not_modified_detail_still_counts_view(self):
+        view_buffer.flush()
+        self.client.force_login(User.objects.create_user(username='reader'))
+        url = reverse('forum:post_detail', args=[self.post.pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(view_buffer.pending(self.post.pk), 1)
+
+        # 조회수가 바뀌었으므로 다시 그리지만, 조회 기록은 요청당 한 번
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+        self.assertEqual(view_buffer.pending(self.post.pk), 2)
+        view_buffer.flush()
+
+    @override_settings(FORUM_VIEW_FLUSH_INTERVAL=3600, FORUM_VIEW_DEDUP_SECONDS=3600)
+    def test_detail_etag_survives_view_flush(self):
+        view_buffer.flush()
+        caches['default'].clear()
+        self.client.force_login(User.objects.create_user(username='reader'))
+        url = reverse('forum:post_detail', args=[self.post.pk])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(view_buffer.pending(self.post.pk), 1)
+
+        # 대기분이 DB로 옮겨가도 보이는 조회수는 그대로이므로 304
+        view_buffer.flush()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+@override_settings(FORUM_VIEW_FLUSH_INTERVAL=3600)
+class ViewCounterTests(TestCase):
+    """조회수 지연 반영 테스트"""
+
+    def setUp(self):
+        view_buffer.flush()
+        self.author = User.objects.create_user(username='writer', password='pw-12345')
+        self.reader = User.objects.create_user(username='reader', password='pw-12345')
+        self.post = Post.objects.create(title='글', content='내용', author=self.author)
+        self.client.force_login(self.reader)
+
+    def test_detail_view_does_not_write_views(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('forum:post_detail', args=[self.post.pk]))
+        self.assertEqual(response.context['post'].views, 1)
+        self.assertFalse(any(query['sql'].startswith('UPDATE "forum_post"') for query in queries))
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 0)
+
+        view_buffer.flush()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.views, 1)
+
+    def test_repeated_views_in_same_session_count_once(self):
+        for _ in range(3):
+            self.client.get(reverse('forum:post_detail', args=[self.post.pk]))
+        self.assertEqual(view_buffer.pending(self.post.pk), 1)
+
+    def test_flush_batches_updates_by_amount(self):
+        others = [Post.objects.create(title=f'글 {index}', content='내용', author=self.author) for index in range(3)]
+        for post in others:
+            view_buffer.add(post.pk, 2)
+        view_buffer.add(self.post.pk, 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(view_buffer.flush(), 4)
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(
+            sorted(Post.objects.values_list('views', flat=True)), [2, 2, 2, 5]
+        )
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite 실행 계획 검사')
+class PostQueryPlanTests(TestCase):
+    """게시판 목록/상세 쿼리가 인덱스를 사용하는지 (전체 스캔/임시 B-트리 정렬 없음) 확인"""
+
+    def setUp(self):
+        self.author = User.objects.create_user(username='writer', password='pw-12345')
+        Post.objects.bulk_create([
+            Post(title=f'글 {i}', content='내용', author=self.author, category='question' if i % 2 else 'general',
+                 is_notice=i == 0)
+            for i in range(12)
+        ])
+        self.post = Post.objects.first()
+        Comment.objects.create(post=self.post, author=self.author, content='댓글')
+
+    def assertIndexedQueries(self, url, data=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(unindexed_queries(queries.captured_queries), [])
+
+    def test_post_list(self):
+        self.assertIndexedQueries(reverse('forum:post_list'), {'page': 2})
+
+    def test_post_list_by_category(self):
+        self.assertIndexedQueries(reverse('forum:post_list'), {'category': 'question'})
+
+    def test_post_detail(self):
+        self.assertIndexedQueries(reverse('forum:post_detail', args=[self.post.pk]))
+
+
+# 조회수 반영 주기가 측정 중인 요청에 걸리지 않도록 (반영은 request_finished 에서 실행)
+@override_settings(FORUM_VIEW_FLUSH_INTERVAL=3600)
+class PostQueryBudgetTests(QueryBudgetMixin, TestCase):
+    """게시판 화면별 쿼리 예산 - 글/댓글 작성자가 많아도 쿼리 수가 그대로인지 확인"""
+
+    def setUp(self):
+        view_buffer.flush()
+        authors = [User.objects.create_user(username=f'author{i}', password='pw-12345') for i in range(6)]
+        self.client.force_login(authors[0])
+        posts = Post.objects.bulk_create([
+            Post(title=f'글 {i}', content='내용', author=author) for i, author in enumerate(authors)
+        ])
+        self.post = posts[0]
+        Comment.objects.bulk_create([Comment(post=self.post, author=author, content='댓글') for author in authors])
+
+    # 예산은 세션 조회 포함 (공유 캐시가 없으면 DB 세션)
+    def test_post_list(self):
+        self.assertQueryBudget(reverse('forum:post_list'), 5)
+
+    def test_post_detail(self):
+        self.assertQueryBudget(reverse('forum:post_detail', args=[self.post.pk]), 7)
+
+
+@override_settings(FORUM_VIEW_FLUSH_INTERVAL=3600)
+class CommentPaginationTests(QueryBudgetMixin, TestCase):
+    """게시글 댓글 커서 페이지네이션 테스트"""
+
+    def setUp(self):
+        view_buffer.flush()
+        authors = [User.objects.create_user(username=f'author{i}', password='pw-12345') for i in range(8)]
+        self.client.force_login(authors[0])
+        self.post = Post.objects.create(title='인기 글', content='내용', author=authors[0])
+        Comment.objects.bulk_create([
+            Comment(post=self.post, author=authors[i % len(authors)], content=f'댓글 {i}')
+            for i in range(COMMENT_PAGE_SIZE * 2 + 7)
+        ])
+
+    def test_detail_renders_first_page_in_constant_queries(self):
+        response = self.assertQueryBudget(reverse('forum:post_detail', args=[self.post.pk]), 7)
+        self.assertEqual(len(response.context['comments']), COMMENT_PAGE_SIZE)
+        self.assertEqual(response.context['comments'][0].content, '댓글 0')
+        self.assertContains(response, 'comments-more-btn')
+
+    def test_load_more_walks_all_comments_once(self):
+        response = self.client.get(reverse('forum:post_detail', args=[self.post.pk]))
+        seen = len(response.context['comments'])
+        cursor = response.context['next_cursor']
+        while cursor:
+            with CaptureQueriesContext(connection) as queries:
+                data = self.client.get(reverse('forum:comment_list', args=[self.post.pk]), {'cursor': cursor}).json()
+            self.assertTrue(data['success'])
+            self.assertLessEqual(len(queries), 4)
+            seen += data['count']
+            cursor = data['next_cursor']
+        self.assertEqual(seen, Comment.objects.count())
+        self.assertIn(f'댓글 {COMMENT_PAGE_SIZE * 2 + 6}', data['html'])
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(reverse('forum:comment_list', args=[self.post.pk]), {'cursor': 'broken'})
+        self.assertEqual(response.status_code, 400)
@@ -10,6 +10,7 @@ urlpatterns = [
     path('post/<int:pk>/update/', views.post_update, name='post_update'),
     path('post/<int:pk>/delete/', views.post_delete, name='post_delete'),
     path('post/<int:pk>/like/', views.post_like, name='post_like'),
+    path('post/<int:pk>/comments/', views.comment_list, name='comment_list'),
     path('comment/<int:pk>/delete/', views.comment_delete, name='comment_delete'),
 ]
 
@@ -1,56 +1,131 @@
 from django.shortcuts import render, get_object_or_404, redirect
+from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Greatest
 from django.http import JsonResponse
+from django.template.loader import render_to_string
 from django.views.decorators.http import require_POST
+from collaboration.conditional import conditional_page
+from collaboration.fragments import attach_versions
+from collaboration.pagination import keyset_page
+from collaboration.search import match_ids_query, order_by_ids, search_ids
+from collaboration.tasks import enqueue_image_processing
+from .counters import record_view, view_buffer
 from .models import Post, Comment
 from .forms import PostForm, CommentForm
 
 
-def post_list(request):
-    """게시글 목록"""
+# 게시글 상세의 댓글 한 페이지 크기
+COMMENT_PAGE_SIZE = 50
+
+
+def _post_list_page(request):
+    """검색어/분류 조건에 맞는 게시글 목록의 요청한 페이지"""
     search_query = request.GET.get('search', '')
     category_filter = request.GET.get('category', '')
-    posts = Post.objects.all()
+    posts = Post.objects.select_related('author')
     
     # 카테고리 필터링
     if category_filter:
         posts = posts.filter(category=category_filter)
     
-    # 검색 기능
+    # 검색 기능 - 제목/내용은 전문 검색 색인 순위대로(상위 SEARCH_RESULT_LIMIT 개), 순위 밖의 일치 글과
+    # 작성자 아이디에 검색어가 포함된 글은 그 뒤에 최신순으로 표시 (결과를 자르지 않고 DB에서 페이지 단위로 조회)
     if search_query:
-        posts = posts.filter(
-            Q(title__icontains=search_query) |
-            Q(content__icontains=search_query) |
-            Q(author__username__icontains=search_query)
-        )
+        ids = search_ids('forum_post_fts', search_query)
+        if ids is None:
+            posts = posts.filter(
+                Q(title__icontains=search_query) |
+                Q(content__icontains=search_query) |
+                Q(author__username__icontains=search_query)
+            )
+        else:
+            authors = get_user_model().objects.filter(username__icontains=search_query).values('pk')
+            posts = order_by_ids(posts.filter(
+                Q(pk__in=match_ids_query('forum_post_fts', search_query)) | Q(author__in=authors)
+            ), ids)
     
     # 페이지네이션
     paginator = Paginator(posts, 5)  # 페이지당 5개
     page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    return paginator.get_page(page_number)
+
+
+def _post_list_validators(request):
+    """
+    목록 검증값 - 전체 개수와 페이지 게시글의 수정 시각/조회수/좋아요/댓글 수
+
+    페이지 조회 결과를 요청에 담아 두어 200 응답일 때 뷰가 다시 조회하지 않는다.
+    """
+    page_obj = request.forum_page = _post_list_page(request)
+    posts = list(page_obj)
+    last_modified = max((post.updated_at for post in posts), default=None)
+    return last_modified, (page_obj.paginator.count, page_obj.number, *(
+        (post.pk, post.updated_at, post.views, post.like_count, post.comment_count) for post in posts
+    ))
+
+
+@conditional_page(_post_list_validators)
+def post_list(request):
+    """게시글 목록"""
+    # 빈 페이지도 다시 조회하지 않도록 None 으로 확인
+    page_obj = getattr(request, 'forum_page', None)
+    if page_obj is None:
+        page_obj = _post_list_page(request)
+    # 목록 행 조각 캐시 버전
+    page_obj.object_list = attach_versions('forum_post', page_obj)
     
     context = {
         'page_obj': page_obj,
-        'search_query': search_query,
-        'category_filter': category_filter,
+        'search_query': request.GET.get('search', ''),
+        'category_filter': request.GET.get('category', ''),
         'category_choices': Post.CATEGORY_CHOICES,
     }
     return render(request, 'forum/post_list.html', context)
 
 
+def _post_detail_validators(request, pk):
+    """
+    상세 검증값 - 게시글 수정 시각/카운터와 댓글의 마지막 수정 시각/개수 (쿼리 한 번)
+
+    304 응답이면 뷰가 실행되지 않으므로 조회 기록은 여기서 먼저 한다.
+    """
+    # GROUP BY 없이 상관 서브쿼리로 집계해 게시글 한 행만 읽음
+    post_comments = Comment.objects.filter(post=OuterRef('pk')).order_by().values('post')
+    row = Post.objects.filter(pk=pk).annotate(
+        last_comment=Subquery(post_comments.annotate(last=Max('updated_at')).values('last')),
+        comment_total=Subquery(post_comments.annotate(total=Count('*')).values('total')),
+    ).values_list('author_id', 'updated_at', 'views', 'like_count', 'last_comment', 'comment_total').first()
+    if row is None:
+        return None
+    author_id, updated_at, views, like_count, last_comment, comment_total = row
+    if request.user.pk != author_id:
+        record_view(request, Post(pk=pk))
+    # 반영된 값과 대기분을 따로 넣지 않고 화면에 보이는 조회수 합계만 넣음 (대기분이 반영돼도 같은 페이지면 같은 ETag)
+    views += view_buffer.pending(pk)
+    return max(filter(None, (updated_at, last_comment))), (
+        author_id, updated_at, views, like_count, last_comment, comment_total
+    )
+
+
+@conditional_page(_post_detail_validators)
 def post_detail(request, pk):
     """게시글 상세보기"""
     post = get_object_or_404(Post, pk=pk)
     
-    # 조회수 증가 (작성자는 제외)
+    # 조회수 증가 (작성자는 제외) - 바로 쓰지 않고 모아서 반영
     if request.user != post.author:
-        post.increase_views()
+        record_view(request, post)
+    post.views += view_buffer.pending(post.pk)
     
-    # 댓글 목록
-    comments = post.comments.all()
+    # 댓글 첫 페이지 (작성자는 조인으로 함께 조회, 나머지는 comment_list 로 이어서 불러옴)
+    comments, next_cursor = keyset_page(
+        post.comments.select_related('author'), None, COMMENT_PAGE_SIZE, descending=False
+    )
     
     # 좋아요 여부 확인
     is_liked = False
@@ -64,7 +139,9 @@ def post_detail(request, pk):
             comment = comment_form.save(commit=False)
             comment.post = post
             comment.author = request.user
-            comment.save()
+            with transaction.atomic():
+                comment.save()
+                Post.objects.filter(pk=post.pk).update(comment_count=F('comment_count') + 1)
             messages.success(request, '댓글이 작성되었습니다.')
             return redirect('forum:post_detail', pk=post.pk)
     else:
@@ -73,12 +150,32 @@ def post_detail(request, pk):
     context = {
         'post': post,
         'comments': comments,
+        'next_cursor': next_cursor,
         'comment_form': comment_form,
         'is_liked': is_liked,
     }
     return render(request, 'forum/post_detail.html', context)
 
 
+def comment_list(request, pk):
+    """댓글 더 보기 - 커서 다음 페이지의 댓글 HTML을 JSON으로 반환"""
+    post = get_object_or_404(Post.objects.only('id'), pk=pk)
+    try:
+        comments, next_cursor = keyset_page(
+            post.comments.select_related('author'), request.GET.get('cursor'), COMMENT_PAGE_SIZE, descending=False
+        )
+    except ValueError as e:
+        return JsonResponse({'success': False, 'message': str(e)}, status=400)
+    
+    html = render_to_string('forum/comment_items.html', {'comments': comments}, request=request)
+    return JsonResponse({
+        'success': True,
+        'html': html,
+        'next_cursor': next_cursor,
+        'count': len(comments),
+    })
+
+
 @login_required
 def post_create(request):
     """게시글 작성"""
@@ -91,6 +188,7 @@ def post_create(request):
             if not request.user.is_superuser:
                 post.is_notice = False
             post.save()
+            enqueue_image_processing(post)
             messages.success(request, '게시글이 작성되었습니다.')
             return redirect('forum:post_detail', pk=post.pk)
     else:
@@ -120,6 +218,7 @@ def post_update(request, pk):
             if not request.user.is_superuser:
                 post.is_notice = False
             post.save()
+            enqueue_image_processing(post)
             messages.success(request, '게시글이 수정되었습니다.')
             return redirect('forum:post_detail', pk=post.pk)
     else:
@@ -161,10 +260,13 @@ def comment_delete(request, pk):
     # 작성자 또는 관리자만 삭제 가능
     if comment.author != request.user and not request.user.is_superuser:
         messages.error(request, '삭제 권한이 없습니다.')
-        return redirect('forum:post_detail', pk=comment.post.pk)
+        return redirect('forum:post_detail', pk=comment.post_id)
     
-    post_pk = comment.post.pk
-    comment.delete()
+    post_pk = comment.post_id
+    with transaction.atomic():
+        comment.delete()
+        # 카운터가 어긋나 0이어도 음수(양의 정수 필드 오류)가 되지 않도록
+        Post.objects.filter(pk=post_pk).update(comment_count=Greatest(F('comment_count') - 1, 0))
     messages.success(request, '댓글이 삭제되었습니다.')
     return redirect('forum:post_detail', pk=post_pk)
 
@@ -173,19 +275,28 @@ def comment_delete(request, pk):
 @require_POST
 def post_like(request, pk):
     """게시글 좋아요/좋아요 취소"""
-    post = get_object_or_404(Post, pk=pk)
+    post = get_object_or_404(Post.objects.only('id'), pk=pk)
+    Like = Post.likes.through
     
-    if post.likes.filter(pk=request.user.pk).exists():
-        # 이미 좋아요를 눌렀으면 취소
-        post.likes.remove(request.user)
-        is_liked = False
-    else:
-        # 좋아요 추가
-        post.likes.add(request.user)
-        is_liked = True
+    with transaction.atomic():
+        if Like.objects.filter(post_id=post.pk, user_id=request.user.pk).delete()[0]:
+            # 이미 좋아요를 눌렀으면 취소
+            Post.objects.filter(pk=post.pk).update(like_count=Greatest(F('like_count') - 1, 0))
+            is_liked = False
+        else:
+            # 좋아요 추가 (동시에 두 번 눌러도 unique 제약으로 한 번만 반영)
+            try:
+                with transaction.atomic():
+                    Like.objects.create(post_id=post.pk, user_id=request.user.pk)
+            except IntegrityError:
+                pass
+            else:
+                Post.objects.filter(pk=post.pk).update(like_count=F('like_count') + 1)
+            is_liked = True
+        like_count = Post.objects.values_list('like_count', flat=True).get(pk=post.pk)
     
     return JsonResponse({
         'success': True,
         'is_liked': is_liked,
-        'total_likes': post.total_likes()
+        'total_likes': like_count
     })